@@ -1,13 +1,7 @@
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-
 from greenlight.db import pg_pool
-from greenlight.enums import fetch_enum_values
-from greenlight.hardware.interfaces import hardware_manager
 from greenlight.cable_config import (
     series_for_prefix, prefix_for_series, series_data_for_prefix,
-    pattern_for_code, all_prefixes, all_patterns,
+    all_prefixes, all_patterns,
 )
 
 
@@ -182,6 +176,47 @@ def resolve_catalog_variant(series, color_pattern, length, connector_type):
     }
 
 
+def get_catalog_matrix(series, color_pattern):
+    """Resolve every (length, connector) combination for a series + pattern.
+
+    Returns {length: {connector_display: resolved}} where `length` is the
+    string LengthSelectionScreen shows (same values and order as
+    get_distinct_lengths) and `resolved` is the dict resolve_catalog_variant
+    would return for that pick. Built once when the operator reaches the
+    length step so neither the length nor the connector screen has to
+    re-resolve the pattern/connector codes. Empty dict if the series or
+    pattern is unknown.
+    """
+    prefix = prefix_for_series(series)
+    if prefix is None:
+        return {}
+    series_data = series_data_for_prefix(prefix)
+    if not series_data:
+        return {}
+    pattern_code = _pattern_code_for_name(
+        color_pattern, fabric_type=series_data.get('braid_material'))
+    if pattern_code is None:
+        return {}
+
+    connectors = [c for c in series_data.get('connectors', []) if c.get('display')]
+    matrix = {}
+    for length in get_distinct_lengths(series, color_pattern):
+        try:
+            length_num = float(length)
+        except (TypeError, ValueError):
+            continue
+        matrix[length] = {
+            c['display']: {
+                'sku_group': pattern_code,
+                'prefix': prefix,
+                'length': length_num,
+                'connector_code': c.get('code') or '',
+            }
+            for c in connectors
+        }
+    return matrix
+
+
 class CableType:
     """Represents a sku_group + the series prefix it's being registered under.
 
@@ -203,6 +238,7 @@ class CableType:
         self.core_cable = None
         self.braid_material = None
         self.description = None
+        self._name = None  # memoized name(); reset by load()
 
         if sku_group:
             self.load(sku_group, prefix=prefix)
@@ -213,6 +249,11 @@ class CableType:
         return "<CableType (not loaded)>"
 
     def name(self):
+        if self._name is None:
+            self._name = self._build_name()
+        return self._name
+
+    def _build_name(self):
         if self.kind == 'catalog' and self.pattern_name:
             base = self.pattern_name
             return f"{self.series} {base}" if self.series else base
@@ -245,6 +286,7 @@ class CableType:
                 if not row:
                     raise ValueError(f"sku_group {sku_group} not found.")
 
+                self._name = None
                 self.sku_group = row[0]
                 self.description = row[1]
                 self.archived_at = row[2]
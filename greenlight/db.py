@@ -1,5 +1,8 @@
+import copy
+import functools
 import logging
 import re
+import time
 
 import psycopg2
 from psycopg2 import pool
@@ -14,6 +17,57 @@ pg_pool = psycopg2.pool.SimpleConnectionPool(
     **DB_CONFIG
 )
 
+# Cable-state reads (inventory summaries, a customer's cables) are repeated
+# as the operator moves between screens and scans. Hold each result briefly,
+# and drop them all as soon as a cable changes so no screen lags a write.
+CABLE_QUERY_TTL = 5.0
+_cable_query_cache = {}
+
+
+def _cable_query_cached(fallback):
+    """Memoize a cable-state query per argument set for CABLE_QUERY_TTL seconds.
+
+    The wrapped query raises on a database error; the wrapper then returns
+    fallback() without caching it, so one transient failure isn't served
+    as "no cables" until the TTL runs out. Callers get their own deep copy
+    of the result, never the cached object itself.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = _cable_query_cache.get(key)
+            if hit is not None and hit[0] > now:
+                return copy.deepcopy(hit[1])
+            try:
+                value = func(*args, **kwargs)
+            except Exception:
+                return fallback()
+            _cable_query_cache[key] = (now + CABLE_QUERY_TTL, value)
+            return copy.deepcopy(value)
+        wrapper.cache_clear = invalidate_cable_queries
+        return wrapper
+    return decorator
+
+
+def invalidate_cable_queries():
+    """Drop cached cable-state reads after cables are added, edited, tested, or assigned."""
+    _cable_query_cache.clear()
+
+
+def _invalidate_misc_variants(sku_group):
+    """Drop cached picker rows for the series a MISC sku_group belongs to.
+
+    Called whenever a MISC group is created, renamed, or gains a cable, so
+    this station's picker never shows stale counts; writes from other
+    stations show up once CABLE_QUERY_TTL runs out.
+    """
+    if sku_group and '-MISC-' in sku_group:
+        series_prefix = sku_group.split('-MISC-', 1)[0]
+        _cable_query_cache.pop(("search_misc_variants", (series_prefix,), ()), None)
+
+
 def insert_test_result(serial, resistance_adc, operator=None, source_node=None):
     conn = pg_pool.getconn()
     try:
@@ -88,6 +142,7 @@ def validate_serial_number(serial_number):
     return True, None
 
 
+@functools.lru_cache(maxsize=4096)
 def format_serial_number(serial_number):
     """
     Format serial number by padding numeric portion to 6 digits.
@@ -177,6 +232,9 @@ def register_scanned_cable(serial_number, sku_group, prefix, length, connector_c
                           operator, formatted_serial))
                     result = cur.fetchone()
                     conn.commit()
+                    invalidate_cable_queries()
+                    _invalidate_misc_variants(existing[1])
+                    _invalidate_misc_variants(sku_group)
                     return {
                         'serial_number': result[0],
                         'timestamp': result[1],
@@ -198,6 +256,8 @@ def register_scanned_cable(serial_number, sku_group, prefix, length, connector_c
                       connector_finish, None, operator, None, 'Scanned intake'))
                 result = cur.fetchone()
                 conn.commit()
+                invalidate_cable_queries()
+                _invalidate_misc_variants(sku_group)
                 return {
                     'serial_number': result[0],
                     'timestamp': result[1],
@@ -254,6 +314,7 @@ def update_cable_test_results(serial_number, test_passed, resistance_adc=None, c
                 ))
                 result = cur.fetchone()
                 conn.commit()
+                invalidate_cable_queries()
                 return result[0] if result else None
     except Exception as e:
         logger.error("Error updating cable test results: %s", e)
@@ -396,6 +457,8 @@ def update_cable_description(serial_number, description):
                 """, (description, row[0]))
                 result = cur.fetchone()
                 conn.commit()
+                invalidate_cable_queries()
+                _invalidate_misc_variants(row[0])
                 return result is not None
     except Exception as e:
         logger.error("Error updating cable description: %s", e)
@@ -471,6 +534,7 @@ def get_or_create_misc_sku(series_prefix, description, length):
                     VALUES (%s, %s)
                 """, (new_sku, description))
                 conn.commit()
+                _invalidate_misc_variants(new_sku)
                 return new_sku
     except Exception as e:
         logger.error("Error in get_or_create_misc_sku: %s", e)
@@ -480,6 +544,7 @@ def get_or_create_misc_sku(series_prefix, description, length):
         pg_pool.putconn(conn)
 
 
+@_cable_query_cached(list)
 def search_misc_variants(series_prefix):
     """Return recent MISC groups for a series prefix (for picker UI).
 
@@ -491,6 +556,10 @@ def search_misc_variants(series_prefix):
     Args:
         series_prefix: e.g. "SC", "TC"
 
+    Results are cached per prefix for CABLE_QUERY_TTL seconds, and dropped
+    early when a MISC group for that series is created, renamed, or has a
+    cable registered against it here.
+
     Returns:
         List of dicts with sku, description, length, cable_count
     """
@@ -508,7 +577,7 @@ def search_misc_variants(series_prefix):
                 LIMIT 20
             """, (f"{series_prefix}-MISC-%",))
             rows = cur.fetchall()
-            return [
+            variants = [
                 {
                     'sku': r[0],
                     'description': r[1],
@@ -517,9 +586,10 @@ def search_misc_variants(series_prefix):
                 }
                 for r in rows
             ]
+            return variants
     except Exception as e:
         logger.error("Error searching MISC groups: %s", e)
-        return []
+        raise
     finally:
         pg_pool.putconn(conn)
 
@@ -708,16 +778,43 @@ def get_available_count_for_sku(sku):
         pg_pool.putconn(conn)
 
 
-def assign_cable_to_customer(serial_number, customer_shopify_gid):
-    """Assign a cable to a customer by updating the shopify_gid field"""
-    conn = pg_pool.getconn()
+def assign_cable_to_customer(serial_number, customer_shopify_gid, conn=None):
+    """Assign a cable to a customer by updating the shopify_gid field
+
+    The UPDATE only matches unassigned cables, so the common case is a single
+    statement; the cable is looked up again only to explain a miss.
+
+    Pass `conn` to run on a connection the caller already holds (e.g. for a
+    whole scan session); otherwise one is borrowed from the pool.
+    """
+    own_conn = conn is None or conn.closed
+    if own_conn:
+        conn = pg_pool.getconn()
     try:
         formatted_serial = format_serial_number(serial_number)
 
         with conn:
             with conn.cursor() as cur:
                 cur.execute("""
-                    SELECT serial_number, sku_group, shopify_gid
+                    UPDATE audio_cables
+                    SET shopify_gid = %s
+                    WHERE serial_number = %s AND COALESCE(shopify_gid, '') = ''
+                    RETURNING serial_number, sku_group, shopify_gid
+                """, (customer_shopify_gid, formatted_serial))
+                result = cur.fetchone()
+
+                if result:
+                    conn.commit()
+                    invalidate_cable_queries()
+                    return {
+                        'success': True,
+                        'serial_number': result[0],
+                        'sku_group': result[1],
+                        'customer_gid': result[2]
+                    }
+
+                cur.execute("""
+                    SELECT shopify_gid
                     FROM audio_cables
                     WHERE serial_number = %s
                 """, (formatted_serial,))
@@ -729,34 +826,18 @@ def assign_cable_to_customer(serial_number, customer_shopify_gid):
                         'message': f'Cable with serial number {formatted_serial} not found in database'
                     }
 
-                if existing[2]:
-                    return {
-                        'error': 'already_assigned',
-                        'message': f'Cable {formatted_serial} is already assigned to customer {existing[2]}',
-                        'existing_customer_gid': existing[2]
-                    }
-
-                cur.execute("""
-                    UPDATE audio_cables
-                    SET shopify_gid = %s
-                    WHERE serial_number = %s
-                    RETURNING serial_number, sku_group, shopify_gid
-                """, (customer_shopify_gid, formatted_serial))
-                result = cur.fetchone()
-                conn.commit()
-
                 return {
-                    'success': True,
-                    'serial_number': result[0],
-                    'sku_group': result[1],
-                    'customer_gid': result[2]
+                    'error': 'already_assigned',
+                    'message': f'Cable {formatted_serial} is already assigned to customer {existing[0]}',
+                    'existing_customer_gid': existing[0]
                 }
     except Exception as e:
         logger.error("Error assigning cable to customer: %s", e)
         conn.rollback()
         return {'error': 'database', 'message': str(e)}
     finally:
-        pg_pool.putconn(conn)
+        if own_conn:
+            pg_pool.putconn(conn)
 
 
 def unassign_cable(serial_number):
@@ -780,6 +861,7 @@ def unassign_cable(serial_number):
                 """, (formatted_serial,))
                 result = cur.fetchone()
                 conn.commit()
+                invalidate_cable_queries()
                 if result:
                     return {'success': True, 'serial_number': result[0]}
                 return {'error': 'not_assigned', 'message': f'Cable {formatted_serial} is not assigned to anyone'}
@@ -791,9 +873,14 @@ def unassign_cable(serial_number):
         pg_pool.putconn(conn)
 
 
-def force_reassign_cable(serial_number, customer_shopify_gid):
-    """Unconditionally reassign a cable to a customer (overrides existing assignment)"""
-    conn = pg_pool.getconn()
+def force_reassign_cable(serial_number, customer_shopify_gid, conn=None):
+    """Unconditionally reassign a cable to a customer (overrides existing assignment)
+
+    `conn` works as in assign_cable_to_customer().
+    """
+    own_conn = conn is None or conn.closed
+    if own_conn:
+        conn = pg_pool.getconn()
     try:
         formatted_serial = format_serial_number(serial_number)
         with conn:
@@ -806,6 +893,7 @@ def force_reassign_cable(serial_number, customer_shopify_gid):
                 """, (customer_shopify_gid, formatted_serial))
                 result = cur.fetchone()
                 conn.commit()
+                invalidate_cable_queries()
 
                 if result:
                     return {
@@ -823,11 +911,18 @@ def force_reassign_cable(serial_number, customer_shopify_gid):
         conn.rollback()
         return {'error': 'database', 'message': str(e)}
     finally:
-        pg_pool.putconn(conn)
+        if own_conn:
+            pg_pool.putconn(conn)
 
 
+@_cable_query_cached(list)
 def get_cables_for_customer(customer_shopify_gid):
-    """Get all cables assigned to a customer"""
+    """Get all cables assigned to a customer
+
+    Each record also carries 'display', the one-line cable description the
+    customer screens list ("Studio Classic 10.0ft Glacier", or the
+    description for MISC/LTD cables).
+    """
     conn = pg_pool.getconn()
     try:
         with conn.cursor() as cur:
@@ -844,7 +939,7 @@ def get_cables_for_customer(customer_shopify_gid):
 
             cables = []
             for row in rows:
-                cables.append(_enrich_record({
+                cable = _enrich_record({
                     'serial_number': row[0],
                     'sku_group': row[1],
                     'prefix': row[2],
@@ -853,11 +948,17 @@ def get_cables_for_customer(customer_shopify_gid):
                     'updated_timestamp': row[5],
                     'description': row[6],
                     'archived_at': row[7],
-                }))
+                })
+                if cable['kind'] in ('misc', 'ltd') and cable['description']:
+                    detail = f"- {cable['description']}"
+                else:
+                    detail = cable['pattern_name'] or ''
+                cable['display'] = f"{cable['series']} {cable['length']}ft {detail}".rstrip()
+                cables.append(cable)
             return cables
     except Exception as e:
         logger.error("Error fetching cables for customer: %s", e)
-        return []
+        raise
     finally:
         pg_pool.putconn(conn)
 
@@ -1061,6 +1162,7 @@ def assign_cable_to_order(serial_number, customer_gid, order_gid, line_item_skus
                 """, (customer_gid, order_gid, formatted_serial))
                 result = cur.fetchone()
                 conn.commit()
+                invalidate_cable_queries()
 
                 return {
                     'success': True,
@@ -1097,6 +1199,7 @@ def force_assign_cable_to_order(serial_number, customer_gid, order_gid):
                 """, (customer_gid, order_gid, formatted_serial))
                 result = cur.fetchone()
                 conn.commit()
+                invalidate_cable_queries()
                 if result:
                     return {'success': True, 'serial_number': result[0], 'sku_group': result[1]}
                 return {'error': 'not_found', 'message': f'Cable {formatted_serial} not found'}
@@ -1180,7 +1283,9 @@ def assign_registration_code(serial_number, code):
 def batch_assign_registration_codes(serial_numbers):
     """Generate and assign registration codes to a list of cables in a single transaction.
 
-    Retries with new codes on collision (up to 3 attempts per cable).
+    All codes are written by one UPDATE, so the round-trips don't grow with
+    the batch. A code collision fails the whole statement; it is retried
+    with fresh codes (up to 3 attempts).
 
     Args:
         serial_numbers: List of cable serial numbers
@@ -1193,77 +1298,91 @@ def batch_assign_registration_codes(serial_numbers):
     """
     from greenlight.registration import generate_registration_code
 
+    # Dedupe, keeping scan order for the results
+    serials = list(dict.fromkeys(format_serial_number(s) for s in serial_numbers))
+
     conn = pg_pool.getconn()
     results = []
     errors = []
     try:
         with conn:
             with conn.cursor() as cur:
-                for serial in serial_numbers:
-                    formatted_serial = format_serial_number(serial)
-                    assigned = False
-                    for attempt in range(3):
-                        code = generate_registration_code()
-                        try:
-                            cur.execute("""
-                                UPDATE audio_cables
-                                SET registration_code = %s
-                                WHERE serial_number = %s AND registration_code IS NULL
-                                RETURNING serial_number, registration_code
-                            """, (code, formatted_serial))
-                            result = cur.fetchone()
-                            if result:
-                                results.append({
-                                    'serial_number': result[0],
-                                    'registration_code': result[1]
-                                })
-                                assigned = True
-                                break
-                            else:
-                                cur.execute(
-                                    "SELECT registration_code FROM audio_cables WHERE serial_number = %s",
-                                    (formatted_serial,)
-                                )
-                                existing = cur.fetchone()
-                                if existing and existing[0]:
-                                    errors.append({
-                                        'serial_number': formatted_serial,
-                                        'error': f'Already has code: {existing[0]}'
-                                    })
-                                else:
-                                    errors.append({
-                                        'serial_number': formatted_serial,
-                                        'error': 'Cable not found'
-                                    })
-                                assigned = True
-                                break
-                        except Exception as e:
-                            if 'unique' in str(e).lower() or 'duplicate' in str(e).lower():
-                                conn.rollback()
-                                continue
-                            raise
-                    if not assigned:
+                assigned = None
+                for attempt in range(3):
+                    codes = [generate_registration_code() for _ in serials]
+                    try:
+                        cur.execute("""
+                            UPDATE audio_cables ac
+                            SET registration_code = v.code
+                            FROM unnest(%s::text[], %s::text[]) AS v(serial_number, code)
+                            WHERE ac.serial_number = v.serial_number
+                              AND ac.registration_code IS NULL
+                            RETURNING ac.serial_number, ac.registration_code
+                        """, (serials, codes))
+                        assigned = dict(cur.fetchall())
+                        break
+                    except Exception as e:
+                        if 'unique' in str(e).lower() or 'duplicate' in str(e).lower():
+                            conn.rollback()
+                            continue
+                        raise
+
+                if assigned is None:
+                    errors = [{
+                        'serial_number': serial,
+                        'error': 'Failed after 3 code generation attempts'
+                    } for serial in serials]
+                    return {'success': False, 'results': results, 'errors': errors}
+
+                # Anything not updated either already had a code or doesn't exist
+                missing = [serial for serial in serials if serial not in assigned]
+                existing = {}
+                if missing:
+                    cur.execute(
+                        "SELECT serial_number, registration_code FROM audio_cables WHERE serial_number = ANY(%s)",
+                        (missing,)
+                    )
+                    existing = dict(cur.fetchall())
+
+                for serial in serials:
+                    if serial in assigned:
+                        results.append({
+                            'serial_number': serial,
+                            'registration_code': assigned[serial]
+                        })
+                    elif existing.get(serial):
+                        errors.append({
+                            'serial_number': serial,
+                            'error': f'Already has code: {existing[serial]}'
+                        })
+                    else:
                         errors.append({
-                            'serial_number': formatted_serial,
-                            'error': 'Failed after 3 code generation attempts'
+                            'serial_number': serial,
+                            'error': 'Cable not found'
                         })
                 conn.commit()
         return {'success': len(errors) == 0, 'results': results, 'errors': errors}
     except Exception as e:
         conn.rollback()
-        return {'success': False, 'results': results, 'errors': errors,
+        return {'success': False, 'results': [], 'errors': errors,
                 'message': str(e)}
     finally:
         pg_pool.putconn(conn)
 
 
+_STOCK_COUNT_FIELDS = ('total', 'available', 'sold', 'failed', 'untested')
+
+
+@_cable_query_cached(lambda: {field: {} for field in _STOCK_COUNT_FIELDS})
 def get_sku_stock_summary():
     """Get per-variant cable counts from Postgres.
 
     Phase 5: groups by (sku_group, prefix, length, connector_code) since each
-    distinct variant is a separate "stock unit". Returns dict keyed by the
-    user-facing variant SKU (computed via format_variant_sku) → counts.
-    Excludes MISC variants from this summary (use get_misc_summary).
+    distinct variant is a separate "stock unit". Returns one dict per count —
+    {'total', 'available', 'sold', 'failed', 'untested'} — each keyed by the
+    user-facing variant SKU (computed via format_variant_sku) → count, so a
+    caller needing one figure does a single lookup. Variants with no cables
+    are absent. Excludes MISC variants from this summary (use get_misc_summary).
     """
     from greenlight.cable_config import format_variant_sku
 
@@ -1290,9 +1409,8 @@ def get_sku_stock_summary():
                 FROM audio_cables ac
                 WHERE ac.sku_group !~ '-MISC-[0-9]+$'
                 GROUP BY ac.sku_group, ac.prefix, ac.length, ac.connector_code
-                ORDER BY ac.prefix, ac.sku_group, ac.length, ac.connector_code
             """)
-            counts = {}
+            counts = {field: {} for field in _STOCK_COUNT_FIELDS}
             for row in cur.fetchall():
                 sku_group, prefix, length, connector_code, total, available, sold, failed, untested = row
                 length_val = float(length) if length is not None else None
@@ -1304,42 +1422,127 @@ def get_sku_stock_summary():
                 )
                 if variant_sku is None:
                     continue
-                counts[variant_sku] = {
-                    'total': total,
+                counts['total'][variant_sku] = total
+                counts['available'][variant_sku] = available
+                counts['sold'][variant_sku] = sold
+                counts['failed'][variant_sku] = failed
+                counts['untested'][variant_sku] = untested
+            return counts
+    except Exception as e:
+        logger.error("Error fetching SKU stock summary: %s", e)
+        raise
+    finally:
+        pg_pool.putconn(conn)
+
+
+@_cable_query_cached(dict)
+def get_series_rollup():
+    """Get catalog stock totals per series prefix in one aggregate query.
+
+    Only cables matching a catalog variant from the product line YAML are
+    counted (the same set get_sku_stock_summary() would key by variant SKU),
+    so LTD/MISC and off-catalog builds stay out of the dashboard numbers.
+
+    Returns dict: prefix -> {available, sold, failed, total, skus_with_stock}.
+    Prefixes with no matching cables are omitted.
+    """
+    from greenlight.product_lines import load_yaml_skus
+
+    prefixes, lengths, groups, connectors = [], [], [], []
+    for prefix, line in load_yaml_skus().items():
+        for entry in line["sku_index"]:
+            prefixes.append(prefix)
+            lengths.append(entry["length"])
+            groups.append(entry["pattern_code"])
+            connectors.append(entry["conn_code"] or '')
+
+    conn = pg_pool.getconn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""
+                WITH catalog AS (
+                    SELECT *
+                    FROM unnest(%s::text[], %s::numeric[], %s::text[], %s::text[])
+                        AS c(prefix, length, sku_group, connector_code)
+                ),
+                avail AS (
+                    SELECT
+                        c.prefix, c.length, c.sku_group, c.connector_code,
+                        ac.test_passed, ac.shopify_gid,
+                        (ac.test_passed = TRUE
+                         AND (ac.shopify_gid IS NULL OR ac.shopify_gid = '')) AS is_available
+                    FROM catalog c
+                    JOIN audio_cables ac
+                      ON ac.prefix = c.prefix
+                     AND ac.length = c.length
+                     AND ac.sku_group = c.sku_group
+                     AND COALESCE(ac.connector_code, '') = c.connector_code
+                )
+                SELECT
+                    prefix,
+                    COUNT(*) FILTER (WHERE is_available) as available,
+                    COUNT(*) FILTER (
+                        WHERE shopify_gid IS NOT NULL AND shopify_gid != ''
+                    ) as sold,
+                    COUNT(*) FILTER (WHERE test_passed = FALSE) as failed,
+                    COUNT(*) as total,
+                    COUNT(DISTINCT (length, sku_group, connector_code))
+                        FILTER (WHERE is_available) as skus_with_stock
+                FROM avail
+                GROUP BY prefix
+            """, (prefixes, lengths, groups, connectors))
+            rollup = {}
+            for prefix, available, sold, failed, total, skus_with_stock in cur.fetchall():
+                rollup[prefix] = {
                     'available': available,
                     'sold': sold,
                     'failed': failed,
-                    'untested': untested,
+                    'total': total,
+                    'skus_with_stock': skus_with_stock,
                 }
-            return counts
+            return rollup
     except Exception as e:
-        logger.error("Error fetching SKU stock summary: %s", e)
-        return {}
+        logger.error("Error fetching series rollup: %s", e)
+        raise
     finally:
         pg_pool.putconn(conn)
 
 
-def get_recent_sales(days=90):
-    """Get cables sold (assigned to customer) in the last N days, grouped by variant.
+@_cable_query_cached(dict)
+def get_recent_sales_windows(days=(30, 90)):
+    """Get recent sales for several look-back windows in one query.
 
-    Returns dict: variant_sku -> count. Excludes MISC variants.
+    Scans the sales range once (out to the longest window) and counts each
+    window with a FILTER, instead of one query per window.
+
+    Returns dict: variant_sku -> tuple of counts, one per window in the order
+    given (e.g. (sold_30d, sold_90d)). Excludes MISC variants.
     """
     from greenlight.cable_config import format_variant_sku
 
+    windows = tuple(days)
+    if not windows:
+        return {}
+    window_cols = ",\n".join(
+        "COUNT(*) FILTER (WHERE ac.updated_timestamp >= NOW() - %s * INTERVAL '1 day')"
+        for _ in windows
+    )
+
     conn = pg_pool.getconn()
     try:
         with conn.cursor() as cur:
-            cur.execute("""
-                SELECT ac.sku_group, ac.prefix, ac.length, ac.connector_code, COUNT(*)
+            cur.execute(f"""
+                SELECT ac.sku_group, ac.prefix, ac.length, ac.connector_code,
+                       {window_cols}
                 FROM audio_cables ac
                 WHERE ac.shopify_gid IS NOT NULL AND ac.shopify_gid != ''
-                  AND ac.updated_timestamp >= NOW() - INTERVAL '%s days'
+                  AND ac.updated_timestamp >= NOW() - %s * INTERVAL '1 day'
                   AND ac.sku_group !~ '-MISC-[0-9]+$'
                 GROUP BY ac.sku_group, ac.prefix, ac.length, ac.connector_code
-                ORDER BY COUNT(*) DESC
-            """, (days,))
+            """, (*windows, max(windows)))
             sales = {}
-            for sku_group, prefix, length, connector_code, count in cur.fetchall():
+            for row in cur.fetchall():
+                sku_group, prefix, length, connector_code = row[:4]
                 length_val = float(length) if length is not None else None
                 if length_val is not None and length_val.is_integer():
                     length_val = int(length_val)
@@ -1348,15 +1551,16 @@ def get_recent_sales(days=90):
                     length=length_val, connector_code=connector_code,
                 )
                 if variant_sku:
-                    sales[variant_sku] = count
+                    sales[variant_sku] = tuple(row[4:])
             return sales
     except Exception as e:
-        logger.error("Error fetching recent sales: %s", e)
-        return {}
+        logger.error("Error fetching recent sales windows: %s", e)
+        raise
     finally:
         pg_pool.putconn(conn)
 
 
+@_cable_query_cached(dict)
 def get_misc_summary():
     """Get summary of MISC cables grouped by series.
 
@@ -1389,7 +1593,7 @@ def get_misc_summary():
             return result
     except Exception as e:
         logger.error("Error fetching MISC summary: %s", e)
-        return {}
+        raise
     finally:
         pg_pool.putconn(conn)
 
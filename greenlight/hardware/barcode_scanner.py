@@ -11,13 +11,13 @@ except ImportError:
     print("Warning: evdev not installed. Install with: pip install evdev")
 
 import os
-import sys
 import time
 import re
 import errno
 from typing import Optional, Tuple
 import threading
-import queue
+
+from greenlight.hardware.scan_queue import ScanQueueMixin
 
 # Zebra DS2208 Scanner VID:PID
 ZEBRA_DS2208_VID_PID = (0x05e0, 0x1200)
@@ -48,14 +48,14 @@ else:
     KEYMAP = {}
 
 
-class BarcodeScanner:
+class BarcodeScanner(ScanQueueMixin):
     """Barcode scanner using evdev for direct device access"""
 
     def __init__(self):
+        super().__init__()
         self.device = None
         self.device_path = None
         self.device_name = None
-        self.scan_queue = queue.Queue()
         self.scan_thread = None
         self.running = False
         # Set when the underlying device disappears (e.g. wireless scanner
@@ -221,29 +221,7 @@ class BarcodeScanner:
         m = ACCEPT_PATTERN.search(raw)
         if m:
             barcode = m.group(0)
-            self.scan_queue.put(barcode)
-
-    def get_scan(self, timeout: float = 0.1) -> Optional[str]:
-        """Get a scanned barcode from the queue (non-blocking with timeout)"""
-        try:
-            return self.scan_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
-
-    def wait_for_scan(self, timeout: float = 30.0) -> Optional[str]:
-        """Wait for a barcode scan with timeout"""
-        try:
-            return self.scan_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
-
-    def clear_queue(self):
-        """Clear any pending scans from the queue"""
-        while not self.scan_queue.empty():
-            try:
-                self.scan_queue.get_nowait()
-            except queue.Empty:
-                break
+            self._queue_scan(barcode)
 
     def shutdown(self):
         """Clean shutdown of scanner"""
@@ -19,9 +19,20 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+# Only the UNO Q Bridge backend needs msgpack
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+class BridgeRPCError(RuntimeError):
+    """The MCU answered a Bridge call with an error; the router link is fine."""
+
+
 # ===== Result dataclasses =====
 
 @dataclass
@@ -310,13 +321,21 @@ class ArduinoCableTester(CableTesterInterface):
                     logger.error("No Arduino cable tester found")
                     return False
 
+            # Reconnecting after a dropped link: release the stale handle
+            if self.serial and self.serial.is_open:
+                self.serial.close()
+
             self.serial = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
                 timeout=self.timeout
             )
 
-            time.sleep(2.0)
+            # Opening the port resets the Mega; the sketch announces itself
+            # with READY:/ERROR: once setup() finishes. Go as soon as that
+            # line arrives instead of always sleeping out the boot window.
+            # A board that didn't reset stays quiet and just waits out the cap.
+            self._read_until_response("READY:", timeout=2.0)
             self.serial.reset_input_buffer()
 
             self._send_command("ID")
@@ -340,8 +359,13 @@ class ArduinoCableTester(CableTesterInterface):
     def _send_command(self, command: str) -> None:
         if not self.serial or not self.serial.is_open:
             raise RuntimeError("Serial connection not open")
-        self.serial.write(f"{command}\n".encode('utf-8'))
-        self.serial.flush()
+        try:
+            self.serial.write(f"{command}\n".encode('utf-8'))
+            self.serial.flush()
+        except serial.SerialException:
+            # Unplugged: let the next get_cable_tester() reconnect
+            self.connected = False
+            raise
         logger.debug(f"Sent: {command}")
 
     def _read_response(self, timeout: Optional[float] = None) -> Optional[str]:
@@ -356,6 +380,7 @@ class ArduinoCableTester(CableTesterInterface):
             return line if line else None
         except serial.SerialException as e:
             logger.error(f"Serial read error: {e}")
+            self.connected = False
             return None
         finally:
             self.serial.timeout = old_timeout
@@ -473,7 +498,7 @@ class ArduinoCableTester(CableTesterInterface):
         if self.serial and self.serial.is_open:
             try:
                 self.serial.close()
-            except:
+            except OSError:
                 pass
         self.serial = None
         self.connected = False
@@ -502,13 +527,14 @@ class BridgeCableTester(CableTesterInterface):
 
     def _connect(self) -> bool:
         """Connect to the arduino-router unix socket"""
-        try:
-            import msgpack  # noqa: F811
-        except ImportError:
+        if not MSGPACK_AVAILABLE:
             logger.error("msgpack package required for Bridge communication: pip install msgpack")
             return False
 
         try:
+            # Reconnecting after a dropped link: release the stale socket
+            if self._sock:
+                self._sock.close()
             self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             self._sock.connect(self.socket_path)
             self._sock.settimeout(15.0)
@@ -520,8 +546,6 @@ class BridgeCableTester(CableTesterInterface):
 
     def _rpc_call(self, method: str, *params, timeout: float = 15.0) -> Any:
         """Send msgpack-rpc call and return result"""
-        import msgpack
-
         with self._lock:
             self._next_msgid += 1
             msgid = self._next_msgid
@@ -544,14 +568,24 @@ class BridgeCableTester(CableTesterInterface):
                         msg_type, resp_msgid, error, result = msg[0], msg[1], msg[2], msg[3]
                         if msg_type == 1 and resp_msgid == msgid:
                             if error is not None:
-                                raise RuntimeError(f"RPC error: {error}")
+                                raise BridgeRPCError(f"RPC error: {error}")
                             return result
             finally:
                 self._sock.settimeout(old_timeout)
 
     def _run_command(self, command: str, timeout: float = 15.0) -> str:
         """Send command to MCU via Bridge and return response string"""
-        result = self._rpc_call("run_command", command, timeout=timeout)
+        try:
+            result = self._rpc_call("run_command", command, timeout=timeout)
+        except (BridgeRPCError, socket.timeout):
+            # The MCU refused the command, or a slow test outran the timeout.
+            # Neither means the router socket dropped; a late reply comes
+            # back under the old msgid, which the next call skips.
+            raise
+        except (OSError, RuntimeError):
+            # Router socket gone: let the next get_cable_tester() reconnect.
+            self.connected = False
+            raise
         if isinstance(result, bytes):
             result = result.decode('utf-8')
         logger.debug(f"Bridge command '{command}' -> '{result}'")
@@ -668,7 +702,7 @@ class BridgeCableTester(CableTesterInterface):
         if self._sock:
             try:
                 self._sock.close()
-            except:
+            except OSError:
                 pass
         self._sock = None
         self.connected = False
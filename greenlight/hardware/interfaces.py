@@ -7,7 +7,7 @@ easy testing and hardware swapping.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -26,7 +26,7 @@ class ScanResult:
 class PrintJob:
     """Print job specification"""
     template: str
-    data: Dict[str, Any]
+    data: Union[Dict[str, Any], List[Dict[str, Any]]]  # one label, or a list sent as one job
     quantity: int = 1
     priority: str = "normal"  # "low", "normal", "high"
 
@@ -228,11 +228,16 @@ class HardwareManager:
         return self.card_printer
 
     def get_cable_tester(self) -> Optional[CableTesterInterface]:
-        """Get cable tester with lazy initialization"""
-        if self.cable_tester and hasattr(self.cable_tester, 'is_ready'):
-            if not self.cable_tester.is_ready():
-                logger.info("Lazily initializing cable tester...")
-                self.cable_tester.initialize()
+        """Get cable tester with lazy initialization
+
+        The open connection is reused for as long as it stays up. Callers
+        only need the handle (they check .connected themselves), so this
+        doesn't round-trip a STATUS query to the tester on every call, and a
+        connected tester is never re-opened (which resets the Mega).
+        """
+        if self.cable_tester and not getattr(self.cable_tester, 'connected', False):
+            logger.info("Lazily initializing cable tester...")
+            self.cable_tester.initialize()
         return self.cable_tester
 
     def get_gpio(self) -> Optional[GPIOInterface]:
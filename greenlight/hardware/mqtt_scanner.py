@@ -6,13 +6,13 @@ Provides the same interface as BarcodeScanner for drop-in replacement.
 """
 
 import json
-import queue
 import socket
 import threading
 import time
 import logging
 from typing import Optional
 from greenlight.hardware.interfaces import ScanResult
+from greenlight.hardware.scan_queue import ScanQueueMixin
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ MQTT_TOPIC = "scanner/barcode"
 MQTT_STATUS_TOPIC = "scanner/status"
 
 
-class MQTTScanner:
+class MQTTScanner(ScanQueueMixin):
     """
     MQTT-based scanner client that subscribes to barcode scan events.
 
@@ -39,16 +39,19 @@ class MQTTScanner:
     """
 
     def __init__(self, broker: str = MQTT_BROKER, port: int = MQTT_PORT):
+        super().__init__()
         self.broker = broker
         self.port = port
         self.mqtt_client = None
-        self.scan_queue = queue.Queue()
         self.connected = False
         self.running = False
         self._paused = False
         self._status_payload = None
         self._hostname = socket.gethostname()
         self._connect_lock = threading.Lock()
+        # Set by _on_connect (success or refusal) so initialize() can block
+        # on the CONNACK instead of polling self.connected.
+        self._connack = threading.Event()
 
         # For compatibility with BarcodeScanner interface
         self.device_name = "MQTT Scanner Client"
@@ -86,17 +89,15 @@ class MQTTScanner:
                 )
 
                 # Connect
+                self._connack.clear()
                 self.mqtt_client.connect(self.broker, self.port, keepalive=60)
                 self.mqtt_client.loop_start()
 
-                # Wait briefly for connection
-                for _ in range(20):  # Wait up to 2 seconds
-                    if self.connected:
-                        return True
-                    time.sleep(0.1)
-
-                logger.warning("MQTT connection timeout")
-                return False
+                # Wait up to 2 seconds for the broker to answer
+                if not self._connack.wait(timeout=2.0):
+                    logger.warning("MQTT connection timeout")
+                    return False
+                return self.connected
 
             except Exception as e:
                 logger.error(f"Failed to connect to MQTT broker: {e}")
@@ -116,6 +117,7 @@ class MQTTScanner:
         else:
             logger.error(f"MQTT connection failed: {reason_code}")
             self.connected = False
+        self._connack.set()
 
     def _on_disconnect(self, client, userdata, disconnect_flags, reason_code, properties):
         """Callback when disconnected from MQTT broker"""
@@ -132,12 +134,12 @@ class MQTTScanner:
             barcode = payload.get('barcode')
             if barcode:
                 logger.debug(f"Received scan: {barcode}")
-                self.scan_queue.put(barcode)
+                self._queue_scan(barcode)
         except json.JSONDecodeError:
             # Handle plain text messages
             barcode = msg.payload.decode('utf-8').strip()
             if barcode:
-                self.scan_queue.put(barcode)
+                self._queue_scan(barcode)
         except Exception as e:
             logger.error(f"Error processing message: {e}")
 
@@ -155,20 +157,6 @@ class MQTTScanner:
         """Stop receiving scans"""
         self.running = False
 
-    def get_scan(self, timeout: float = 0.1) -> Optional[str]:
-        """Get a scanned barcode from the queue (non-blocking with timeout)"""
-        try:
-            return self.scan_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
-
-    def wait_for_scan(self, timeout: float = 30.0) -> Optional[str]:
-        """Wait for a barcode scan with timeout"""
-        try:
-            return self.scan_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
-
     def scan(self, timeout: float = 5.0) -> Optional[ScanResult]:
         """Scan for barcode with timeout - returns ScanResult for ScannerInterface compatibility"""
         barcode = self.get_scan(timeout=timeout)
@@ -185,14 +173,6 @@ class MQTTScanner:
         """Close connection - alias for shutdown() for ScannerInterface compatibility"""
         self.shutdown()
 
-    def clear_queue(self):
-        """Clear any pending scans from the queue"""
-        while not self.scan_queue.empty():
-            try:
-                self.scan_queue.get_nowait()
-            except queue.Empty:
-                break
-
     def publish(self, topic, payload, qos=1, retain=False):
         """Publish a message to an MQTT topic"""
         if self.mqtt_client and self.connected:
@@ -210,10 +190,6 @@ class MQTTScanner:
         self._status_payload = payload
         return self.publish(MQTT_STATUS_TOPIC, payload, qos=1, retain=True)
 
-    def set_webhooks_enabled(self, enabled):
-        """Backward-compatible alias for set_scanning_active"""
-        return self.set_scanning_active(not enabled)
-
     def pause(self):
         """Pause scan processing (ignore incoming barcode messages)"""
         self._paused = True
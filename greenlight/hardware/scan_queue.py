@@ -0,0 +1,89 @@
+"""
+Scan queue plumbing shared by the evdev and MQTT scanner clients.
+
+Both queue decoded barcodes from a background thread and let callers
+select() on the scanner next to stdin via a self-pipe.
+"""
+
+import os
+import queue
+from typing import Optional
+
+
+class ScanQueueMixin:
+    """Scan queue, wakeup pipe, and the screen-facing status/hand-off hooks.
+
+    Subclasses call super().__init__() and feed barcodes in through
+    _queue_scan(). The status/hand-off hooks are no-ops here; MQTTScanner
+    overrides them since it has a status topic and a daemon to pause.
+    """
+
+    def __init__(self):
+        self.scan_queue = queue.Queue()
+        # Self-pipe written whenever a scan is queued, so callers can select()
+        # on the scanner alongside stdin instead of polling the queue.
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+
+    def fileno(self) -> int:
+        """Readable whenever a scan is queued, so select() can watch the scanner.
+
+        Wakeups are coalesced: check get_scan(timeout=0) before selecting so
+        a second scan queued behind the first isn't left waiting.
+        """
+        return self._wakeup_r
+
+    def _queue_scan(self, barcode: str):
+        """Queue a barcode and wake anyone selecting on this scanner."""
+        self.scan_queue.put(barcode)
+        try:
+            os.write(self._wakeup_w, b'\0')
+        except BlockingIOError:
+            pass  # Pipe already full of wakeups; the reader will drain it
+
+    def _drain_wakeup(self):
+        """Consume pending wakeup bytes (the queue is the source of truth)."""
+        try:
+            while os.read(self._wakeup_r, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def get_scan(self, timeout: float = 0.1) -> Optional[str]:
+        """Get a scanned barcode from the queue (non-blocking with timeout)"""
+        self._drain_wakeup()
+        try:
+            return self.scan_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def wait_for_scan(self, timeout: float = 30.0) -> Optional[str]:
+        """Wait for a barcode scan with timeout"""
+        self._drain_wakeup()
+        try:
+            return self.scan_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def clear_queue(self):
+        """Clear any pending scans from the queue"""
+        self._drain_wakeup()
+        while not self.scan_queue.empty():
+            try:
+                self.scan_queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def set_scanning_active(self, active):
+        """Tell status subscribers whether Greenlight is scanning (no-op here)"""
+
+    def set_webhooks_enabled(self, enabled):
+        """Backward-compatible alias for set_scanning_active"""
+        return self.set_scanning_active(not enabled)
+
+    def pause(self):
+        """Stop taking scans while another reader has the scanner (no-op here)"""
+
+    def resume(self):
+        """Counterpart to pause()"""
@@ -9,6 +9,7 @@ Communication: TCP/IP socket on port 9100
 """
 
 import socket
+import time
 import logging
 import struct
 import io
@@ -17,6 +18,11 @@ from greenlight.hardware.interfaces import LabelPrinterInterface, PrintJob
 
 logger = logging.getLogger(__name__)
 
+# How long a successful connect/send vouches for the printer. Screens check
+# is_ready() right before printing; within this window that's a timestamp
+# compare instead of another TCP handshake (up to 2s when it's off).
+READY_TTL_SEC = 5.0
+
 # Wire logo bitmap (50x15 pixels, 1-bit BMP) - embedded to avoid file dependency
 WIRE_LOGO_BMP_DATA = (
     b'BM\xfa\x00\x00\x00\x00\x00\x00\x00\x82\x00\x00\x00l\x00\x00\x002\x00\x00\x00'
@@ -55,6 +61,7 @@ class TSCLabelPrinter(LabelPrinterInterface):
         self.label_height_mm = label_height_mm
         self.connected = False
         self.socket: Optional[socket.socket] = None
+        self._ready_until = 0.0
 
         # Convert mm to dots (203 DPI for TE210)
         self.dpi = 203
@@ -146,14 +153,24 @@ class TSCLabelPrinter(LabelPrinterInterface):
             # Don't wait for response - just test if we can connect
             test_socket.close()
             self.connected = True
+            self._mark_ready()
             logger.info(f"TSC printer initialized at {self.ip_address}:{self.port}")
             return True
 
         except (socket.timeout, socket.error, OSError) as e:
             logger.error(f"Failed to initialize TSC printer: {e}")
-            self.connected = False
+            self.invalidate()
             return False
 
+    def _mark_ready(self):
+        """Record that the printer just accepted a connection"""
+        self._ready_until = time.monotonic() + READY_TTL_SEC
+
+    def invalidate(self):
+        """Forget the cached readiness so the next is_ready() probes again"""
+        self.connected = False
+        self._ready_until = 0.0
+
     def _send_tspl_commands(self, commands, bitmap_commands: list = None) -> bool:
         """
         Send TSPL commands to printer
@@ -180,12 +197,14 @@ class TSCLabelPrinter(LabelPrinterInterface):
 
             # Close socket
             sock.close()
+            self._mark_ready()
 
             logger.info(f"Sent {len(commands)} bytes to printer at {self.ip_address}")
             return True
 
         except (socket.timeout, socket.error, OSError) as e:
             logger.error(f"Failed to send TSPL commands: {e}")
+            self.invalidate()
             return False
 
     def print_labels(self, print_job: PrintJob) -> bool:
@@ -193,7 +212,10 @@ class TSCLabelPrinter(LabelPrinterInterface):
         Print cable labels
 
         Args:
-            print_job: PrintJob with template and data
+            print_job: PrintJob with template and data. When data is a list,
+                every label's TSPL is sent over a single connection.
+                quantity > 1 prints that many copies of each label via the
+                printer's PRINT copy count rather than resending the label.
 
         Returns:
             True if successful, False otherwise
@@ -203,28 +225,32 @@ class TSCLabelPrinter(LabelPrinterInterface):
             return False
 
         try:
-            # Generate TSPL commands based on template
+            # Pick the TSPL generator for the template
             if print_job.template == "cable_label":
-                tspl = self._generate_cable_label_tspl(print_job.data)
+                generate = self._generate_cable_label_tspl
             elif print_job.template == "registration_label":
-                tspl = self._generate_registration_label_tspl(print_job.data)
+                generate = self._generate_registration_label_tspl
             elif print_job.template == "wire_label":
-                tspl = self._generate_wire_label_tspl(print_job.data)
+                generate = self._generate_wire_label_tspl
             elif print_job.template == "barcode_label":
-                tspl = self._generate_barcode_label_tspl(print_job.data)
+                generate = self._generate_barcode_label_tspl
             elif print_job.template == "bin_label":
-                tspl = self._generate_bin_label_tspl(print_job.data)
+                generate = self._generate_bin_label_tspl
             elif print_job.template == "text_label":
-                tspl = self._generate_text_label_tspl(print_job.data)
+                generate = self._generate_text_label_tspl
             else:
                 logger.error(f"Unknown template: {print_job.template}")
                 return False
 
+            labels = print_job.data if isinstance(print_job.data, list) else [print_job.data]
+            copies = max(1, print_job.quantity)
+            tspl = b''.join(self._with_copies(generate(data), copies) for data in labels)
+
             # Send commands to printer
             success = self._send_tspl_commands(tspl)
 
             if success:
-                logger.info(f"Successfully printed {print_job.quantity} label(s)")
+                logger.info(f"Successfully printed {len(labels) * copies} label(s)")
 
             return success
 
@@ -232,6 +258,21 @@ class TSCLabelPrinter(LabelPrinterInterface):
             logger.error(f"Error printing labels: {e}")
             return False
 
+    def _with_copies(self, tspl: bytes, copies: int) -> bytes:
+        """
+        Rewrite a label's trailing PRINT command to print multiple copies
+
+        The generators all end with a single-copy PRINT; TSPL's
+        "PRINT 1,N" prints N copies of the buffered label in one go.
+        """
+        if copies <= 1:
+            return tspl
+        start = tspl.rfind(b'\r\nPRINT ')
+        if start < 0:
+            return tspl
+        end = tspl.find(b'\r\n', start + 2)
+        return tspl[:start] + f'\r\nPRINT 1,{copies}'.encode() + tspl[end:]
+
     def _generate_cable_label_tspl(self, data: Dict[str, Any]) -> bytes:
         """
         Generate TSPL commands for cable label
@@ -971,20 +1012,21 @@ class TSCLabelPrinter(LabelPrinterInterface):
     def get_status(self) -> Dict[str, Any]:
         """Get printer status"""
         status = {
-            'connected': self.connected,
             'ip_address': self.ip_address,
             'port': self.port,
             'label_size': f"{self.label_width_mm}x{self.label_height_mm}mm",
-            'ready': self.is_ready()
         }
 
-        # Try to get detailed status from printer
-        if self.connected:
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2.0)
-                sock.connect((self.ip_address, self.port))
+        # One connection answers both "is it up" and "what does it report";
+        # a successful connect doubles as the readiness probe.
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(2.0)
+            sock.connect((self.ip_address, self.port))
+            self.connected = True
+            self._mark_ready()
 
+            try:
                 # Request status (~!T command)
                 sock.sendall(b'~!T\r\n')
 
@@ -995,12 +1037,17 @@ class TSCLabelPrinter(LabelPrinterInterface):
                     status['printer_response'] = response.decode('utf-8', errors='ignore').strip()
                 except socket.timeout:
                     pass
-
-                sock.close()
-
             except (socket.error, OSError) as e:
                 status['status_error'] = str(e)
+            finally:
+                sock.close()
+
+        except (socket.timeout, socket.error, OSError) as e:
+            self.invalidate()
+            status['status_error'] = str(e)
 
+        status['connected'] = self.connected
+        status['ready'] = self.connected
         return status
 
     def is_ready(self) -> bool:
@@ -1009,15 +1056,19 @@ class TSCLabelPrinter(LabelPrinterInterface):
             # Try to reconnect
             return self.initialize()
 
+        if time.monotonic() < self._ready_until:
+            return True
+
         try:
             # Quick connection test
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(2.0)
             sock.connect((self.ip_address, self.port))
             sock.close()
+            self._mark_ready()
             return True
         except (socket.timeout, socket.error, OSError):
-            self.connected = False
+            self.invalidate()
             return False
 
     def close(self) -> None:
@@ -1025,11 +1076,11 @@ class TSCLabelPrinter(LabelPrinterInterface):
         if self.socket:
             try:
                 self.socket.close()
-            except:
+            except OSError:
                 pass
             self.socket = None
 
-        self.connected = False
+        self.invalidate()
         logger.info("TSC printer connection closed")
 
 
@@ -1050,7 +1101,9 @@ class MockTSCLabelPrinter(LabelPrinterInterface):
 
     def print_labels(self, print_job: PrintJob) -> bool:
         """Mock label printing"""
-        logger.info(f"Mock TSC printer: Would print {print_job.quantity} label(s)")
+        count = len(print_job.data) if isinstance(print_job.data, list) else 1
+        count *= max(1, print_job.quantity)
+        logger.info(f"Mock TSC printer: Would print {count} label(s)")
         logger.info(f"  Template: {print_job.template}")
         logger.info(f"  Data: {print_job.data}")
 
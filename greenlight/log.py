@@ -8,7 +8,6 @@ root handler — no per-module changes needed.
 
 import logging
 import logging.handlers
-import os
 import socket
 from pathlib import Path
 
@@ -2,6 +2,7 @@ import logging
 import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from greenlight.log import setup_logging
 from greenlight.ui import UIBase
@@ -27,8 +28,17 @@ def init_hardware():
     cable_tester = None
     scanner = None
 
+    # The printer probe and MQTT connect each wait up to 2s on the network
+    # when the device is down. The MQTT connect is started first and runs in
+    # the background across the printer and cable tester setup; results are
+    # still reported in the usual order.
+    pool = ThreadPoolExecutor(max_workers=1)
     try:
         from greenlight.hardware.interfaces import hardware_manager
+        from greenlight.hardware.mqtt_scanner import MQTTScanner
+
+        scanner = MQTTScanner()
+        scanner_ready = pool.submit(scanner.initialize)
 
         # Initialize TSC label printer
         if USE_REAL_PRINTERS:
@@ -94,10 +104,7 @@ def init_hardware():
         # Initialize MQTT barcode scanner
         # Scanner daemon must be running to publish scans to MQTT
         print("📷 Initializing MQTT barcode scanner...")
-        from greenlight.hardware.mqtt_scanner import MQTTScanner
-
-        scanner = MQTTScanner()
-        if scanner.initialize():
+        if scanner_ready.result():
             print("✅ MQTT scanner connected (subscribing to scanner/barcode)")
         else:
             print("⚠️  MQTT scanner not connected")
@@ -115,6 +122,8 @@ def init_hardware():
         print(f"⚠️  Hardware initialization issue: {e}")
         print("   Some hardware features may not work")
         print("   Continuing startup...")
+    finally:
+        pool.shutdown(wait=False)
 
 
 def check_shopify_connection():
@@ -150,7 +159,7 @@ def shutdown_hardware():
     try:
         from greenlight.hardware.interfaces import hardware_manager
         scanner = hardware_manager.scanner
-        if scanner and hasattr(scanner, 'set_scanning_active'):
+        if scanner:
             # Always publish idle on exit as a safety net
             scanner.set_scanning_active(False)
             time.sleep(0.1)  # ensure message is sent before disconnect
@@ -3,10 +3,20 @@
 Used by both the greenlight app and CLI utilities.
 """
 
+import functools
+import itertools
 import logging
 import yaml
 from pathlib import Path
 from collections import defaultdict
+from types import MappingProxyType
+
+# libyaml's C loader parses several times faster; fall back to the pure-Python
+# loader where PyYAML was built without it.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +31,17 @@ PREFIX_MAP = {
 
 LOW_STOCK_THRESHOLD = 2
 
+# Files load_yaml_skus() reads. Their (mtime, size) stamps key the cache below
+# so an edited YAML is picked up on the next call without an app restart.
+_SKU_SOURCE_FILES = (
+    PRODUCT_LINES_DIR / "patterns.yaml",
+    PRODUCT_LINES_DIR / "cable_lines.yaml",
+    PRODUCT_LINES_DIR / "back_office" / "economics.yaml",
+)
+
+# (stamp, lines) from the last load_yaml_skus() parse.
+_yaml_skus_cache = None
+
 
 def _load_economics():
     """Load back_office/economics.yaml → {prefix: {length: {price, cost, cost_ra, weight}}}.
@@ -31,7 +52,7 @@ def _load_economics():
     if not path.exists():
         return {}
     with open(path) as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_SafeLoader) or {}
     return data.get("series", {}) or {}
 
 
@@ -79,6 +100,19 @@ def _validate_economics(economics, cable_lines_data):
         raise ValueError("economics.yaml structural errors:\n  " + "\n  ".join(errors))
 
 
+def _source_stamp():
+    """Return (mtime_ns, size) per SKU source file; None for a missing file."""
+    stamp = []
+    for path in _SKU_SOURCE_FILES:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
 def load_yaml_skus():
     """Load all defined SKUs from YAML product line files.
 
@@ -89,14 +123,32 @@ def load_yaml_skus():
       back_office/economics.yaml — back-office: price + cost + cost_ra + weight
                                    per (series, length) (merged pricing+weights)
 
-    Returns dict: sku_prefix -> {name, lengths, connectors, patterns, pricing, cost, weight}.
+    Returns dict: sku_prefix -> {name, lengths, connectors, patterns, pricing, cost, weight,
+    sku_index, sku_index_by_conn}.
     The pricing/cost/weight sub-dicts keep the pre-consolidation shape (cost
     carries '{length}R' keys for right-angle) so downstream callers are
     unchanged — only the source file changed.
+
+    sku_index is every catalog SKU of the line in (length, pattern, connector)
+    order as {sku, length, pattern_code, conn_code, price, cost, margin}
+    (margin is None unless both price and cost are known);
+    sku_index_by_conn splits the same entries by connector code, keeping the
+    (length, pattern) order.
+
+    The parsed result is cached until one of the source files changes on disk
+    (mtime or size), and every caller shares it, so repeat calls cost a stat
+    per file — no parse and no copy. Only the top-level prefix mapping is
+    read-only; the per-line dicts and their lists are the shared cached
+    objects, so treat them as read-only and copy before modifying.
     """
+    global _yaml_skus_cache
+    stamp = _source_stamp()
+    if _yaml_skus_cache is not None and _yaml_skus_cache[0] == stamp:
+        return _yaml_skus_cache[1]
+
     patterns_path = PRODUCT_LINES_DIR / "patterns.yaml"
     with open(patterns_path) as f:
-        patterns_data = yaml.safe_load(f)
+        patterns_data = yaml.load(f, Loader=_SafeLoader)
 
     patterns_by_fabric = defaultdict(list)
     for p in patterns_data["patterns"]:
@@ -104,7 +156,7 @@ def load_yaml_skus():
 
     cable_lines_path = PRODUCT_LINES_DIR / "cable_lines.yaml"
     with open(cable_lines_path) as f:
-        cable_lines_data = yaml.safe_load(f) or {}
+        cable_lines_data = yaml.load(f, Loader=_SafeLoader) or {}
 
     economics = _load_economics()
     _validate_economics(economics, cable_lines_data)
@@ -133,7 +185,7 @@ def load_yaml_skus():
             if entry.get("weight") is not None:
                 weight[length] = entry["weight"]
 
-        lines[prefix] = {
+        line = {
             "name": data["product_line"],
             "lengths": data["lengths"],
             "connectors": data.get("connectors", [{"code": "", "display": ""}]),
@@ -142,9 +194,58 @@ def load_yaml_skus():
             "cost": cost,
             "weight": weight,
         }
+        _index_line_skus(prefix, line)
+        lines[prefix] = line
+    lines = MappingProxyType(lines)
+    _yaml_skus_cache = (stamp, lines)
     return lines
 
 
+def reload_yaml_skus():
+    """Drop the cached product lines and re-parse the YAML now.
+
+    load_yaml_skus() already notices edits via file stamps; this is for
+    forcing a reload when a stamp can't be trusted (e.g. a file replaced
+    within the same mtime tick at the same size).
+    """
+    global _yaml_skus_cache
+    _yaml_skus_cache = None
+    return load_yaml_skus()
+
+
+def _index_line_skus(prefix, line):
+    """Attach sku_index / sku_index_by_conn to a loaded line (see load_yaml_skus)."""
+    # Price/cost/margin depend only on (length, connector), not pattern.
+    economics = {}
+    for length in line["lengths"]:
+        price = line["pricing"].get(length, 0)
+        for conn in line["connectors"]:
+            cost = get_cost(line, length, conn["code"])
+            margin = (price - cost) if price and cost else None
+            economics[length, conn["code"]] = (price, cost, margin)
+
+    index = []
+    by_conn = {conn["code"]: [] for conn in line["connectors"]}
+    for length, pattern, conn in itertools.product(
+        line["lengths"], line["patterns"], line["connectors"]
+    ):
+        price, cost, margin = economics[length, conn["code"]]
+        entry = {
+            "sku": build_sku(prefix, length, pattern["code"], conn["code"]),
+            "length": length,
+            "pattern_code": pattern["code"],
+            "conn_code": conn["code"],
+            "price": price,
+            "cost": cost,
+            "margin": margin,
+        }
+        index.append(entry)
+        by_conn[conn["code"]].append(entry)
+    line["sku_index"] = index
+    line["sku_index_by_conn"] = by_conn
+
+
+@functools.lru_cache(maxsize=4096)
 def build_sku(prefix, length, pattern_code, connector_code):
     """Build a SKU string from components."""
     base = f"{prefix}-{length}{pattern_code}"
@@ -53,9 +53,7 @@ from greenlight.screens.shopify_scan import (
 # Settings screens
 from greenlight.screens.settings import (
     SettingsScreen,
-    DatabaseSettingsScreen,
-    UserManagementScreen,
-    SystemInfoScreen
+    PlaceholderScreen
 )
 
 __all__ = [
@@ -85,7 +83,5 @@ __all__ = [
     'ProductionSuggestionsScreen',
     # Settings
     'SettingsScreen',
-    'DatabaseSettingsScreen',
-    'UserManagementScreen',
-    'SystemInfoScreen',
+    'PlaceholderScreen',
 ]
@@ -3,23 +3,55 @@ import logging
 
 logger = logging.getLogger(__name__)
 import sys
-import termios
-import tty
 import readline
 import re
+from contextlib import contextmanager
 
 from greenlight.screen_manager import Screen, ScreenResult, NavigationAction
 from greenlight.config import APP_NAME, EXIT_MESSAGE
 from greenlight.cable import (
-    CableType, get_all_skus, filter_skus, get_distinct_series,
-    get_distinct_color_patterns, get_distinct_lengths, get_distinct_connector_types,
-    resolve_catalog_variant,
+    CableType, get_distinct_series, get_distinct_color_patterns,
+    resolve_catalog_variant, get_catalog_matrix,
 )
-from greenlight.db import get_audio_cable, register_scanned_cable, format_serial_number, update_cable_test_results
+from greenlight.cable_config import (
+    series_data_for_prefix, prefix_for_series, finish_display,
+    finish_tests_shell, format_variant_sku, CONNECTOR_FINISHES,
+)
+from greenlight.db import (
+    get_audio_cable, register_scanned_cable, format_serial_number,
+    validate_serial_number, update_cable_test_results, update_cable_description,
+    get_available_count_for_sku, batch_assign_registration_codes, unassign_cable,
+    search_misc_variants, get_or_create_misc_sku, list_ltd_editions,
+)
+from greenlight.hardware.barcode_scanner import get_scanner
+from greenlight.hardware.interfaces import hardware_manager, PrintJob
+from greenlight.registration import generate_registration_url
 from rich.table import Table
+import select
 import time
 
 
+# Single-key quit check without allocating a lowercased copy of the input.
+_QUIT_KEYS = frozenset(('q', 'Q'))
+
+
+@contextmanager
+def _readline_prefill(text):
+    """Pre-fill the next input() line with `text` so the operator can edit it.
+
+    No-op when there is nothing to pre-fill, so the common prompt path never
+    touches readline's startup hook.
+    """
+    if not text:
+        yield
+        return
+    readline.set_startup_hook(lambda: readline.insert_text(text))
+    try:
+        yield
+    finally:
+        readline.set_startup_hook(None)
+
+
 def _calc_milliohms(adc_value, cal_adc):
     """Derive cable resistance in milliohms from ADC values.
 
@@ -47,9 +79,6 @@ class CableScreenBase(Screen):
         Does NOT clear the scanner queue internally — callers should clear
         at the start of their main loop if needed.
         """
-        from greenlight.hardware.barcode_scanner import get_scanner
-        import select
-        import sys
 
         scanner = get_scanner()
 
@@ -67,24 +96,28 @@ class CableScreenBase(Screen):
             # No timeout - user must explicitly quit with 'q'
             logger.info("Waiting for scan or manual input...")
 
+            watched = [sys.stdin, scanner] if scanner_available else [sys.stdin]
             while True:
-                # Check for scanned barcode
+                # Take anything already queued before blocking
                 if scanner_available:
-                    barcode = scanner.get_scan(timeout=0.1)
+                    barcode = scanner.get_scan(timeout=0)
                     if barcode:
                         serial_number = barcode.strip().upper()
                         logger.info(f"Scanned barcode: {serial_number}")
                         return serial_number
 
+                # Block until a scan is queued or a line is typed — the
+                # scanner's wakeup pipe makes it selectable next to stdin, so
+                # neither path waits on a poll interval.
+                ready = select.select(watched, [], [])[0]
+
                 # Check for manual keyboard input
-                if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
+                if sys.stdin in ready:
                     line = sys.stdin.readline().strip().upper()
                     if line:
                         logger.info(f"Manual input: {line}")
                         return line
 
-                time.sleep(0.1)  # Small sleep to prevent busy-waiting
-
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt during scan")
             return None
@@ -265,7 +298,6 @@ class CableScreenBase(Screen):
             operator: Operator ID
             cable_record: Cable record from database
         """
-        from greenlight.hardware.interfaces import hardware_manager
 
         cable_tester = hardware_manager.get_cable_tester()
         if not cable_tester:
@@ -366,7 +398,6 @@ class CableScreenBase(Screen):
         kind = cable_record.get('kind')
         if all_passed and kind != 'ltd':
             try:
-                from greenlight.db import get_available_count_for_sku
                 variant_sku = cable_record['variant_sku']
                 count = get_available_count_for_sku(variant_sku)
                 if kind == 'misc':
@@ -404,7 +435,6 @@ class CableScreenBase(Screen):
             operator: Operator ID
             cable_record: Cable record from database
         """
-        from greenlight.hardware.interfaces import hardware_manager
 
         cable_tester = hardware_manager.get_cable_tester()
         if not cable_tester:
@@ -422,7 +452,6 @@ class CableScreenBase(Screen):
         # Custom/LTD builds can use any connector, so an explicit per-cable
         # connector_finish overrides that assumption: black/gold Neutrik shells
         # are non-conductive (skip) while nickel shells bond (test).
-        from greenlight.cable_config import finish_tests_shell
         connector_finish = cable_record.get('connector_finish')
         if connector_finish:
             should_test_shell = finish_tests_shell(connector_finish)
@@ -570,7 +599,6 @@ class CableScreenBase(Screen):
         # LTD cables aren't sold via Shopify so they have no product to sync.
         if all_passed and not is_ltd:
             try:
-                from greenlight.db import get_available_count_for_sku
                 variant_sku = cable_record['variant_sku']
                 count = get_available_count_for_sku(variant_sku)
                 if is_misc:
@@ -749,13 +777,11 @@ class CableScreenBase(Screen):
 
     def run_manual_calibration(self, operator):
         """Run manual TS and XLR calibration from the main scan screen"""
-        from greenlight.hardware.interfaces import hardware_manager
 
         cable_tester = hardware_manager.get_cable_tester()
         if not cable_tester or not cable_tester.connected:
             return
 
-        self.ui.console.clear()
         self.ui.header(operator)
         self.ui.layout["body"].update(Panel(
             "[bold cyan]Cable Tester Calibration[/bold cyan]\n\n"
@@ -855,7 +881,7 @@ class CableScreenBase(Screen):
             "\n".join(results),
             title="Calibration Complete", border_style="green"
         ))
-        self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+        self.ui.back_footer()
         self.ui.render()
 
         try:
@@ -870,7 +896,6 @@ class CableScreenBase(Screen):
             operator: Operator ID
             cable_record: Cable record from database
         """
-        from greenlight.hardware.interfaces import hardware_manager, PrintJob
 
         label_printer = hardware_manager.get_label_printer()
         if not label_printer:
@@ -933,9 +958,6 @@ class CableScreenBase(Screen):
         Returns:
             The (possibly updated) cable record.
         """
-        from greenlight.hardware.interfaces import hardware_manager, PrintJob
-        from greenlight.registration import generate_registration_url
-        from greenlight.db import batch_assign_registration_codes
 
         label_printer = hardware_manager.get_label_printer()
         if not label_printer:
@@ -979,7 +1001,6 @@ class CableScreenBase(Screen):
 
     def _flash_message(self, operator, cable_record, message):
         """Briefly show a message in the footer over the cable info panel."""
-        self.ui.console.clear()
         self.ui.header(operator)
         self.ui.layout["body"].update(self.build_cable_info_panel(cable_record))
         self.ui.layout["footer"].update(Panel(f"{message}\nPress Enter to continue", title=""))
@@ -1003,15 +1024,11 @@ class CableScreenBase(Screen):
         current_desc = cable_record.get('description', '')
         is_misc_variant = cable_record.get('kind') == 'misc'
 
-        self.ui.console.clear()
-        self.ui.header(operator)
-
         max_desc_len = 90
         prefill_text = None
 
         try:
             while True:
-                self.ui.console.clear()
                 self.ui.header(operator)
 
                 prompt_text = f"Serial: {serial_number}\n\n"
@@ -1031,15 +1048,8 @@ class CableScreenBase(Screen):
                 self.ui.render()
 
                 # Pre-fill input with previous too-long text so user can edit in place
-                if prefill_text:
-                    readline.set_startup_hook(lambda: readline.insert_text(prefill_text))
-                else:
-                    readline.set_startup_hook(None)
-
-                try:
+                with _readline_prefill(prefill_text):
                     new_desc = self.ui.console.input("").strip()
-                finally:
-                    readline.set_startup_hook(None)
 
                 if not new_desc:
                     return cable_record
@@ -1048,7 +1058,6 @@ class CableScreenBase(Screen):
                     prefill_text = new_desc
                     continue
 
-                from greenlight.db import update_cable_description, get_audio_cable
                 if update_cable_description(serial_number, new_desc):
                     updated = get_audio_cable(serial_number)
                     if updated:
@@ -1066,7 +1075,7 @@ class CableScreenBase(Screen):
 
     def _unassign_cable(self, operator, cable_record):
         """Prompt for confirmation and unassign a cable from its customer/order."""
-        from greenlight import shopify_client, db as db_mod
+        from greenlight import shopify_client
 
         serial = cable_record['serial_number']
         customer_gid = cable_record.get('shopify_gid', '')
@@ -1075,11 +1084,8 @@ class CableScreenBase(Screen):
         customer_name = "unknown customer"
         try:
             if customer_gid:
-                customer_numeric_id = customer_gid.split('/')[-1]
-                customer = shopify_client.get_customer_by_id(customer_numeric_id)
-                if customer:
-                    customer_name = customer.get('displayName') or customer_name
-        except:
+                customer_name = shopify_client.get_customer_display_name(customer_gid) or customer_name
+        except Exception:
             pass
 
         has_order = bool(cable_record.get('shopify_order_gid'))
@@ -1107,7 +1113,7 @@ class CableScreenBase(Screen):
         if choice not in ('y', 'yes'):
             return
 
-        result = db_mod.unassign_cable(serial)
+        result = unassign_cable(serial)
         if result.get('success'):
             # Cable is back in the available pool — push the higher count to Shopify.
             from greenlight.shopify_client import sync_inventory_for_cable
@@ -1123,30 +1129,29 @@ class CableScreenBase(Screen):
                 f"[red]Error: {result.get('message', 'Unknown error')}[/red]",
                 title="Error"
             ))
-        self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+        self.ui.back_footer()
         self.ui.render()
         self.ui.wait_back()
 
-    def cable_action_loop(self, operator, cable_record, mode='lookup'):
+    def cable_action_loop(self, operator, cable_record, mode='lookup', status=None):
         """Show cable info + action menu. Loops until quit or new scan.
 
         mode='lookup': shows assign + re-register options
         mode='intake': no assign/re-register options
+        status: optional one-line result (e.g. "Saved to database") shown
+            above the options on the first render only
 
         Returns:
             {'action': 'quit'}
             {'action': 'scan', 'serial': '...'}
             {'action': 'navigate', 'screen_result': ScreenResult}
         """
-        from greenlight.hardware.interfaces import hardware_manager
-        from greenlight.db import get_audio_cable
 
         while True:
             # Reload cable record each iteration to show updated info
             cable_record = get_audio_cable(cable_record['serial_number']) or cable_record
 
             # Display cable info
-            self.ui.console.clear()
             self.ui.header(operator)
             cable_info_panel = self.build_cable_info_panel(cable_record)
             self.ui.layout["body"].update(cable_info_panel)
@@ -1180,7 +1185,11 @@ class CableScreenBase(Screen):
             footer_options.append("[bold green]Scan[/bold green] next cable")
             footer_options.append("[cyan]'q'[/cyan] = Back")
 
-            self.ui.layout["footer"].update(Panel(" | ".join(footer_options), title="Options"))
+            footer_text = " | ".join(footer_options)
+            if status:
+                footer_text = f"{status}\n{footer_text}"
+                status = None
+            self.ui.layout["footer"].update(Panel(footer_text, title="Options"))
             self.ui.render()
 
             try:
@@ -1251,17 +1260,13 @@ class ScanCableLookupScreen(CableScreenBase):
 
     def enter(self):
         """Publish scanning status while operator is active"""
-        from greenlight.hardware.barcode_scanner import get_scanner
         scanner = get_scanner()
-        if hasattr(scanner, 'set_scanning_active'):
-            scanner.set_scanning_active(True)
+        scanner.set_scanning_active(True)
 
     def exit(self):
         """Publish idle status when operator logs out"""
-        from greenlight.hardware.barcode_scanner import get_scanner
         scanner = get_scanner()
-        if hasattr(scanner, 'set_scanning_active'):
-            scanner.set_scanning_active(False)
+        scanner.set_scanning_active(False)
 
     def run(self) -> ScreenResult:
         operator = self.context.get("operator", "")
@@ -1273,11 +1278,12 @@ class ScanCableLookupScreen(CableScreenBase):
         if return_to_cable:
             # Clear the return flag
             self.context.pop("return_to_cable_serial", None)
+            return_status = self.context.pop("return_to_cable_status", None)
             # Load and show the cable details
-            from greenlight.db import get_audio_cable
             cable_record = get_audio_cable(return_to_cable)
             if cable_record:
-                result = self.cable_action_loop(operator, cable_record, mode='lookup')
+                result = self.cable_action_loop(operator, cable_record, mode='lookup',
+                                                status=return_status)
                 if result['action'] == 'navigate':
                     return result['screen_result']
                 elif result['action'] == 'scan':
@@ -1285,7 +1291,6 @@ class ScanCableLookupScreen(CableScreenBase):
                 # 'quit' falls through to continue scanning
 
         # Clear scanner queue at session start
-        from greenlight.hardware.barcode_scanner import get_scanner
         scanner = get_scanner()
         if scanner.initialize():
             scanner.clear_queue()
@@ -1309,7 +1314,6 @@ class ScanCableLookupScreen(CableScreenBase):
                 self._pending_serial = None
             else:
                 # Check if cable tester is available for calibrate option
-                from greenlight.hardware.interfaces import hardware_manager
                 cable_tester = hardware_manager.get_cable_tester()
                 tester_available = cable_tester.connected if cable_tester else False
 
@@ -1392,19 +1396,14 @@ class ScanCableLookupScreen(CableScreenBase):
                 continue
 
             # Validate input looks like a serial number (must be numeric)
-            from greenlight.db import validate_serial_number
             valid, _ = validate_serial_number(serial_number)
             if not valid:
                 continue
 
             # Otherwise treat as serial number lookup
-            from greenlight.db import format_serial_number, get_audio_cable
             formatted_serial = format_serial_number(serial_number)
             cable_record = get_audio_cable(formatted_serial)
 
-            # Clear console to refresh with new info
-            self.ui.console.clear()
-
             if cable_record:
                 # Show cable info and handle user actions
                 result = self.cable_action_loop(operator, cable_record, mode='lookup')
@@ -1476,7 +1475,7 @@ class SeriesSelectionScreen(Screen):
         if not series_options:
             self.ui.header(operator)
             self.ui.layout["body"].update(Panel("No series found in database", title="Error", style="red"))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -1494,6 +1493,7 @@ class SeriesSelectionScreen(Screen):
         # for the chosen series.
         menu_items = [series_display.get(s, s) for s in series_options]
         menu_items.append("Back (q)")
+        back_choice = str(len(menu_items))
 
         rows = [
             f"[green]{i + 1}.[/green] {name}"
@@ -1513,7 +1513,7 @@ class SeriesSelectionScreen(Screen):
             sys.exit(0)
 
         # Handle back/quit
-        if choice.lower() == "q" or choice == str(len(menu_items)):
+        if choice in _QUIT_KEYS or choice == back_choice:
             return ScreenResult(NavigationAction.POP)
 
         # Handle series selection
@@ -1530,7 +1530,7 @@ class SeriesSelectionScreen(Screen):
 
         # Invalid choice - brief feedback, then re-display
         self.ui.console.print("[red]Invalid choice[/red]")
-        import time; time.sleep(0.5)
+        time.sleep(0.5)
         return ScreenResult(NavigationAction.REPLACE, SeriesSelectionScreen, self.context)
 
 
@@ -1544,8 +1544,6 @@ class LtdEditionPickerScreen(Screen):
     def run(self) -> ScreenResult:
         operator = self.context.get("operator", "")
         selected_series = self.context.get("selected_series")
-        from greenlight.db import list_ltd_editions
-        from greenlight.cable_config import prefix_for_series
 
         # LTD editions are series-agnostic (Phase 5): the series picked
         # earlier in the flow only drives the per-cable prefix attached at
@@ -1562,10 +1560,7 @@ class LtdEditionPickerScreen(Screen):
                 "to scan cables against it.",
                 title="Limited Edition Picker", border_style="yellow"
             ))
-            self.ui.layout["footer"].update(Panel(
-                "[green]q.[/green] Back",
-                title=""
-            ))
+            self.ui.back_footer()
             self.ui.render()
             try:
                 self.ui.wait_back()
@@ -1625,7 +1620,7 @@ class LtdEditionPickerScreen(Screen):
                     f"❌ Error loading SKU {selected_sku}: {e}",
                     title="Error", style="red"
                 ))
-                self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+                self.ui.back_footer()
                 self.ui.render()
                 self.ui.wait_back()
                 return ScreenResult(NavigationAction.POP)
@@ -1653,7 +1648,7 @@ class ColorPatternSelectionScreen(Screen):
         if not color_options:
             self.ui.header(operator)
             self.ui.layout["body"].update(Panel(f"No color patterns found for {selected_series}", title="Error", style="red"))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -1666,6 +1661,7 @@ class ColorPatternSelectionScreen(Screen):
         menu_items.append(SPECIAL_BABY_OPTION)
         menu_items.append(LIMITED_EDITION_OPTION)
         menu_items.append("Back (q)")
+        back_choice = str(len(menu_items))
 
         rows = [
             f"[green]{i + 1}.[/green] {name}"
@@ -1680,7 +1676,7 @@ class ColorPatternSelectionScreen(Screen):
         choice = self.ui.console.input("Choose: ")
 
         # Handle back/quit
-        if choice.lower() == "q" or choice == str(len(menu_items)):
+        if choice in _QUIT_KEYS or choice == back_choice:
             return ScreenResult(NavigationAction.POP)
 
         # Handle selection
@@ -1704,7 +1700,7 @@ class ColorPatternSelectionScreen(Screen):
 
         # Invalid choice - brief feedback, then re-display
         self.ui.console.print("[red]Invalid choice[/red]")
-        import time; time.sleep(0.5)
+        time.sleep(0.5)
         return ScreenResult(NavigationAction.REPLACE, ColorPatternSelectionScreen, self.context)
 
 
@@ -1740,12 +1736,11 @@ class MiscVariantPickerScreen(Screen):
                 f"❌ Unknown series: {selected_series}",
                 title="Error", style="red"
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
 
-        from greenlight.db import search_misc_variants
         existing = search_misc_variants(series_prefix)
 
         body_lines = [
@@ -1811,7 +1806,7 @@ class MiscVariantPickerScreen(Screen):
                     f"❌ Error loading SKU {selected['sku']}: {e}",
                     title="Error", style="red"
                 ))
-                self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+                self.ui.back_footer()
                 self.ui.render()
                 self.ui.wait_back()
                 return ScreenResult(NavigationAction.POP)
@@ -1855,7 +1850,7 @@ class MiscVariantCreateScreen(Screen):
                 f"❌ Unknown series: {selected_series}",
                 title="Error", style="red"
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -1871,14 +1866,13 @@ class MiscVariantCreateScreen(Screen):
             return ScreenResult(NavigationAction.POP)
 
         # Resolve or create the MISC sku_group with both keys
-        from greenlight.db import get_or_create_misc_sku
         new_sku = get_or_create_misc_sku(series_prefix, description, length_value)
         if not new_sku:
             self.ui.layout["body"].update(Panel(
                 "❌ Failed to create MISC variant SKU. Check logs.",
                 title="Error", style="red"
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -1891,7 +1885,7 @@ class MiscVariantCreateScreen(Screen):
                 f"❌ Error loading new SKU {new_sku}: {e}",
                 title="Error", style="red"
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -1932,17 +1926,10 @@ class MiscVariantCreateScreen(Screen):
                     ))
                 self.ui.render()
 
-                if prefill_text:
-                    readline.set_startup_hook(lambda: readline.insert_text(prefill_text))
-                else:
-                    readline.set_startup_hook(None)
-
-                try:
+                with _readline_prefill(prefill_text):
                     description = self.ui.console.input("Description: ").strip()
-                finally:
-                    readline.set_startup_hook(None)
 
-                if description.lower() == 'q' or not description:
+                if description in _QUIT_KEYS or not description:
                     return None
 
                 if len(description) <= max_desc_len:
@@ -1973,7 +1960,7 @@ class MiscVariantCreateScreen(Screen):
         except KeyboardInterrupt:
             return None
 
-        if length_input.lower() == 'q' or not length_input:
+        if length_input in _QUIT_KEYS or not length_input:
             return None
 
         try:
@@ -2032,7 +2019,7 @@ class VariantLengthEntryScreen(Screen):
         except KeyboardInterrupt:
             return ScreenResult(NavigationAction.POP)
 
-        if length_input.lower() == 'q' or not length_input:
+        if length_input in _QUIT_KEYS or not length_input:
             return ScreenResult(NavigationAction.POP)
 
         try:
@@ -2061,12 +2048,15 @@ class LengthSelectionScreen(Screen):
         operator = self.context.get("operator", "")
         selected_series = self.context.get("selected_series")
         selected_color = self.context.get("selected_color_pattern")
-        length_options = get_distinct_lengths(selected_series, selected_color)
+        # Resolve the whole length × connector grid once; the connector
+        # screen picks its SKU out of this instead of resolving again.
+        cable_matrix = get_catalog_matrix(selected_series, selected_color)
+        length_options = list(cable_matrix)
 
         if not length_options:
             self.ui.header(operator)
             self.ui.layout["body"].update(Panel(f"No lengths found for {selected_series} {selected_color}", title="Error", style="red"))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -2074,6 +2064,7 @@ class LengthSelectionScreen(Screen):
         # Create menu items
         menu_items = [f"{length} ft" for length in length_options]
         menu_items.append("Back (q)")
+        back_choice = str(len(menu_items))
 
         rows = [
             f"[green]{i + 1}.[/green] {name}"
@@ -2088,7 +2079,7 @@ class LengthSelectionScreen(Screen):
         choice = self.ui.console.input("Choose: ")
 
         # Handle back/quit
-        if choice.lower() == "q" or choice == str(len(menu_items)):
+        if choice in _QUIT_KEYS or choice == back_choice:
             return ScreenResult(NavigationAction.POP)
 
         # Handle length selection
@@ -2098,6 +2089,7 @@ class LengthSelectionScreen(Screen):
                 selected_length = length_options[choice_idx]
                 new_context = self.context.copy()
                 new_context["selected_length"] = selected_length
+                new_context["cable_matrix"] = cable_matrix
                 # Always go through connector selection — it handles the
                 # auto-skip case for single-connector series internally.
                 return ScreenResult(NavigationAction.REPLACE, ConnectorTypeSelectionScreen, new_context)
@@ -2106,25 +2098,31 @@ class LengthSelectionScreen(Screen):
 
         # Invalid choice - brief feedback, then re-display
         self.ui.console.print("[red]Invalid choice[/red]")
-        import time; time.sleep(0.5)
+        time.sleep(0.5)
         return ScreenResult(NavigationAction.REPLACE, LengthSelectionScreen, self.context)
 
 
+def _connector_sort_key(connector):
+    """Sort key placing straight connectors before right-angle ('-R') ones.
+
+    The connector code is exactly '' or '-R', so an equality test replaces
+    the per-element startswith call.
+    """
+    return (connector.get('code') == '-R', connector.get('display') or '')
+
+
 class ConnectorTypeSelectionScreen(Screen):
     """Pick a connector type. Handles both catalog and variant (MISC/LTD) flows.
 
     Catalog: came via series → pattern → length, no cable_type in context.
-        Resolves (sku_group, length, connector_code) via resolve_catalog_variant
-        at exit and routes to scan.
+        Looks up (sku_group, length, connector_code) in the cable_matrix
+        LengthSelectionScreen left in context and routes to scan.
 
     Variant (MISC/LTD): came via picker → length entry, cable_type already in
         context. Just captures connector_code and routes to scan.
     """
 
     def run(self) -> ScreenResult:
-        from greenlight.cable_config import (
-            series_data_for_prefix, prefix_for_series, connector_display_for,
-        )
         operator = self.context.get("operator", "")
         selected_length = self.context.get("selected_length")
         cable_type = self.context.get("cable_type")
@@ -2145,7 +2143,7 @@ class ConnectorTypeSelectionScreen(Screen):
         series_data = series_data_for_prefix(prefix) if prefix else None
         connectors = (series_data or {}).get('connectors') or []
         # Sort straight (code='') before right-angle (code='-R')
-        connectors = sorted(connectors, key=lambda c: ((c.get('code') or '').startswith('-R'), c.get('display') or ''))
+        connectors = sorted(connectors, key=_connector_sort_key)
 
         if not connectors:
             self.ui.header(operator)
@@ -2153,7 +2151,7 @@ class ConnectorTypeSelectionScreen(Screen):
                 "No connector types found for the selected series",
                 title="Error", style="red"
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -2164,6 +2162,7 @@ class ConnectorTypeSelectionScreen(Screen):
 
         menu_items = [c.get('display') or '?' for c in connectors]
         menu_items.append("Back (q)")
+        back_choice = str(len(menu_items))
         rows = [f"[green]{i + 1}.[/green] {name}" for i, name in enumerate(menu_items)]
 
         body_lines = [f"Series: {series_label}"]
@@ -2180,7 +2179,7 @@ class ConnectorTypeSelectionScreen(Screen):
         self.ui.render()
 
         choice = self.ui.console.input("Choose: ")
-        if choice.lower() == "q" or choice == str(len(menu_items)):
+        if choice in _QUIT_KEYS or choice == back_choice:
             return ScreenResult(NavigationAction.POP)
 
         try:
@@ -2217,15 +2216,18 @@ class ConnectorTypeSelectionScreen(Screen):
         selected_series = self.context.get("selected_series")
         selected_color = self.context.get("selected_color_pattern")
         selected_length = self.context.get("selected_length")
-        result = resolve_catalog_variant(
-            selected_series, selected_color, selected_length, connector_display,
-        )
+        cable_matrix = self.context.get("cable_matrix") or {}
+        result = cable_matrix.get(selected_length, {}).get(connector_display)
+        if result is None:
+            result = resolve_catalog_variant(
+                selected_series, selected_color, selected_length, connector_display,
+            )
         if not result:
             self.ui.layout["body"].update(Panel(
                 "Could not resolve a SKU for the selected attributes",
                 title="Error", style="red",
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -2240,7 +2242,7 @@ class ConnectorTypeSelectionScreen(Screen):
             self.ui.layout["body"].update(Panel(
                 f"Error loading sku_group: {e}", title="Error", style="red",
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -2265,7 +2267,6 @@ class ConnectorFinishSelectionScreen(Screen):
     FINISH_ORDER = ['nickel', 'black_gold']
 
     def run(self) -> ScreenResult:
-        from greenlight.cable_config import CONNECTOR_FINISHES
         operator = self.context.get("operator", "")
         cable_type = self.context.get("cable_type")
         selected_length = self.context.get("selected_length")
@@ -2275,6 +2276,7 @@ class ConnectorFinishSelectionScreen(Screen):
                     for code in self.FINISH_ORDER if code in CONNECTOR_FINISHES]
         menu_items = [disp for _, disp in finishes]
         menu_items.append("Back (q)")
+        back_choice = str(len(menu_items))
         rows = [f"[green]{i + 1}.[/green] {name}" for i, name in enumerate(menu_items)]
 
         body_lines = []
@@ -2299,7 +2301,7 @@ class ConnectorFinishSelectionScreen(Screen):
         # Enter accepts the default (first finish = nickel).
         if choice == "":
             return self._finish(finishes[0][0])
-        if choice == "q" or choice == str(len(menu_items)):
+        if choice == "q" or choice == back_choice:
             return ScreenResult(NavigationAction.POP)
         try:
             idx = int(choice) - 1
@@ -2322,6 +2324,10 @@ class ConnectorFinishSelectionScreen(Screen):
 # Additional Cable Screens (from new_screens.py)
 # ============================================================================
 
+# How long a scan result stays in the intake footer's status row. Only
+# consulted on the next render — nothing sleeps on it.
+STATUS_ROW_SECONDS = 5.0
+
 
 class ScanCableIntakeScreen(CableScreenBase):
     """Screen for scanning cables and registering them in the database"""
@@ -2336,7 +2342,7 @@ class ScanCableIntakeScreen(CableScreenBase):
         if not cable_type or not cable_type.is_loaded():
             self.ui.header(operator)
             self.ui.layout["body"].update(Panel("No cable type selected", title="Error", style="red"))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -2348,7 +2354,7 @@ class ScanCableIntakeScreen(CableScreenBase):
                 "Go back and complete the selection.",
                 title="Missing variant attrs", style="red",
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -2369,65 +2375,79 @@ class ScanCableIntakeScreen(CableScreenBase):
                 builds (e.g. 'nickel', 'black_gold'); None for catalog.
         """
         scanned_count = 0
+        count_suffix = 's'  # "0 cables"; kept in step with scanned_count
         scanned_serials = []
+        # Outcome of the last scan, shown as a status row on the next render
+        # rather than holding the loop in a sleep so the operator can see it.
+        status = None
+        status_until = 0.0
         # Use prefilled serial from "not found → register" flow if available
         self._pending_serial = self.context.get("prefill_serial")
 
         # Clear scanner queue at session start
-        from greenlight.hardware.barcode_scanner import get_scanner
         scanner = get_scanner()
         if scanner.initialize():
             scanner.clear_queue()
 
+        # The cable type block is fixed for the whole session; only the
+        # scanned count / recent list below it changes.
+        length_for_format = int(length) if isinstance(length, float) and length.is_integer() else length
+        variant_sku = format_variant_sku(
+            group_sku=cable_type.sku_group, prefix=cable_type.prefix,
+            length=length_for_format, connector_code=connector_code,
+        ) or cable_type.sku_group
+        type_info = (
+            f"[bold cyan]Cable Type:[/bold cyan] {cable_type.name()}\n"
+            f"[bold cyan]SKU:[/bold cyan] {variant_sku}\n"
+            f"[bold cyan]Length:[/bold cyan] {_format_length(length)}"
+        )
+        if connector_code == '-R':
+            type_info += "  [dim](right-angle)[/dim]"
+        if connector_finish:
+            fin = finish_display(connector_finish)
+            if fin:
+                type_info += f"\n[bold cyan]Finish:[/bold cyan] {fin}"
+        type_info += "\n"
+        if cable_type.kind in ('misc', 'ltd') and cable_type.description:
+            type_info += f"[bold cyan]Description:[/bold cyan] {cable_type.description}\n"
+
+        # Body panel is rebuilt only when the count changes; otherwise the
+        # cached one is re-attached (cable_action_loop swaps the body out).
+        body_panel = None
+        body_dirty = True
+
         while True:
             # Check if we have a pending serial from cable_action_loop
             if self._pending_serial:
                 serial_number = self._pending_serial
                 self._pending_serial = None
             else:
-                # Clear console before rendering to avoid layout corruption
-                self.ui.console.clear()
-
                 # Show current status
                 self.ui.header(operator)
 
-                from greenlight.cable_config import format_variant_sku
-                length_for_format = int(length) if isinstance(length, float) and length.is_integer() else length
-                variant_sku = format_variant_sku(
-                    group_sku=cable_type.sku_group, prefix=cable_type.prefix,
-                    length=length_for_format, connector_code=connector_code,
-                ) or cable_type.sku_group
-                scan_info = (
-                    f"[bold cyan]Cable Type:[/bold cyan] {cable_type.name()}\n"
-                    f"[bold cyan]SKU:[/bold cyan] {variant_sku}\n"
-                    f"[bold cyan]Length:[/bold cyan] {_format_length(length)}"
-                )
-                if connector_code == '-R':
-                    scan_info += "  [dim](right-angle)[/dim]"
-                if connector_finish:
-                    from greenlight.cable_config import finish_display
-                    fin = finish_display(connector_finish)
-                    if fin:
-                        scan_info += f"\n[bold cyan]Finish:[/bold cyan] {fin}"
-                scan_info += "\n"
-                if cable_type.kind in ('misc', 'ltd') and cable_type.description:
-                    scan_info += f"[bold cyan]Description:[/bold cyan] {cable_type.description}\n"
-                scan_info += f"\n[bold yellow]Scanned:[/bold yellow] {scanned_count} cable{'s' if scanned_count != 1 else ''}"
-                if scanned_serials:
-                    recent = scanned_serials[-5:]
-                    scan_info += f"\n[dim]Recent: {', '.join(recent)}[/dim]"
-
-                self.ui.layout["body"].update(Panel(
-                    scan_info,
-                    title="📦 Register Cables",
-                    subtitle="Scan barcode labels to register cables in database"
-                ))
+                if body_dirty:
+                    scan_info = type_info + f"\n[bold yellow]Scanned:[/bold yellow] {scanned_count} cable{count_suffix}"
+                    if scanned_serials:
+                        recent = scanned_serials[-5:]
+                        scan_info += f"\n[dim]Recent: {', '.join(recent)}[/dim]"
+                    body_panel = Panel(
+                        scan_info,
+                        title="📦 Register Cables",
+                        subtitle="Scan barcode labels to register cables in database"
+                    )
+                    body_dirty = False
+                self.ui.layout["body"].update(body_panel)
 
                 # Check if evdev scanner is available
                 scanner_available = scanner.is_connected() or scanner.initialize()
 
+                status_row = ""
+                if status and time.monotonic() < status_until:
+                    status_row = f"{status}\n"
+
                 if scanner_available:
                     self.ui.layout["footer"].update(Panel(
+                        f"{status_row}"
                         "🔍 [bold green]Ready - Scan barcode now[/bold green]\n"
                         "[bright_black]Barcode scanner active - scan label or type manually[/bright_black]\n"
                         "Type 'q' and press Enter to finish",
@@ -2435,6 +2455,7 @@ class ScanCableIntakeScreen(CableScreenBase):
                     ))
                 else:
                     self.ui.layout["footer"].update(Panel(
+                        f"{status_row}"
                         "⚠️  [yellow]Scanner not detected - manual entry mode[/yellow]\n"
                         "Enter serial number (or 'q' to finish)",
                         title="Manual Entry Mode", style="yellow"
@@ -2446,15 +2467,14 @@ class ScanCableIntakeScreen(CableScreenBase):
                 serial_number = self.get_serial_number_scan_or_manual()
 
             # Check for quit
-            if not serial_number or serial_number.lower() == 'q':
+            if not serial_number or serial_number in _QUIT_KEYS:
                 break
 
             # Validate serial number is numeric
-            from greenlight.db import validate_serial_number
             valid, error_msg = validate_serial_number(serial_number)
             if not valid:
-                self.ui.console.print(f"[red]⚠️  {error_msg}[/red]")
-                time.sleep(1.5)
+                status = f"[red]⚠️  {error_msg}[/red]"
+                status_until = time.monotonic() + STATUS_ROW_SECONDS
                 continue
 
             # Format the serial number (pad to 6 digits)
@@ -2478,31 +2498,31 @@ class ScanCableIntakeScreen(CableScreenBase):
             if result.get('success'):
                 # Successfully registered or updated
                 scanned_count += 1
+                count_suffix = '' if scanned_count == 1 else 's'
+                body_dirty = True
                 saved_serial = result['serial_number']  # Use the formatted serial from database
                 scanned_serials.append(saved_serial)
 
-                # Show success message (different for update vs new)
+                # Success message (different for update vs new) rides along
+                # as a status row on the next screen instead of a pause here
                 if result.get('updated'):
-                    success_msg = f"🔄 Updated in database: {saved_serial}"
+                    success_msg = f"[green]🔄 Updated in database: {saved_serial}[/green]"
                 else:
-                    success_msg = f"✅ Saved to database: {saved_serial}"
-
-                self.ui.layout["footer"].update(Panel(
-                    success_msg,
-                    title="Success", style="green"
-                ))
-                self.ui.render()
-                time.sleep(0.8)  # Brief pause to show success
+                    success_msg = f"[green]✅ Saved to database: {saved_serial}[/green]"
+                status = success_msg
+                status_until = time.monotonic() + STATUS_ROW_SECONDS
 
                 # Re-register mode: just update the one cable and return to its info screen
                 if self.context.get("re_register"):
                     self.context["return_to_cable_serial"] = saved_serial
+                    self.context["return_to_cable_status"] = success_msg
                     break
 
                 # Show cable info with action menu
                 cable_record = get_audio_cable(saved_serial)
                 if cable_record:
-                    action_result = self.cable_action_loop(operator, cable_record, mode='intake')
+                    action_result = self.cable_action_loop(operator, cable_record, mode='intake',
+                                                           status=success_msg)
                     if action_result['action'] == 'quit':
                         break
                     elif action_result['action'] == 'scan':
@@ -2530,7 +2550,7 @@ class ScanCableIntakeScreen(CableScreenBase):
                             ))
                             self.ui.render()
                             choice = self.get_serial_number_scan_or_manual()
-                            if not choice or choice.strip().lower() == 'q':
+                            if not choice or choice in _QUIT_KEYS:
                                 break
                             # Treat any other input as a new serial scan
                             self._pending_serial = choice.strip().upper()
@@ -2562,27 +2582,18 @@ class ScanCableIntakeScreen(CableScreenBase):
                             )
                             if update_result.get('success'):
                                 scanned_count += 1
+                                count_suffix = '' if scanned_count == 1 else 's'
+                                body_dirty = True
                                 saved_serial = update_result['serial_number']
                                 scanned_serials.append(saved_serial)
 
-                                self.ui.layout["footer"].update(Panel(
-                                    f"🔄 Updated in database: {saved_serial}",
-                                    title="Success", style="green"
-                                ))
-                                self.ui.render()
-                                time.sleep(0.8)
+                                status = f"[green]🔄 Updated in database: {saved_serial}[/green]"
+                                status_until = time.monotonic() + STATUS_ROW_SECONDS
                         # else: user chose 'skip', just continue to next scan
                         continue
                 else:
-                    error_display = f"❌ Error: {error_msg}"
-                    error_style = "red"
-
-                    self.ui.layout["footer"].update(Panel(
-                        error_display,
-                        title="Registration Error", style=error_style
-                    ))
-                    self.ui.render()
-                    time.sleep(1.5)  # Longer pause for errors
+                    status = f"[red]❌ Registration error: {error_msg}[/red]"
+                    status_until = time.monotonic() + STATUS_ROW_SECONDS
 
         # Go back to main scan screen
         return ScreenResult(NavigationAction.REPLACE, ScanCableLookupScreen, self.context)
@@ -1,46 +1,102 @@
 """Inventory dashboard, series heatmap, and production suggestion screens."""
 
-from collections import defaultdict
+import heapq
 
 from rich.panel import Panel
 from rich.table import Table
-from rich.text import Text
 from rich.columns import Columns
-from rich.console import Group
 
 from greenlight.screen_manager import Screen, ScreenResult, NavigationAction
 from greenlight.db import (
-    get_sku_stock_summary, get_recent_sales, get_misc_summary,
+    get_sku_stock_summary, get_series_rollup, get_recent_sales_windows, get_misc_summary,
     list_ltd_editions, get_cables_for_ltd_sku,
 )
 from greenlight import shopify_client
 from greenlight.product_lines import (
-    PREFIX_MAP, LOW_STOCK_THRESHOLD,
-    load_yaml_skus, build_sku, get_cost,
+    LOW_STOCK_THRESHOLD,
+    load_yaml_skus,
 )
 
 # Ordered list of prefixes for numbered menu
 SERIES_ORDER = ["SC", "SV", "TC", "TV"]
 
 
+# Style by availability count: none -> bold red, 1-5 -> yellow, more -> green.
+_AVAIL_STYLES = ("bold red",) + ("yellow",) * 5
+
+
 def _avail_style(n):
     """Return Rich style string for an availability count."""
-    if n == 0:
-        return "bold red"
-    elif n <= 5:
-        return "yellow"
-    return "green"
+    return _AVAIL_STYLES[n] if n < len(_AVAIL_STYLES) else "green"
+
+
+# Heatmap cell for a SKU with nothing available.
+_DOT = "[dim]\u00b7[/dim]"
+
+
+def _avail_cell(n):
+    """Return an availability count as a styled markup cell."""
+    return f"[{_avail_style(n)}]{n}[/]"
 
 
 class InventoryDashboardScreen(Screen):
     """Top-level inventory summary — one row per series."""
 
+    # Dashboard table and the (rollup, misc) data it was built from. Coming
+    # back from a sub-screen with unchanged stock reuses the table as-is.
+    _table_key = None
+    _table = None
+
     def run(self) -> ScreenResult:
         operator = self.context.get("operator", "")
-        yaml_lines = load_yaml_skus()
-        sku_counts = get_sku_stock_summary()
-        misc = get_misc_summary()
+        key = (get_series_rollup(), get_misc_summary())
+        if key != self._table_key:
+            self._table = self._build_table(load_yaml_skus(), *key)
+            self._table_key = key
+        table = self._table
+
+        footer_text = (
+            "[green]1.[/green] Studio (Rayon)   "
+            "[green]2.[/green] Tour (Cotton)   "
+            "[green]s.[/green] Suggestions   "
+            "[green]l.[/green] LTD Editions   "
+            "[green]q.[/green] Back"
+        )
 
+        self.ui.header(operator)
+        self.ui.layout["body"].update(table)
+        self.ui.layout["footer"].update(Panel(footer_text, title="Options"))
+        self.ui.render()
+
+        # Choice -> (screen, heatmap group or None). The screens are defined
+        # further down the module, so the table is built here.
+        targets = {
+            "1": (SeriesHeatmapScreen, "studio"),
+            "2": (SeriesHeatmapScreen, "tour"),
+            "s": (ProductionSuggestionsScreen, None),
+            "l": (LTDEditionListScreen, None),
+        }
+
+        # Unrecognized keys just re-prompt over the table already built,
+        # rather than re-querying and rebuilding the whole dashboard.
+        while True:
+            choice = self.ui.console.input("Choose: ").strip().lower()
+
+            target = targets.get(choice)
+            if target:
+                screen, group = target
+                ctx = self.context
+                if group:
+                    ctx = ctx.copy()
+                    ctx["heatmap_group"] = group
+                return ScreenResult(NavigationAction.PUSH, screen, ctx)
+            if choice == "q":
+                return ScreenResult(NavigationAction.POP)
+
+            self.ui.render()
+
+    def _build_table(self, yaml_lines, rollup, misc):
+        """Build the per-series summary table."""
         table = Table(title="Inventory Dashboard", show_header=True, header_style="bold cyan",
                       padding=(0, 1))
         table.add_column("#", justify="right", style="green", width=3)
@@ -62,33 +118,20 @@ class InventoryDashboardScreen(Screen):
                 continue
             name = f"{line['name']} ({prefix})"
 
-            s_avail = 0
-            s_sold = 0
-            s_fail = 0
-            s_total = 0
-            skus_with_stock = 0
-            total_skus = 0
-
-            for length in line["lengths"]:
-                for pattern in line["patterns"]:
-                    for conn in line["connectors"]:
-                        sku = build_sku(prefix, length, pattern["code"], conn["code"])
-                        total_skus += 1
-                        c = sku_counts.get(sku, {})
-                        avail = c.get("available", 0)
-                        s_avail += avail
-                        s_sold += c.get("sold", 0)
-                        s_fail += c.get("failed", 0)
-                        s_total += c.get("total", 0)
-                        if avail > 0:
-                            skus_with_stock += 1
+            r = rollup.get(prefix, {})
+            s_avail = r.get("available", 0)
+            s_sold = r.get("sold", 0)
+            s_fail = r.get("failed", 0)
+            s_total = r.get("total", 0)
+            skus_with_stock = r.get("skus_with_stock", 0)
+            total_skus = len(line["sku_index"])
 
             grand_avail += s_avail
             grand_sold += s_sold
             grand_fail += s_fail
             grand_total += s_total
 
-            avail_text = Text(str(s_avail), style=_avail_style(s_avail))
+            avail_text = _avail_cell(s_avail)
             coverage = f"{skus_with_stock}/{total_skus}"
 
             table.add_row(
@@ -105,7 +148,7 @@ class InventoryDashboardScreen(Screen):
         # Grand total row
         table.add_row(
             "", "[bold]TOTAL[/bold]",
-            Text(str(grand_avail), style="bold"),
+            f"[bold]{grand_avail}[/bold]",
             str(grand_sold) if grand_sold else "-",
             str(grand_fail) if grand_fail else "-",
             f"[bold]{grand_total}[/bold]",
@@ -119,44 +162,14 @@ class InventoryDashboardScreen(Screen):
         if misc_total > 0:
             table.add_row(
                 "", "[dim]Special Baby[/dim]",
-                Text(str(misc_avail), style=_avail_style(misc_avail)),
+                _avail_cell(misc_avail),
                 str(misc_sold) if misc_sold else "-",
                 "",
                 str(misc_total),
                 "",
             )
 
-        footer_text = (
-            "[green]1.[/green] Studio (Rayon)   "
-            "[green]2.[/green] Tour (Cotton)   "
-            "[green]s.[/green] Suggestions   "
-            "[green]l.[/green] LTD Editions   "
-            "[green]q.[/green] Back"
-        )
-
-        self.ui.header(operator)
-        self.ui.layout["body"].update(table)
-        self.ui.layout["footer"].update(Panel(footer_text, title="Options"))
-        self.ui.render()
-
-        choice = self.ui.console.input("Choose: ").strip().lower()
-
-        if choice == "1":
-            ctx = self.context.copy()
-            ctx["heatmap_group"] = "studio"
-            return ScreenResult(NavigationAction.PUSH, SeriesHeatmapScreen, ctx)
-        elif choice == "2":
-            ctx = self.context.copy()
-            ctx["heatmap_group"] = "tour"
-            return ScreenResult(NavigationAction.PUSH, SeriesHeatmapScreen, ctx)
-        elif choice == "s":
-            return ScreenResult(NavigationAction.PUSH, ProductionSuggestionsScreen, self.context)
-        elif choice == "l":
-            return ScreenResult(NavigationAction.PUSH, LTDEditionListScreen, self.context)
-        elif choice == "q":
-            return ScreenResult(NavigationAction.POP)
-
-        return ScreenResult(NavigationAction.REPLACE, InventoryDashboardScreen, self.context)
+        return table
 
 
 # Heatmap groupings: each entry is (prefix, connector_code)
@@ -198,34 +211,41 @@ def _build_heatmap_table(prefix, connector_code, yaml_lines, sku_counts):
         t.add_column(p["code"], justify="right")
     t.add_column("TOT", justify="right", style="bold")
 
-    col_totals = defaultdict(int)
-
-    for length in lengths:
-        row_vals = []
-        row_total = 0
-        for pattern in patterns:
-            sku = build_sku(prefix, length, pattern["code"], connector_code)
-            c = sku_counts.get(sku, {})
-            avail = c.get("available", 0)
-            row_total += avail
-            col_totals[pattern["code"]] += avail
-
-            if avail == 0:
-                row_vals.append(Text("\u00b7", style="dim"))
-            else:
-                row_vals.append(Text(str(avail), style=_avail_style(avail)))
+    available = sku_counts["available"]
+    col_totals = [0] * len(patterns)
+
+    # Entries run in (length, pattern) order, so each row is the next
+    # len(patterns) of them.
+    entries = line["sku_index_by_conn"].get(connector_code, [])
+    width = len(patterns)
+
+    add_row = t.add_row
+    if not available:
+        # Nothing in stock anywhere (e.g. a fresh database) — every cell is
+        # empty, so skip the per-SKU lookups.
+        empty_row = [_DOT] * width
+        for length in lengths:
+            add_row(f"{length}ft", *empty_row, "0")
+    else:
+        for row_idx, length in enumerate(lengths):
+            row_vals = []
+            row_total = 0
+            for j, entry in enumerate(entries[row_idx * width:(row_idx + 1) * width]):
+                avail = available.get(entry["sku"], 0)
+                row_total += avail
+                col_totals[j] += avail
+
+                if avail == 0:
+                    row_vals.append(_DOT)
+                else:
+                    row_vals.append(_avail_cell(avail))
 
-        t.add_row(f"{length}ft", *row_vals, str(row_total))
+            add_row(f"{length}ft", *row_vals, str(row_total))
 
     # Column totals
     t.add_section()
-    total_cells = []
-    grand = 0
-    for p in patterns:
-        ct = col_totals[p["code"]]
-        grand += ct
-        total_cells.append(Text(str(ct), style="bold"))
-    t.add_row("[bold]TOTAL[/bold]", *total_cells, f"[bold]{grand}[/bold]")
+    total_cells = [f"[bold]{ct}[/bold]" for ct in col_totals]
+    t.add_row("[bold]TOTAL[/bold]", *total_cells, f"[bold]{sum(col_totals)}[/bold]")
 
     return t
 
@@ -259,6 +279,35 @@ class SeriesHeatmapScreen(Screen):
         return ScreenResult(NavigationAction.POP)
 
 
+# get_recent_sales_windows((30, 90)) value for a SKU with no recent sales.
+_NO_SALES = (0, 0)
+
+
+def _suggestion_score(avail, sold, sales_30, sales_90, margin):
+    """Production priority for a low-stock SKU — higher means build sooner.
+
+    Out of stock with past sales outranks never-sold; recent sales (30d over
+    90d) and margin push a SKU further up.
+    """
+    if avail:
+        score = 20
+    else:
+        score = 50 if sold else 5
+    score += sales_30 * 15 if sales_30 else sales_90 * 5
+    if margin is not None:
+        score += margin * 0.1
+    return score
+
+
+def _suggestion_tier(score):
+    """Bucket a suggestion score (>= 5) into its high/medium/low tier."""
+    if score >= 50:
+        return "high"
+    if score >= 15:
+        return "medium"
+    return "low"
+
+
 class ProductionSuggestionsScreen(Screen):
     """Ranked production priority list."""
 
@@ -267,63 +316,46 @@ class ProductionSuggestionsScreen(Screen):
 
         yaml_lines = load_yaml_skus()
         sku_counts = get_sku_stock_summary()
-        recent_90 = get_recent_sales(days=90)
-        recent_30 = get_recent_sales(days=30)
+        available = sku_counts["available"]
+        sold_by_sku = sku_counts["sold"]
+        recent = get_recent_sales_windows((30, 90))
 
-        suggestions = []
+        # Candidates bucketed by tier; only the top 8 of each are shown.
+        tiers = {"high": [], "medium": [], "low": []}
 
         for prefix in sorted(yaml_lines.keys()):
-            line = yaml_lines[prefix]
-            for length in line["lengths"]:
-                for pattern in line["patterns"]:
-                    for conn in line["connectors"]:
-                        sku = build_sku(prefix, length, pattern["code"], conn["code"])
-                        c = sku_counts.get(sku, {"total": 0, "available": 0, "sold": 0, "failed": 0})
-                        avail = c.get("available", 0)
-                        sold = c.get("sold", 0)
-                        sales_90 = recent_90.get(sku, 0)
-                        sales_30 = recent_30.get(sku, 0)
-                        cost = get_cost(line, length, conn["code"])
-                        price = line["pricing"].get(length, 0)
-
-                        if avail > LOW_STOCK_THRESHOLD:
-                            continue
-
-                        score = 0
-                        if avail == 0 and sold > 0:
-                            score += 50
-                        elif avail == 0 and sold == 0:
-                            score += 5
-                        elif avail > 0:
-                            score += 20
-
-                        if sales_30 > 0:
-                            score += sales_30 * 15
-                        elif sales_90 > 0:
-                            score += sales_90 * 5
-
-                        if price and cost:
-                            margin = price - cost
-                            score += margin * 0.1
-
-                        if score < 5:
-                            continue
-
-                        suggestions.append({
-                            "sku": sku,
-                            "available": avail,
-                            "sold": sold,
-                            "sales_30": sales_30,
-                            "sales_90": sales_90,
-                            "score": score,
-                            "margin": (price - cost) if price and cost else None,
-                        })
-
-        suggestions.sort(key=lambda x: x["score"], reverse=True)
-
-        high = [s for s in suggestions if s["score"] >= 50][:8]
-        medium = [s for s in suggestions if 15 <= s["score"] < 50][:8]
-        low = [s for s in suggestions if 5 <= s["score"] < 15][:8]
+            for entry in yaml_lines[prefix]["sku_index"]:
+                sku = entry["sku"]
+                avail = available.get(sku, 0)
+                # Well-stocked SKUs are the bulk of the catalog; drop them
+                # before doing any of the sales/margin lookups.
+                if avail > LOW_STOCK_THRESHOLD:
+                    continue
+
+                sold = sold_by_sku.get(sku, 0)
+                sales_30, sales_90 = recent.get(sku, _NO_SALES)
+                margin = entry["margin"]
+
+                score = _suggestion_score(avail, sold, sales_30, sales_90, margin)
+                if score < 5:
+                    continue
+
+                tiers[_suggestion_tier(score)].append({
+                    "sku": sku,
+                    "available": avail,
+                    "sold": sold,
+                    "sales_30": sales_30,
+                    "sales_90": sales_90,
+                    "score": score,
+                    "margin": margin,
+                })
+
+        def _top(items):
+            return heapq.nlargest(8, items, key=lambda x: x["score"])
+
+        high = _top(tiers["high"])
+        medium = _top(tiers["medium"])
+        low = _top(tiers["low"])
 
         table = Table(title="Production Suggestions", show_header=True,
                       header_style="bold cyan", padding=(0, 1))
@@ -340,10 +372,11 @@ class ProductionSuggestionsScreen(Screen):
                 return
             table.add_section()
             table.add_row(f"[bold]{label}[/bold]", "", "", "", "", "", "")
+            add_row = table.add_row
             for s in items:
                 margin_str = f"${s['margin']:.0f}" if s["margin"] is not None else "-"
-                avail_text = Text(str(s["available"]), style=_avail_style(s["available"]))
-                table.add_row(
+                avail_text = _avail_cell(s["available"])
+                add_row(
                     pri_marker,
                     s["sku"],
                     avail_text,
@@ -1,12 +1,14 @@
 """Order fulfillment screens: Customer lookup, order processing, and cable assignment"""
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from greenlight.screen_manager import Screen, ScreenResult, NavigationAction
-from greenlight.screens.cable import CableScreenBase
+from greenlight.screens.cable import CableScreenBase, ScanCableLookupScreen
 from greenlight import shopify_client
 from greenlight import db
 
@@ -17,6 +19,21 @@ logger = logging.getLogger(__name__)
 # get dropped by the next clear_queue), so we use a brief sleep instead.
 ERROR_DISPLAY_SEC = 1.5
 
+# Customer search rows listed at once; past this the search should be narrowed.
+MAX_SEARCH_RESULTS = 25
+MIN_SEARCH_LENGTH = 2
+
+# Orders shown per page on the customer's order history.
+ORDERS_PAGE_SIZE = 10
+
+
+_NEWLINE = Text("\n")
+
+
+def _field(label, value, style):
+    """Return a 'Label: value' line with only the label styled."""
+    return Text.assemble((f"{label}:", style), f" {value}")
+
 
 def _assign_pop_target(context):
     """Resolve the screen the cable-assignment flow should pop back to.
@@ -26,39 +43,43 @@ def _assign_pop_target(context):
     listing) put their own screen class in context['assign_return_to'] so the
     flow returns there instead of unwinding the whole stack.
     """
-    target = context.get("assign_return_to")
-    if target is not None:
-        return target
-    from greenlight.screens.cable import ScanCableLookupScreen
-    return ScanCableLookupScreen
+    return context.get("assign_return_to") or ScanCableLookupScreen
 
 
 class FulfillOrdersScreen(Screen):
     """Main order fulfillment menu"""
+    MENU_ITEMS = [
+        "Lookup Customer",
+        "Back (q)"
+    ]
+
+    # The menu never changes, so its panels are built (and the footer's
+    # markup parsed) once rather than on every render
+    BODY_PANEL = Panel("Process customer orders and fulfillment", title="Order Fulfillment")
+    FOOTER_PANEL = Panel(
+        Text.from_markup("\n".join(f"[green]{i + 1}.[/green] {name}" for i, name in enumerate(MENU_ITEMS))),
+        title="Available Operations"
+    )
+
     def run(self) -> ScreenResult:
         operator = self.context.get("operator", "")
-        menu_items = [
-            "Lookup Customer",
-            "Back (q)"
-        ]
-
-        rows = [
-            f"[green]{i + 1}.[/green] {name}"
-            for i, name in enumerate(menu_items)
-        ]
 
         self.ui.header(operator)
-        self.ui.layout["body"].update(Panel("Process customer orders and fulfillment", title="Order Fulfillment"))
-        self.ui.layout["footer"].update(Panel("\n".join(rows), title="Available Operations"))
+        self.ui.layout["body"].update(self.BODY_PANEL)
+        self.ui.layout["footer"].update(self.FOOTER_PANEL)
         self.ui.render()
 
-        choice = self.ui.console.input("Choose: ")
-        if choice == "1":
-            return ScreenResult(NavigationAction.PUSH, CustomerLookupScreen, self.context)
-        elif choice in ["2", "q"]:
+        # Choices that open a screen; the classes are defined further down
+        # the module, so the table is built here rather than on the class.
+        targets = {"1": CustomerLookupScreen}
+
+        choice = self.ui.console.input("Choose: ").strip().lower()
+        target = targets.get(choice)
+        if target is not None:
+            return ScreenResult(NavigationAction.PUSH, target, self.context)
+        if choice in ("2", "q"):
             return ScreenResult(NavigationAction.POP)
-        else:
-            return ScreenResult(NavigationAction.REPLACE, FulfillOrdersScreen, self.context)
+        return ScreenResult(NavigationAction.REPLACE, FulfillOrdersScreen, self.context)
 
 
 class CustomerLookupScreen(Screen):
@@ -77,9 +98,8 @@ class CustomerLookupScreen(Screen):
         ))
         self.ui.render()
 
-        try:
-            search_name = self.ui.console.input("Customer name: ").strip()
-        except KeyboardInterrupt:
+        search_name = self.ui.safe_input("Customer name: ")
+        if search_name is None:
             return ScreenResult(NavigationAction.POP)
 
         if search_name.lower() == 'q':
@@ -89,6 +109,17 @@ class CustomerLookupScreen(Screen):
             # Empty search - re-display screen
             return ScreenResult(NavigationAction.REPLACE, CustomerLookupScreen, self.context)
 
+        if len(search_name) < MIN_SEARCH_LENGTH:
+            # A one-letter wildcard matches most of the store
+            self.ui.layout["body"].update(Panel(
+                f"[yellow]Type at least {MIN_SEARCH_LENGTH} characters to search[/yellow]\n\n[dim]Press enter to search again[/dim]",
+                title="Customer Lookup"
+            ))
+            self.ui.layout["footer"].update(Panel("", title=""))
+            self.ui.render()
+            self.ui.console.input()
+            return ScreenResult(NavigationAction.REPLACE, CustomerLookupScreen, self.context)
+
         # Search for customers
         self.ui.layout["body"].update(Panel(
             f"[yellow]Searching for '{search_name}'...[/yellow]",
@@ -123,16 +154,20 @@ class CustomerSearchResultsScreen(Screen):
         search_name = self.context.get("search_name", "")
         fulfillment_mode = self.context.get("fulfillment_mode", False)
 
+        # Only the first MAX_SEARCH_RESULTS rows are listed; fixed column
+        # widths keep Rich from measuring every cell to size the table.
+        shown = customers[:MAX_SEARCH_RESULTS]
+
         # Create results table
-        table = Table(show_header=True, header_style="bold cyan")
+        table = Table(show_header=True, header_style="bold cyan", padding=(0, 1))
         table.add_column("#", style="green", width=3)
-        table.add_column("Name", style="white")
-        table.add_column("Band", style="magenta")
-        table.add_column("Email", style="dim")
-        table.add_column("Orders", justify="right", style="yellow")
-        table.add_column("Total Spent", justify="right", style="green")
+        table.add_column("Name", style="white", width=28, no_wrap=True, overflow="ellipsis")
+        table.add_column("Band", style="magenta", width=20, no_wrap=True, overflow="ellipsis")
+        table.add_column("Email", style="dim", width=32, no_wrap=True, overflow="ellipsis")
+        table.add_column("Orders", justify="right", style="yellow", width=6)
+        table.add_column("Total Spent", justify="right", style="green", width=11)
 
-        for i, customer in enumerate(customers, 1):
+        for i, customer in enumerate(shown, 1):
             name = customer.get("displayName") or ""
             band = shopify_client.get_band_company(customer) or ""
             email = customer.get("email") or ""
@@ -146,6 +181,10 @@ class CustomerSearchResultsScreen(Screen):
 
             table.add_row(str(i), name, band, email, num_orders, spent)
 
+        if len(customers) > len(shown):
+            table.add_row("", f"[dim]... and {len(customers) - len(shown)} more[/dim]", "",
+                          "[dim]refine the search to see them[/dim]", "", "")
+
         self.ui.header(operator)
         self.ui.layout["body"].update(Panel(
             table,
@@ -159,9 +198,8 @@ class CustomerSearchResultsScreen(Screen):
         self.ui.layout["footer"].update(Panel(footer_text, title="Select Customer"))
         self.ui.render()
 
-        try:
-            choice = self.ui.console.input("Choice: ").strip().lower()
-        except KeyboardInterrupt:
+        choice = self.ui.safe_input("Choice: ", lower=True)
+        if choice is None:
             return ScreenResult(NavigationAction.POP, pop_to=_assign_pop_target(self.context))
 
         # Auto-select if only one result and user pressed Enter
@@ -174,9 +212,9 @@ class CustomerSearchResultsScreen(Screen):
             return ScreenResult(NavigationAction.REPLACE, CustomerLookupScreen, self.context)
         elif choice.isdigit():
             idx = int(choice) - 1
-            if 0 <= idx < len(customers):
+            if 0 <= idx < len(shown):
                 new_context = self.context.copy()
-                new_context["selected_customer"] = customers[idx]
+                new_context["selected_customer"] = shown[idx]
                 # Preserve cable assignment context if it exists
                 if "assign_cable_serial" in self.context:
                     new_context["assign_cable_serial"] = self.context["assign_cable_serial"]
@@ -222,40 +260,49 @@ class CustomerDetailScreen(Screen):
             if amount else None
         )
 
-        # Show just city, state — full address isn't needed and country-only is noise
+        # Show just city, state — full address isn't needed and country-only is noise.
+        # Blank or whitespace-only parts are dropped so no stray ", " is left.
         location = ""
         if address:
-            location = ", ".join(
-                p for p in (address.get("city"), address.get("province")) if p
-            )
-
-        # Fetch most recent order and assigned cables
+            location = ", ".join(filter(None, (
+                (address.get("city") or "").strip(),
+                (address.get("province") or "").strip(),
+            )))
+
+        # Fetch most recent order and assigned cables. They're independent, so
+        # the Shopify round-trip runs on a worker while Postgres answers here.
+        # Always asked: numberOfOrders comes from a possibly cached search
+        # and can miss a customer's first order.
         customer_id = customer.get("id", "")
-        recent_orders = shopify_client.get_customer_orders(customer_id, limit=1)
-        assigned_cables = db.get_cables_for_customer(customer_id)
-
-        # Build sections, skipping empty ones
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            order_future = pool.submit(shopify_client.get_customer_last_order_preview, customer_id)
+            assigned_cables = db.get_cables_for_customer(customer_id)
+            last_order = order_future.result()
+
+        # Build sections, skipping empty ones. Assembled as styled Text rather
+        # than markup so Rich doesn't parse it (and a '[' in a name or cable
+        # description can't be mistaken for a tag).
         sections = []
 
-        contact_lines = [f"[bold cyan]Name:[/bold cyan] {name}"]
+        contact_lines = [_field("Name", name, "bold cyan")]
         if band_company:
-            contact_lines.append(f"[bold cyan]Band:[/bold cyan] {band_company}")
+            contact_lines.append(_field("Band", band_company, "bold cyan"))
         if email:
-            contact_lines.append(f"[bold cyan]Email:[/bold cyan] {email}")
+            contact_lines.append(_field("Email", email, "bold cyan"))
         if phone:
-            contact_lines.append(f"[bold cyan]Phone:[/bold cyan] {phone}")
+            contact_lines.append(_field("Phone", phone, "bold cyan"))
         if location:
-            contact_lines.append(f"[bold cyan]Location:[/bold cyan] {location}")
-        sections.append("\n".join(contact_lines))
+            contact_lines.append(_field("Location", location, "bold cyan"))
+        sections.append(_NEWLINE.join(contact_lines))
 
         if num_orders > 0:
-            order_lines = [f"[bold yellow]Order Count:[/bold yellow] {num_orders}"]
+            order_lines = [_field("Order Count", num_orders, "bold yellow")]
             if spent:
-                order_lines.append(f"[bold yellow]Total Spent:[/bold yellow] {spent}")
-            sections.append("\n".join(order_lines))
+                order_lines.append(_field("Total Spent", spent, "bold yellow"))
+            sections.append(_NEWLINE.join(order_lines))
 
-        if recent_orders:
-            order = recent_orders[0]
+        if last_order:
+            order = last_order
             order_name = order.get("name") or "N/A"
             order_date = (order.get("createdAt") or "")[:10]
             order_status = order.get("displayFulfillmentStatus") or "N/A"
@@ -264,43 +311,39 @@ class CustomerDetailScreen(Screen):
             total_price = (order.get("totalPriceSet") or {}).get("shopMoney") or {}
             order_total = f"${float(total_price.get('amount') or 0):.2f}"
 
-            line_items = (order.get("lineItems") or {}).get("edges") or []
+            line_items = order.get("lineItems") or {}
             items_summary = []
-            for item_edge in line_items[:3]:
-                item = item_edge.get("node") or {}
+            for item in line_items.get("nodes") or []:
                 title = item.get("title") or "Unknown"
                 qty = item.get("quantity") or 0
                 items_summary.append(f"  • {title} (x{qty})")
-            if len(line_items) > 3:
-                items_summary.append(f"  • ... and {len(line_items) - 3} more items")
+            if (line_items.get("pageInfo") or {}).get("hasNextPage"):
+                items_summary.append("  • ... and more items")
 
-            last_order = (
-                f"[bold magenta]Last Order:[/bold magenta] {order_name} - {order_date}\n"
-                f"[bold magenta]Status:[/bold magenta] {order_status} / {order_financial}\n"
-                f"[bold magenta]Total:[/bold magenta] {order_total}"
-            )
+            order_lines = [
+                _field("Last Order", f"{order_name} - {order_date}", "bold magenta"),
+                _field("Status", f"{order_status} / {order_financial}", "bold magenta"),
+                _field("Total", order_total, "bold magenta"),
+            ]
             if items_summary:
-                last_order += "\n[bold magenta]Items:[/bold magenta]\n" + "\n".join(items_summary)
-            sections.append(last_order)
+                order_lines.append(Text("Items:", style="bold magenta"))
+                order_lines.extend(Text(line) for line in items_summary)
+            sections.append(_NEWLINE.join(order_lines))
         elif num_orders > 0:
-            sections.append(
-                f"[dim]Customer has {num_orders} order(s) but they are not accessible via API[/dim]"
-            )
+            sections.append(Text(
+                f"Customer has {num_orders} order(s) but they are not accessible via API",
+                style="dim",
+            ))
 
         # Assigned cables — always show the count
-        cables_text = f"[bold magenta]Assigned Cables:[/bold magenta] {len(assigned_cables)}"
+        cable_lines = [_field("Assigned Cables", len(assigned_cables), "bold magenta")]
         for cable in assigned_cables[:5]:
-            kind = cable.get('kind')
-            if kind in ('misc', 'ltd') and cable.get('description'):
-                cable_desc = f"{cable['series']} {cable['length']}ft - {cable['description']}"
-            else:
-                cable_desc = f"{cable['series']} {cable['length']}ft {cable.get('pattern_name') or ''}"
-            cables_text += f"\n  • {cable['serial_number']} - {cable_desc.rstrip()}"
+            cable_lines.append(Text(f"  • {cable['serial_number']} - {cable['display']}"))
         if len(assigned_cables) > 5:
-            cables_text += f"\n  • ... and {len(assigned_cables) - 5} more"
-        sections.append(cables_text)
+            cable_lines.append(Text(f"  • ... and {len(assigned_cables) - 5} more"))
+        sections.append(_NEWLINE.join(cable_lines))
 
-        customer_info = "\n\n".join(sections)
+        customer_info = Text("\n\n").join(sections)
 
         self.ui.header(operator)
         self.ui.layout["body"].update(Panel(customer_info, title="Customer Details"))
@@ -320,28 +363,25 @@ class CustomerDetailScreen(Screen):
         self.ui.layout["footer"].update(Panel(footer_text, title=""))
         self.ui.render()
 
-        try:
-            choice = self.ui.console.input("Choice: ").strip().lower()
-        except KeyboardInterrupt:
+        choice = self.ui.safe_input("Choice: ", lower=True)
+        if choice is None:
             return ScreenResult(NavigationAction.POP)
 
         if choice == 'o':
             return ScreenResult(NavigationAction.PUSH, CustomerOrdersScreen, self.context)
         elif choice == 'a':
-            # Check for unfulfilled orders before allowing direct assignment
-            orders = shopify_client.get_customer_orders(customer_id, limit=25)
+            # Check for unfulfilled orders before allowing direct assignment.
+            # Not gated on numberOfOrders, which may predate a new order.
+            orders = shopify_client.get_customer_orders(customer_id, limit=25, include_line_items=False)
             unfulfilled = [
                 o for o in orders
                 if (o.get("displayFulfillmentStatus") or "").upper()
                 in ("UNFULFILLED", "PARTIALLY_FULFILLED", "")
             ]
             if unfulfilled:
-                try:
-                    confirm = self.ui.console.input(
-                        "This customer has open orders. Fulfill them instead? (y/n): "
-                    ).strip().lower()
-                except KeyboardInterrupt:
-                    confirm = 'n'
+                confirm = self.ui.safe_input(
+                    "This customer has open orders. Fulfill them instead? (y/n): ", lower=True
+                )
                 if confirm == 'y':
                     return ScreenResult(NavigationAction.PUSH, OrderSelectionScreen, self.context)
             return ScreenResult(NavigationAction.PUSH, AssignCablesScreen, self.context)
@@ -396,11 +436,8 @@ class CustomerDetailScreen(Screen):
                 existing_customer_name = "another customer"
                 try:
                     if existing_gid and existing_gid != 'unknown':
-                        customer_numeric_id = existing_gid.split('/')[-1]
-                        existing_customer = shopify_client.get_customer_by_id(customer_numeric_id)
-                        if existing_customer:
-                            existing_customer_name = existing_customer.get('displayName') or "another customer"
-                except:
+                        existing_customer_name = shopify_client.get_customer_display_name(existing_gid) or "another customer"
+                except Exception:
                     pass
 
                 reassign_prompt = f"""[yellow]⚠️  Cable Already Assigned[/yellow]
@@ -417,9 +454,8 @@ Do you want to reassign it to [bold green]{customer_name}[/bold green]?"""
                 ))
                 self.ui.render()
 
-                try:
-                    choice = self.ui.console.input("").strip().lower()
-                except KeyboardInterrupt:
+                choice = self.ui.safe_input("", lower=True)
+                if choice is None:
                     return ScreenResult(NavigationAction.POP, pop_to=_assign_pop_target(self.context))
 
                 if choice == 'y' or choice == 'yes':
@@ -478,7 +514,7 @@ class PrintCustomerLabelsScreen(CableScreenBase):
             self.ui.layout["body"].update(
                 Panel("No cables assigned to this customer.", title="Print Labels")
             )
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             try:
                 self.ui.wait_back()
@@ -491,7 +527,7 @@ class PrintCustomerLabelsScreen(CableScreenBase):
             self.ui.layout["body"].update(
                 Panel("No label printer available.", title="Print Labels")
             )
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             try:
                 self.ui.wait_back()
@@ -509,11 +545,8 @@ class PrintCustomerLabelsScreen(CableScreenBase):
             Panel("[green]Enter[/green] = print | [red]'q'[/red] = cancel", title="")
         )
         self.ui.render()
-        try:
-            confirm = self.ui.console.input("Choice: ").strip().lower()
-        except KeyboardInterrupt:
-            confirm = 'q'
-        if confirm == 'q':
+        confirm = self.ui.safe_input("Choice: ", lower=True)
+        if confirm is None or confirm == 'q':
             return ScreenResult(NavigationAction.POP)
 
         printed = 0
@@ -535,7 +568,7 @@ class PrintCustomerLabelsScreen(CableScreenBase):
         if failed:
             summary += "\n[red]Failed:[/red] " + ", ".join(failed)
         self.ui.layout["body"].update(Panel(summary, title="Print Labels"))
-        self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+        self.ui.back_footer()
         self.ui.render()
         try:
             self.ui.wait_back()
@@ -558,7 +591,7 @@ class UnassignCableScreen(Screen):
                 "[dim]No cables assigned to this customer[/dim]",
                 title="Unassign Cable"
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -571,13 +604,8 @@ class UnassignCableScreen(Screen):
         table.add_column("Tested", justify="center", style="yellow")
 
         for i, cable in enumerate(assigned_cables, 1):
-            kind = cable.get('kind')
-            if kind in ('misc', 'ltd') and cable.get('description'):
-                cable_desc = f"{cable['series']} {cable['length']}ft - {cable['description']}"
-            else:
-                cable_desc = f"{cable['series']} {cable['length']}ft {cable.get('pattern_name') or ''}".rstrip()
             tested = "[green]Yes[/green]" if cable.get('test_passed') else "[dim]No[/dim]"
-            table.add_row(str(i), cable['serial_number'], cable_desc, tested)
+            table.add_row(str(i), cable['serial_number'], cable['display'], tested)
 
         self.ui.header(operator)
         self.ui.layout["body"].update(Panel(
@@ -590,9 +618,8 @@ class UnassignCableScreen(Screen):
         ))
         self.ui.render()
 
-        try:
-            choice = self.ui.console.input("Choice: ").strip().lower()
-        except KeyboardInterrupt:
+        choice = self.ui.safe_input("Choice: ", lower=True)
+        if choice is None:
             return ScreenResult(NavigationAction.POP)
 
         if choice == 'q' or not choice:
@@ -620,9 +647,8 @@ class UnassignCableScreen(Screen):
         ))
         self.ui.render()
 
-        try:
-            confirm = self.ui.console.input("").strip().lower()
-        except KeyboardInterrupt:
+        confirm = self.ui.safe_input("", lower=True)
+        if confirm is None:
             return ScreenResult(NavigationAction.POP)
 
         if confirm not in ('y', 'yes'):
@@ -633,11 +659,11 @@ class UnassignCableScreen(Screen):
 
         if result.get('success'):
             # Cable is back in the available pool — push the higher count to Shopify.
-            cable_record = db.get_audio_cable(serial)
-            if cable_record:
-                ok, err = shopify_client.sync_inventory_for_cable(cable_record)
-                if not ok:
-                    logger.warning("Shopify inventory sync failed for %s: %s", serial, err)
+            # The listed record already carries the SKU fields the sync needs;
+            # unassigning doesn't change them, so no re-fetch.
+            ok, err = shopify_client.sync_inventory_for_cable(cable)
+            if not ok:
+                logger.warning("Shopify inventory sync failed for %s: %s", serial, err)
             self.ui.layout["body"].update(Panel(
                 f"[green]Cable {serial} unassigned from {customer_name}[/green]",
                 title="Unassigned"
@@ -647,7 +673,7 @@ class UnassignCableScreen(Screen):
                 f"[red]Error: {result.get('message', 'Unknown error')}[/red]",
                 title="Error"
             ))
-        self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+        self.ui.back_footer()
         self.ui.render()
         self.ui.wait_back()
 
@@ -663,54 +689,100 @@ class CustomerOrdersScreen(Screen):
         customer_id = customer.get("id", "")
         customer_name = customer.get("displayName", "Customer")
 
-        # Fetch orders
-        self.ui.header(operator)
-        self.ui.layout["body"].update(Panel(
-            "[yellow]Loading orders...[/yellow]",
-            title=f"Orders for {customer_name}"
-        ))
-        self.ui.render()
-
-        orders = shopify_client.get_customer_orders(customer_id, limit=10)
-
-        if not orders:
-            self.ui.layout["body"].update(Panel(
-                "[dim]No orders found for this customer[/dim]",
-                title=f"Orders for {customer_name}"
-            ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
-            self.ui.render()
-            self.ui.wait_back()
-            return ScreenResult(NavigationAction.POP)
-
-        # Create orders table
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Order", style="white")
-        table.add_column("Date", style="dim")
-        table.add_column("Status", style="yellow")
-        table.add_column("Total", justify="right", style="green")
-        table.add_column("Items", justify="right", style="cyan")
-
-        for order in orders:
-            order_name = order.get("name") or "N/A"
-            created_at = (order.get("createdAt") or "")[:10]  # Just the date part
-            fulfillment_status = order.get("displayFulfillmentStatus") or "N/A"
-
-            total_price = (order.get("totalPriceSet") or {}).get("shopMoney") or {}
-            total = f"${float(total_price.get('amount') or 0):.2f}" if total_price else "$0.00"
+        # Orders are fetched a page at a time with Shopify's cursors. Pages
+        # already seen are kept so paging back doesn't refetch them; a page
+        # that failed to load is not kept, so 'n' retries it.
+        pages = []
+        page = 0
+        status = None
+
+        while True:
+            if page == len(pages):
+                self.ui.header(operator)
+                self.ui.layout["body"].update(Panel(
+                    "[yellow]Loading orders...[/yellow]",
+                    title=f"Orders for {customer_name}"
+                ))
+                self.ui.render()
+                after = pages[-1]["endCursor"] if pages else None
+                fetched = shopify_client.get_customer_orders_page(
+                    customer_id, ORDERS_PAGE_SIZE, after=after, include_line_items=False
+                )
+                if fetched.get("error"):
+                    if not pages:
+                        self.ui.layout["body"].update(Panel(
+                            f"[red]Could not load orders: {fetched['error']}[/red]",
+                            title=f"Orders for {customer_name}"
+                        ))
+                        self.ui.back_footer()
+                        self.ui.render()
+                        self.ui.wait_back()
+                        return ScreenResult(NavigationAction.POP)
+                    status = "[red]Could not load the next page — press n to retry[/red]"
+                    page -= 1
+                else:
+                    pages.append(fetched)
 
-            line_items = (order.get("lineItems") or {}).get("edges") or []
-            num_items = sum((item.get("node") or {}).get("quantity") or 0 for item in line_items)
+            orders = pages[page]["orders"]
+            has_next = pages[page]["hasNextPage"]
 
-            table.add_row(order_name, created_at, fulfillment_status, total, str(num_items))
+            if not orders and page == 0:
+                self.ui.layout["body"].update(Panel(
+                    "[dim]No orders found for this customer[/dim]",
+                    title=f"Orders for {customer_name}"
+                ))
+                self.ui.back_footer()
+                self.ui.render()
+                self.ui.wait_back()
+                return ScreenResult(NavigationAction.POP)
+
+            # Create orders table
+            table = Table(show_header=True, header_style="bold cyan")
+            table.add_column("Order", style="white")
+            table.add_column("Date", style="dim")
+            table.add_column("Status", style="yellow")
+            table.add_column("Total", justify="right", style="green")
+            table.add_column("Items", justify="right", style="cyan")
+
+            for order in orders:
+                order_name = order.get("name") or "N/A"
+                created_at = (order.get("createdAt") or "")[:10]  # Just the date part
+                fulfillment_status = order.get("displayFulfillmentStatus") or "N/A"
+
+                total_price = (order.get("totalPriceSet") or {}).get("shopMoney") or {}
+                total = f"${float(total_price.get('amount') or 0):.2f}" if total_price else "$0.00"
+
+                num_items = order.get("subtotalLineItemsQuantity") or 0
+
+                table.add_row(order_name, created_at, fulfillment_status, total, str(num_items))
+
+            title = f"Recent Orders for {customer_name}"
+            if page > 0 or has_next:
+                title += f"  (page {page + 1})"
+
+            nav = []
+            if page > 0:
+                nav.append("[green]p.[/green] Prev")
+            if has_next:
+                nav.append("[green]n.[/green] Next")
+            nav.append("[green]q.[/green] Back")
+            footer_text = "   ".join(nav)
+            if status:
+                footer_text = f"{status}\n{footer_text}"
+                status = None
 
-        self.ui.header(operator)
-        self.ui.layout["body"].update(Panel(table, title=f"Recent Orders for {customer_name}"))
-        self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
-        self.ui.render()
+            self.ui.header(operator)
+            self.ui.layout["body"].update(Panel(table, title=title))
+            self.ui.layout["footer"].update(Panel(footer_text, title=""))
+            self.ui.render()
 
-        self.ui.wait_back()
-        return ScreenResult(NavigationAction.POP)
+            key = self.ui.read_key()
+            if key in ("q", "ENTER"):
+                return ScreenResult(NavigationAction.POP)
+            elif key == "n" and has_next:
+                page += 1
+            elif key == "p" and page > 0:
+                page -= 1
 
 
 class OrderSelectionScreen(Screen):
@@ -743,7 +815,7 @@ class OrderSelectionScreen(Screen):
                 f"[dim]No unfulfilled orders found for {customer_name}[/dim]",
                 title="Order Selection"
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.POP)
@@ -769,8 +841,7 @@ class OrderSelectionScreen(Screen):
             total_price = (order.get("totalPriceSet") or {}).get("shopMoney") or {}
             total = f"${float(total_price.get('amount') or 0):.2f}" if total_price else "$0.00"
 
-            line_items = (order.get("lineItems") or {}).get("edges") or []
-            num_items = sum((item.get("node") or {}).get("quantity") or 0 for item in line_items)
+            num_items = order.get("subtotalLineItemsQuantity") or 0
 
             table.add_row(str(i), order_name, created_at, fulfillment_status, total, str(num_items))
 
@@ -784,9 +855,8 @@ class OrderSelectionScreen(Screen):
         self.ui.layout["footer"].update(Panel(footer_text, title="Select Order"))
         self.ui.render()
 
-        try:
-            choice = self.ui.console.input("Choice: ").strip().lower()
-        except KeyboardInterrupt:
+        choice = self.ui.safe_input("Choice: ", lower=True)
+        if choice is None:
             return ScreenResult(NavigationAction.POP)
 
         if choice == 'q':
@@ -822,7 +892,7 @@ class OrderSelectionScreen(Screen):
                 "[red]No cable items (with SKUs) found in this order[/red]",
                 title="Order Selection"
             ))
-            self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+            self.ui.back_footer()
             self.ui.render()
             self.ui.wait_back()
             return ScreenResult(NavigationAction.REPLACE, OrderSelectionScreen, self.context)
@@ -839,6 +909,8 @@ class OrderFulfillScanScreen(Screen):
     """Scan cables to fulfill a specific order with SKU validation and progress tracking"""
     def run(self) -> ScreenResult:
         operator = self.context.get("operator", "")
+        body = self.ui.layout["body"]
+        footer = self.ui.layout["footer"]
         customer = self.context.get("selected_customer", {})
         customer_name = customer.get("displayName", "Customer")
         customer_gid = customer.get("id", "")
@@ -881,30 +953,34 @@ class OrderFulfillScanScreen(Screen):
             progress_table.add_row(sku, item['title'], progress_str, status)
 
         # Build body content
-        header_text = f"[bold cyan]Customer:[/bold cyan] {customer_name}\n"
-        header_text += f"[bold cyan]Order:[/bold cyan] {order_name}\n"
+        header_lines = [
+            f"[bold cyan]Customer:[/bold cyan] {customer_name}",
+            f"[bold cyan]Order:[/bold cyan] {order_name}",
+            "",
+        ]
 
         if scanned_cables:
-            header_text += f"\n[bold magenta]Recently scanned:[/bold magenta]"
-            for cable_info in scanned_cables[-5:]:
-                header_text += f"\n  • {cable_info}"
+            header_lines.append("[bold magenta]Recently scanned:[/bold magenta]")
+            header_lines.extend(f"  • {cable_info}" for cable_info in scanned_cables[-5:])
 
         if all_complete:
-            header_text += "\n\n[bold green]✅ All line items fulfilled![/bold green]"
+            header_lines += ["", "[bold green]✅ All line items fulfilled![/bold green]"]
+
+        header_text = "\n".join(header_lines)
 
         from rich.console import Group
         body_content = Group(header_text, "", progress_table)
 
         self.ui.header(operator)
-        self.ui.layout["body"].update(Panel(body_content, title=f"Fulfill Order {order_name}"))
+        body.update(Panel(body_content, title=f"Fulfill Order {order_name}"))
 
         if all_complete:
-            self.ui.layout["footer"].update(Panel(
+            footer.update(Panel(
                 "[bold green]Order complete![/bold green] Press [cyan]'q'[/cyan] to go back, or continue scanning",
                 title="Fulfillment"
             ))
         else:
-            self.ui.layout["footer"].update(Panel(
+            footer.update(Panel(
                 "[cyan]Scan cable barcode (or 'q' to go back)[/cyan]",
                 title="Fulfillment"
             ))
@@ -920,11 +996,11 @@ class OrderFulfillScanScreen(Screen):
         from greenlight.db import validate_serial_number, format_serial_number
         valid, err_msg = validate_serial_number(serial_input)
         if not valid:
-            self.ui.layout["body"].update(Panel(
+            body.update(Panel(
                 f"[red]❌ Invalid serial number: {err_msg}[/red]",
                 title=f"Fulfill Order {order_name}"
             ))
-            self.ui.layout["footer"].update(Panel("", title=""))
+            footer.update(Panel("", title=""))
             self.ui.render()
             time.sleep(ERROR_DISPLAY_SEC)
             return ScreenResult(NavigationAction.REPLACE, OrderFulfillScanScreen, self.context)
@@ -946,31 +1022,31 @@ class OrderFulfillScanScreen(Screen):
         error_type = result.get('error')
 
         if error_type == 'not_found':
-            self.ui.layout["body"].update(Panel(
+            body.update(Panel(
                 f"[red]❌ Cable {formatted_serial} not found in database[/red]",
                 title=f"Fulfill Order {order_name}"
             ))
-            self.ui.layout["footer"].update(Panel("", title=""))
+            footer.update(Panel("", title=""))
             self.ui.render()
             time.sleep(ERROR_DISPLAY_SEC)
             return ScreenResult(NavigationAction.REPLACE, OrderFulfillScanScreen, self.context)
 
         elif error_type == 'duplicate':
-            self.ui.layout["body"].update(Panel(
+            body.update(Panel(
                 f"[yellow]⚠️  Cable {formatted_serial} is already scanned for this order[/yellow]",
                 title=f"Fulfill Order {order_name}"
             ))
-            self.ui.layout["footer"].update(Panel("", title=""))
+            footer.update(Panel("", title=""))
             self.ui.render()
             time.sleep(ERROR_DISPLAY_SEC)
             return ScreenResult(NavigationAction.REPLACE, OrderFulfillScanScreen, self.context)
 
         elif error_type == 'already_assigned_order':
-            self.ui.layout["body"].update(Panel(
+            body.update(Panel(
                 f"[red]❌ Cable {formatted_serial} is assigned to a different order[/red]",
                 title=f"Fulfill Order {order_name}"
             ))
-            self.ui.layout["footer"].update(Panel("", title=""))
+            footer.update(Panel("", title=""))
             self.ui.render()
             time.sleep(ERROR_DISPLAY_SEC)
             return ScreenResult(NavigationAction.REPLACE, OrderFulfillScanScreen, self.context)
@@ -981,27 +1057,23 @@ class OrderFulfillScanScreen(Screen):
             existing_customer_name = "another customer"
             try:
                 if existing_gid:
-                    customer_numeric_id = existing_gid.split('/')[-1]
-                    existing_customer = shopify_client.get_customer_by_id(customer_numeric_id)
-                    if existing_customer:
-                        existing_customer_name = existing_customer.get('displayName') or "another customer"
-            except:
+                    existing_customer_name = shopify_client.get_customer_display_name(existing_gid) or "another customer"
+            except Exception:
                 pass
 
-            self.ui.layout["body"].update(Panel(
+            body.update(Panel(
                 f"[yellow]⚠️  Cable {formatted_serial} is assigned to {existing_customer_name} (no order)[/yellow]\n\n"
                 f"Override and assign to this order?",
                 title=f"Fulfill Order {order_name}"
             ))
-            self.ui.layout["footer"].update(Panel(
+            footer.update(Panel(
                 "[green]y[/green] = Override | [cyan]n[/cyan] = Skip",
                 title="Override?"
             ))
             self.ui.render()
 
-            try:
-                choice = self.ui.console.input("").strip().lower()
-            except KeyboardInterrupt:
+            choice = self.ui.safe_input("", lower=True)
+            if choice is None:
                 return ScreenResult(NavigationAction.REPLACE, OrderFulfillScanScreen, self.context)
 
             if choice in ('y', 'yes'):
@@ -1011,11 +1083,11 @@ class OrderFulfillScanScreen(Screen):
                 if cable_record:
                     cable_sku = cable_record.get('sku', '')
                     if cable_sku not in line_item_skus:
-                        self.ui.layout["body"].update(Panel(
+                        body.update(Panel(
                             f"[red]❌ SKU mismatch: cable is {cable_sku}, not in order[/red]",
                             title=f"Fulfill Order {order_name}"
                         ))
-                        self.ui.layout["footer"].update(Panel("", title=""))
+                        footer.update(Panel("", title=""))
                         self.ui.render()
                         time.sleep(ERROR_DISPLAY_SEC)
                         return ScreenResult(NavigationAction.REPLACE, OrderFulfillScanScreen, self.context)
@@ -1026,11 +1098,11 @@ class OrderFulfillScanScreen(Screen):
                     new_context["scanned_cables"] = scanned_cables
                     return ScreenResult(NavigationAction.REPLACE, OrderFulfillScanScreen, new_context)
                 else:
-                    self.ui.layout["body"].update(Panel(
+                    body.update(Panel(
                         f"[red]❌ Error: {override_result.get('message', 'Unknown')}[/red]",
                         title=f"Fulfill Order {order_name}"
                     ))
-                    self.ui.layout["footer"].update(Panel("", title=""))
+                    footer.update(Panel("", title=""))
                     self.ui.render()
                     time.sleep(ERROR_DISPLAY_SEC)
 
@@ -1038,24 +1110,24 @@ class OrderFulfillScanScreen(Screen):
 
         elif error_type == 'sku_mismatch':
             cable_sku = result.get('cable_sku', 'unknown')
-            self.ui.layout["body"].update(Panel(
+            body.update(Panel(
                 f"[red]❌ SKU mismatch![/red]\n\n"
                 f"Cable SKU: [yellow]{cable_sku}[/yellow]\n"
                 f"Order expects: {', '.join(line_item_skus)}",
                 title=f"Fulfill Order {order_name}"
             ))
-            self.ui.layout["footer"].update(Panel("", title=""))
+            footer.update(Panel("", title=""))
             self.ui.render()
             time.sleep(ERROR_DISPLAY_SEC)
             return ScreenResult(NavigationAction.REPLACE, OrderFulfillScanScreen, self.context)
 
         else:
             # Generic error
-            self.ui.layout["body"].update(Panel(
+            body.update(Panel(
                 f"[red]❌ Error: {result.get('message', 'Unknown error')}[/red]",
                 title=f"Fulfill Order {order_name}"
             ))
-            self.ui.layout["footer"].update(Panel("", title=""))
+            footer.update(Panel("", title=""))
             self.ui.render()
             time.sleep(ERROR_DISPLAY_SEC)
             return ScreenResult(NavigationAction.REPLACE, OrderFulfillScanScreen, self.context)
@@ -1064,7 +1136,25 @@ class OrderFulfillScanScreen(Screen):
 class AssignCablesScreen(Screen):
     """Scan and assign cables to a customer"""
     def run(self) -> ScreenResult:
+        # One pooled connection serves every assignment in the scan session.
+        # If none can be had up front (pool exhausted, DB restarting), each
+        # scan borrows its own as it did before.
+        try:
+            conn = db.pg_pool.getconn()
+        except Exception as e:
+            logger.warning("No session connection for cable assignment: %s", e)
+            conn = None
+        try:
+            return self._scan_session(conn)
+        finally:
+            if conn is not None:
+                db.pg_pool.putconn(conn)
+
+    def _scan_session(self, conn) -> ScreenResult:
         operator = self.context.get("operator", "")
+        # The scan loop below swaps these panels on every scan
+        body = self.ui.layout["body"]
+        footer = self.ui.layout["footer"]
         customer = self.context.get("selected_customer", {})
         customer_name = customer.get("displayName", "Customer")
         customer_gid = customer.get("id", "")
@@ -1072,11 +1162,19 @@ class AssignCablesScreen(Screen):
         # Track assigned cables in this session
         assigned_cables = self.context.get("assigned_cables", [])
 
-        # Display currently assigned cables count
-        existing_cables = db.get_cables_for_customer(customer_gid)
-        total_cables = len(existing_cables)
+        # The scan loop stays inside run() so the scanner stays hot between
+        # cables; only the body panel changes per scan. The already-assigned
+        # count is read once and then kept current from each assignment's
+        # result, rather than re-fetching every cable row just to count them.
+        total_cables = len(db.get_cables_for_customer(customer_gid))
 
-        info_text = f"""[bold cyan]Customer:[/bold cyan] {customer_name}
+        # Confirmation for the last assignment. It is shown at the top of the
+        # next scan frame instead of holding the operator on a success panel.
+        banner = None
+
+        self.ui.header(operator)
+        while True:
+            info_text = f"""[bold cyan]Customer:[/bold cyan] {customer_name}
 [bold cyan]Shopify ID:[/bold cyan] {customer_gid}
 
 [bold yellow]Cables already assigned:[/bold yellow] {total_cables}
@@ -1085,54 +1183,50 @@ class AssignCablesScreen(Screen):
 [dim]Scan cable barcode or enter serial number[/dim]
 [dim]Press 'q' to finish and go back[/dim]"""
 
-        if assigned_cables:
-            info_text += "\n\n[bold magenta]Recently assigned:[/bold magenta]"
-            for cable in assigned_cables[-5:]:  # Show last 5
-                info_text += f"\n  • {cable}"
-
-        self.ui.header(operator)
-        self.ui.layout["body"].update(Panel(info_text, title="Assign Cables to Customer"))
-        self.ui.layout["footer"].update(Panel(
-            "[cyan]Scan or enter serial number (or 'q' to finish)[/cyan]",
-            title="Cable Assignment"
-        ))
-        self.ui.render()
-
-        # Use shared scanner method
-        serial_input = self.ui.get_serial_number_scan_or_manual()
-
-        if not serial_input or serial_input.lower() == 'q':
-            return ScreenResult(NavigationAction.POP, pop_to=_assign_pop_target(self.context))
-
-        # Assign the cable to the customer
-        self.ui.layout["body"].update(Panel(
-            f"[yellow]Assigning cable {serial_input} to {customer_name}...[/yellow]",
-            title="Assign Cables to Customer"
-        ))
-        self.ui.render()
+            if assigned_cables:
+                info_text = "\n".join([
+                    info_text,
+                    "",
+                    "[bold magenta]Recently assigned:[/bold magenta]",
+                    *(f"  • {cable}" for cable in assigned_cables[-5:]),  # Show last 5
+                ])
+
+            if banner:
+                info_text = f"{banner}\n\n{info_text}"
+                banner = None
+
+            body.update(Panel(info_text, title="Assign Cables to Customer"))
+            footer.update(Panel(
+                "[cyan]Scan or enter serial number (or 'q' to finish)[/cyan]",
+                title="Cable Assignment"
+            ))
+            self.ui.render()
 
-        result = db.assign_cable_to_customer(serial_input, customer_gid)
+            # Use shared scanner method
+            serial_input = self.ui.get_serial_number_scan_or_manual()
 
-        if result.get('success'):
-            # Successfully assigned
-            assigned_serial = result['serial_number']
-            assigned_cables.append(assigned_serial)
-
-            # Update context with new assigned cables list
-            new_context = self.context.copy()
-            new_context["assigned_cables"] = assigned_cables
+            if not serial_input or serial_input.lower() == 'q':
+                return ScreenResult(NavigationAction.POP, pop_to=_assign_pop_target(self.context))
 
-            # Show success message briefly
-            self.ui.layout["body"].update(Panel(
-                f"[bold green]✅ Cable {assigned_serial} assigned to {customer_name}![/bold green]",
-                title="Success"
+            # Assign the cable to the customer
+            body.update(Panel(
+                f"[yellow]Assigning cable {serial_input} to {customer_name}...[/yellow]",
+                title="Assign Cables to Customer"
             ))
             self.ui.render()
 
-            # Continue to next scan
-            return ScreenResult(NavigationAction.REPLACE, AssignCablesScreen, new_context)
+            result = db.assign_cable_to_customer(serial_input, customer_gid, conn=conn)
+
+            if result.get('success'):
+                # Successfully assigned
+                assigned_serial = result['serial_number']
+                assigned_cables.append(assigned_serial)
+                total_cables += 1
+                banner = f"[bold green]✅ Cable {assigned_serial} assigned to {customer_name}![/bold green]"
+
+                # Continue to next scan
+                continue
 
-        else:
             # Error occurred
             error_type = result.get('error')
             error_msg = result.get('message')
@@ -1140,13 +1234,13 @@ class AssignCablesScreen(Screen):
             if error_type == 'not_found':
                 error_display = f"[red]❌ Cable not found[/red]\n\n{error_msg}"
 
-                self.ui.layout["body"].update(Panel(error_display, title="Cable Assignment"))
-                self.ui.layout["footer"].update(Panel("", title=""))
+                body.update(Panel(error_display, title="Cable Assignment"))
+                footer.update(Panel("", title=""))
                 self.ui.render()
                 time.sleep(ERROR_DISPLAY_SEC)
 
                 # Continue scanning
-                return ScreenResult(NavigationAction.REPLACE, AssignCablesScreen, self.context)
+                continue
 
             elif error_type == 'already_assigned':
                 # Cable is already assigned - ask if user wants to reassign
@@ -1156,11 +1250,8 @@ class AssignCablesScreen(Screen):
                 existing_customer_name = "another customer"
                 try:
                     if existing_gid and existing_gid != 'unknown':
-                        customer_numeric_id = existing_gid.split('/')[-1]
-                        existing_customer = shopify_client.get_customer_by_id(customer_numeric_id)
-                        if existing_customer:
-                            existing_customer_name = existing_customer.get('displayName') or "another customer"
-                except:
+                        existing_customer_name = shopify_client.get_customer_display_name(existing_gid) or "another customer"
+                except Exception:
                     pass  # If we can't get the customer, just use "another customer"
 
                 reassign_prompt = f"""[yellow]⚠️  Cable Already Assigned[/yellow]
@@ -1170,67 +1261,51 @@ Cable [bold]{serial_input}[/bold] is currently assigned to:
 
 Do you want to reassign it to [bold green]{customer_name}[/bold green]?"""
 
-                self.ui.layout["body"].update(Panel(reassign_prompt, title="Cable Already Assigned"))
-                self.ui.layout["footer"].update(Panel(
+                body.update(Panel(reassign_prompt, title="Cable Already Assigned"))
+                footer.update(Panel(
                     "[green]y[/green] = Reassign to this customer | [cyan]n[/cyan] = Skip | [yellow]q[/yellow] = Quit assignment",
                     title="Reassign?"
                 ))
                 self.ui.render()
 
-                try:
-                    choice = self.ui.console.input("").strip().lower()
-                except KeyboardInterrupt:
+                choice = self.ui.safe_input("", lower=True)
+                if choice is None:
                     return ScreenResult(NavigationAction.POP, pop_to=_assign_pop_target(self.context))
 
                 if choice == 'y' or choice == 'yes':
                     # Force reassignment
-                    self.ui.layout["body"].update(Panel(
+                    body.update(Panel(
                         f"[yellow]Reassigning cable {serial_input}...[/yellow]",
                         title="Reassigning Cable"
                     ))
                     self.ui.render()
 
-                    reassign_result = db.force_reassign_cable(serial_input, customer_gid)
+                    reassign_result = db.force_reassign_cable(serial_input, customer_gid, conn=conn)
 
                     if reassign_result.get('success'):
                         assigned_serial = reassign_result['serial_number']
                         assigned_cables.append(assigned_serial)
-
-                        new_context = self.context.copy()
-                        new_context["assigned_cables"] = assigned_cables
-
-                        self.ui.layout["body"].update(Panel(
-                            f"[bold green]✅ Cable {assigned_serial} reassigned to {customer_name}![/bold green]",
-                            title="Success"
-                        ))
-                        self.ui.render()
-                        time.sleep(1)
-
-                        return ScreenResult(NavigationAction.REPLACE, AssignCablesScreen, new_context)
+                        if existing_gid != customer_gid:
+                            total_cables += 1
+                        banner = f"[bold green]✅ Cable {assigned_serial} reassigned to {customer_name}![/bold green]"
                     else:
-                        self.ui.layout["body"].update(Panel(
+                        body.update(Panel(
                             f"[red]❌ Error reassigning cable: {reassign_result.get('message', 'Unknown error')}[/red]",
                             title="Error"
                         ))
                         self.ui.render()
                         time.sleep(ERROR_DISPLAY_SEC)
 
-                        return ScreenResult(NavigationAction.REPLACE, AssignCablesScreen, self.context)
-
                 elif choice == 'q':
                     # Quit assignment and go back to main hub
                     return ScreenResult(NavigationAction.POP, pop_to=_assign_pop_target(self.context))
-                else:
-                    # Skip this cable, continue scanning
-                    return ScreenResult(NavigationAction.REPLACE, AssignCablesScreen, self.context)
+
+                # Otherwise skip this cable and continue scanning
 
             else:
                 error_display = f"[red]❌ Error[/red]\n\n{error_msg}"
 
-                self.ui.layout["body"].update(Panel(error_display, title="Cable Assignment"))
-                self.ui.layout["footer"].update(Panel("", title=""))
+                body.update(Panel(error_display, title="Cable Assignment"))
+                footer.update(Panel("", title=""))
                 self.ui.render()
                 time.sleep(ERROR_DISPLAY_SEC)
-
-                # Continue scanning
-                return ScreenResult(NavigationAction.REPLACE, AssignCablesScreen, self.context)
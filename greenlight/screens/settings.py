@@ -1,7 +1,5 @@
-import time
 import logging
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
 
 from greenlight.screen_manager import Screen, ScreenResult, NavigationAction
@@ -10,72 +8,61 @@ logger = logging.getLogger(__name__)
 
 
 class SettingsScreen(Screen):
+    MENU_ITEMS = [
+        "Database Settings",
+        "User Management",
+        "System Information",
+        "Back (q)"
+    ]
+
+    # The menu never changes, so its panels are built (and the footer's
+    # markup parsed) once rather than on every render
+    BODY_PANEL = Panel("Configure system settings and preferences", title="Settings")
+    FOOTER_PANEL = Panel(
+        Text.from_markup("\n".join(f"[green]{i + 1}.[/green] {name}" for i, name in enumerate(MENU_ITEMS))),
+        title="Available Settings"
+    )
+
+    # Sections that aren't built yet: choice -> (title, placeholder text)
+    PLACEHOLDERS = {
+        "1": ("Database Settings", "Database settings functionality coming soon"),
+        "2": ("User Management", "User management functionality coming soon"),
+        "3": ("System Information", "System information functionality coming soon"),
+    }
+
     def run(self) -> ScreenResult:
         operator = self.context.get("operator", "")
-        menu_items = [
-            "Database Settings",
-            "User Management",
-            "System Information",
-            "Back (q)"
-        ]
-
-        rows = [
-            f"[green]{i + 1}.[/green] {name}"
-            for i, name in enumerate(menu_items)
-        ]
 
         self.ui.header(operator)
-        self.ui.layout["body"].update(Panel("Configure system settings and preferences", title="Settings"))
-        self.ui.layout["footer"].update(Panel("\n".join(rows), title="Available Settings"))
-        self.ui.render()
+        self.ui.layout["body"].update(self.BODY_PANEL)
+        self.ui.layout["footer"].update(self.FOOTER_PANEL)
 
-        choice = self.ui.console.input("Choose: ")
-        if choice == "1":
-            return ScreenResult(NavigationAction.PUSH, DatabaseSettingsScreen, self.context)
-        elif choice == "2":
-            return ScreenResult(NavigationAction.PUSH, UserManagementScreen, self.context)
-        elif choice == "3":
-            return ScreenResult(NavigationAction.PUSH, SystemInfoScreen, self.context)
-        elif choice in ["4", "q"]:
-            return ScreenResult(NavigationAction.POP)
-        else:
-            return ScreenResult(NavigationAction.REPLACE, SettingsScreen, self.context)
+        # Panels are set once; an invalid choice only repaints and re-prompts
+        # rather than replacing the whole screen.
+        while True:
+            self.ui.render()
+            choice = self.ui.console.input("Choose: ").strip().lower()
+            if choice in self.PLACEHOLDERS:
+                ctx = self.context.copy()
+                ctx["placeholder"] = self.PLACEHOLDERS[choice]
+                return ScreenResult(NavigationAction.PUSH, PlaceholderScreen, ctx)
+            elif choice in ["4", "q"]:
+                return ScreenResult(NavigationAction.POP)
 
 
-class DatabaseSettingsScreen(Screen):
-    def run(self) -> ScreenResult:
-        operator = self.context.get("operator", "")
-        
-        self.ui.header(operator)
-        self.ui.layout["body"].update(Panel("Database settings functionality coming soon", title="Database Settings"))
-        self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
-        self.ui.render()
-
-        self.ui.wait_back()
-        return ScreenResult(NavigationAction.POP)
+class PlaceholderScreen(Screen):
+    """Stand-in for a settings section that isn't implemented yet.
 
+    Shows context["placeholder"] = (title, text) until 'q'.
+    """
 
-
-class UserManagementScreen(Screen):
     def run(self) -> ScreenResult:
         operator = self.context.get("operator", "")
-        
-        self.ui.header(operator)
-        self.ui.layout["body"].update(Panel("User management functionality coming soon", title="User Management"))
-        self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
-        self.ui.render()
+        title, text = self.context["placeholder"]
 
-        self.ui.wait_back()
-        return ScreenResult(NavigationAction.POP)
-
-
-class SystemInfoScreen(Screen):
-    def run(self) -> ScreenResult:
-        operator = self.context.get("operator", "")
-        
         self.ui.header(operator)
-        self.ui.layout["body"].update(Panel("System information functionality coming soon", title="System Information"))
-        self.ui.layout["footer"].update(Panel("[green]q.[/green] Back", title=""))
+        self.ui.layout["body"].update(Panel(text, title=title))
+        self.ui.back_footer()
         self.ui.render()
 
         self.ui.wait_back()
@@ -9,6 +9,7 @@ import logging
 from rich.panel import Panel
 
 from greenlight.screen_manager import Screen, ScreenResult, NavigationAction
+from greenlight.hardware.interfaces import hardware_manager
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +19,8 @@ class ShopifyScanModeScreen(Screen):
 
     def enter(self):
         """Set scanner idle and pause Greenlight scan processing"""
-        from greenlight.hardware.interfaces import hardware_manager
         scanner = hardware_manager.scanner
-        if scanner and hasattr(scanner, 'set_scanning_active'):
+        if scanner:
             scanner.set_scanning_active(False)
             scanner.pause()
             logger.info("Shopify scan mode: status idle, Greenlight paused")
@@ -49,9 +49,8 @@ class ShopifyScanModeScreen(Screen):
 
     def exit(self):
         """Set scanner active and resume Greenlight scan processing"""
-        from greenlight.hardware.interfaces import hardware_manager
         scanner = hardware_manager.scanner
-        if scanner and hasattr(scanner, 'set_scanning_active'):
+        if scanner:
             scanner.set_scanning_active(True)
             scanner.resume()
             logger.info("Shopify scan mode ended: status scanning, Greenlight resumed")
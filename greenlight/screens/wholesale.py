@@ -5,7 +5,9 @@ Allows operator to scan cables going to wholesale/reseller,
 generate registration codes, and print registration labels.
 """
 
+import sys
 import time
+import select
 import logging
 
 from rich.panel import Panel
@@ -14,43 +16,110 @@ from rich.table import Table
 from greenlight.screen_manager import Screen, ScreenResult, NavigationAction
 from greenlight.db import get_audio_cable, format_serial_number, batch_assign_registration_codes
 from greenlight.registration import generate_registration_url
+from greenlight.hardware.barcode_scanner import get_scanner
+from greenlight.hardware.interfaces import hardware_manager, PrintJob
+from greenlight.shopify_client import sync_inventory_for_cable
 
 logger = logging.getLogger(__name__)
 
+# Lines arriving this soon after an accepted line are the tail of a scanner
+# burst (several codes in view of a keyboard-wedge scanner), not new scans.
+SCAN_BLANK_SEC = 0.25
+
+
+def _drain_stdin_burst():
+    """Discard stdin lines that arrive within SCAN_BLANK_SEC of an accepted one.
+
+    Runs straight after the read, before any lookup or render, so the
+    window isn't used up by slow redraws and an error prompt can't take
+    a burst line as its Enter.
+    """
+    deadline = time.monotonic() + SCAN_BLANK_SEC
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or sys.stdin not in select.select([sys.stdin], [], [], remaining)[0]:
+            return
+        if not sys.stdin.readline():
+            return
+
+
+def _normalize_scan(text):
+    """Uppercase a scanned/typed serial, dropping any non-ASCII noise.
+
+    Serials are plain ASCII; stray bytes from HID framing glitches are
+    scrubbed rather than passed on to the DB lookup.
+    """
+    return text.strip().encode('ascii', 'ignore').decode('ascii').upper()
+
 
 class WholesaleBatchScreen(Screen):
     """Scan cables for wholesale, generate registration codes, print labels"""
 
+    def enter(self):
+        """Bring the scanner up for the life of the screen"""
+        self.scanner = get_scanner()
+        self._ensure_scanner()
+
+    def _ensure_scanner(self):
+        """Start the scanner, re-initializing it if it never came up or dropped.
+
+        Checked before every input, so an MQTT broker that was down when
+        the screen opened, or an evdev scanner that went to sleep mid-batch,
+        is picked up again without leaving the screen.
+        """
+        scanner = self.scanner
+        lost = getattr(scanner, 'device_lost', False)
+        if lost:
+            # The read thread exited with the device; reopen it
+            scanner.stop_scanning()
+        if lost or not scanner.is_connected():
+            self.scanner_available = scanner.initialize()
+        else:
+            self.scanner_available = True
+        if self.scanner_available:
+            scanner.start_scanning()
+
+    def exit(self):
+        """Stop the scanner thread started in enter()"""
+        if self.scanner_available:
+            self.scanner.stop_scanning()
+
     def run(self) -> ScreenResult:
         operator = self.context.get("operator", "")
 
-        # Batch: list of cable records to process
-        batch = []
-        batch_serials = set()  # For fast duplicate check
+        # Batch: serial number -> cable record, in scan order. Keyed so the
+        # duplicate check and the per-result lookups are both O(1).
+        batch = {}
 
-        while True:
-            self.ui.console.clear()
-            self.ui.header(operator)
+        # The batch table lives for the whole screen; each accepted scan
+        # appends its one row instead of the table being rebuilt per frame.
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("#", style="dim", width=4)
+        table.add_column("Serial", style="cyan", width=12)
+        table.add_column("SKU", style="green", width=12)
+        table.add_column("Cable", width=30)
 
-            # Build batch table
-            if batch:
-                table = Table(show_header=True, header_style="bold magenta")
-                table.add_column("#", style="dim", width=4)
-                table.add_column("Serial", style="cyan", width=12)
-                table.add_column("SKU", style="green", width=12)
-                table.add_column("Cable", width=30)
-
-                for i, cable in enumerate(batch, 1):
-                    # `or ''` covers both missing keys and explicit None
-                    # (pattern_name is None for MISC/LTD variants).
-                    name = cable.get('series') or ''
-                    length = cable.get('length') or ''
-                    if isinstance(length, (int, float)):
-                        length = str(int(length)) if length == int(length) else str(length)
-                    color = cable.get('pattern_name') or ''
-                    cable_name = f"{name} {length}' {color}".strip()
-                    table.add_row(str(i), cable.get('serial_number', ''), cable.get('variant_sku', ''), cable_name)
+        # Header and the two footer variants never change within the screen;
+        # only the body is rebuilt per frame.
+        self.ui.header(operator)
+        empty_footer, batch_footer = (
+            Panel(" | ".join(parts), title="Options", border_style="green")
+            for parts in (
+                [
+                    "[bold green]Scan barcode[/bold green] to add cable",
+                    "[cyan]'q'[/cyan] = Cancel / go back",
+                ],
+                [
+                    "[bold green]Scan barcode[/bold green] to add cable",
+                    "[cyan]'g'[/cyan] = Generate codes",
+                    "[cyan]'p'[/cyan] = Generate codes + print labels",
+                    "[cyan]'q'[/cyan] = Cancel / go back",
+                ],
+            )
+        )
 
+        while True:
+            if batch:
                 body_content = table
             else:
                 body_content = "[dim]No cables scanned yet. Scan a cable barcode to add it to the batch.[/dim]"
@@ -61,19 +130,8 @@ class WholesaleBatchScreen(Screen):
                 subtitle="Scan cables to add to batch"
             ))
 
-            # Footer with available actions
-            footer_parts = [
-                "[bold green]Scan barcode[/bold green] to add cable",
-            ]
-            if batch:
-                footer_parts.append("[cyan]'g'[/cyan] = Generate codes")
-                footer_parts.append("[cyan]'p'[/cyan] = Generate codes + print labels")
-            footer_parts.append("[cyan]'q'[/cyan] = Cancel / go back")
-
-            self.ui.layout["footer"].update(Panel(
-                " | ".join(footer_parts),
-                title="Options", border_style="green"
-            ))
+            # Re-installed every frame since error screens borrow the footer
+            self.ui.layout["footer"].update(batch_footer if batch else empty_footer)
             self.ui.render()
 
             # Get input (scan or command)
@@ -99,7 +157,7 @@ class WholesaleBatchScreen(Screen):
             formatted_serial = format_serial_number(serial_input)
 
             # Check for duplicate in current batch
-            if formatted_serial in batch_serials:
+            if formatted_serial in batch:
                 self._show_error(operator, f"Cable {formatted_serial} is already in this batch")
                 continue
 
@@ -119,46 +177,53 @@ class WholesaleBatchScreen(Screen):
                 continue
 
             # Add to batch
-            batch.append(cable_record)
-            batch_serials.add(formatted_serial)
+            batch[formatted_serial] = cable_record
+            table.add_row(*self._batch_row(len(batch), cable_record))
+
+    def _batch_row(self, index, cable):
+        """Cells for one cable in the batch table."""
+        # `or ''` covers both missing keys and explicit None
+        # (pattern_name is None for MISC/LTD variants).
+        name = cable.get('series') or ''
+        length = cable.get('length') or ''
+        if isinstance(length, (int, float)):
+            length = str(int(length)) if length == int(length) else str(length)
+        color = cable.get('pattern_name') or ''
+        cable_name = f"{name} {length}' {color}".strip()
+        return str(index), cable.get('serial_number', ''), cable.get('variant_sku', ''), cable_name
 
     def _get_input(self):
         """Get serial number via barcode scanner or manual keyboard input"""
-        from greenlight.hardware.barcode_scanner import get_scanner
-        import select
-        import sys
-
-        scanner = get_scanner()
-
-        scanner_available = False
-        if scanner.initialize():
-            scanner.start_scanning()
+        self._ensure_scanner()
+        scanner = self.scanner
+        scanner_available = self.scanner_available
+        if scanner_available:
+            # Scans that arrived while the last result was on screen are stale
             scanner.clear_queue()
-            scanner_available = True
 
         try:
+            watched = [sys.stdin, scanner] if scanner_available else [sys.stdin]
             while True:
+                # Take anything already queued before blocking
                 if scanner_available:
-                    barcode = scanner.get_scan(timeout=0.1)
+                    barcode = scanner.get_scan(timeout=0)
                     if barcode:
-                        return barcode.strip().upper()
+                        return _normalize_scan(barcode)
 
-                if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                    line = sys.stdin.readline().strip().upper()
+                # Block until a scan is queued or a line is typed; the
+                # scanner's wakeup pipe is selectable next to stdin.
+                ready = select.select(watched, [], [])[0]
+
+                if sys.stdin in ready:
+                    line = _normalize_scan(sys.stdin.readline())
                     if line:
+                        _drain_stdin_burst()
                         return line
-
-                time.sleep(0.1)
         except KeyboardInterrupt:
             return None
-        finally:
-            if scanner_available:
-                scanner.stop_scanning()
 
     def _show_error(self, operator, message):
         """Show an error message briefly"""
-        self.ui.console.clear()
-        self.ui.header(operator)
         self.ui.layout["body"].update(Panel(
             f"[bold red]{message}[/bold red]",
             title="Error", style="red"
@@ -175,17 +240,15 @@ class WholesaleBatchScreen(Screen):
 
         Args:
             operator: Operator ID
-            batch: List of cable records
+            batch: Dict of serial number -> cable record, in scan order
             print_labels: If True, print registration labels after generating codes
 
         Returns:
             ScreenResult to navigate after completion
         """
-        serial_numbers = [c['serial_number'] for c in batch]
+        serial_numbers = list(batch)
 
         # Show progress
-        self.ui.console.clear()
-        self.ui.header(operator)
         self.ui.layout["body"].update(Panel(
             f"Generating registration codes for {len(serial_numbers)} cables...",
             title="Processing", style="blue"
@@ -204,7 +267,6 @@ class WholesaleBatchScreen(Screen):
         printer_available = False
         label_printer = None
         if print_labels:
-            from greenlight.hardware.interfaces import hardware_manager, PrintJob
             label_printer = hardware_manager.get_label_printer()
             printer_available = label_printer and label_printer.is_ready() if label_printer else False
 
@@ -212,48 +274,40 @@ class WholesaleBatchScreen(Screen):
         results_list = result.get('results', [])
         errors_list = result.get('errors', [])
 
-        for i, code_result in enumerate(results_list):
-            serial = code_result['serial_number']
-            reg_code = code_result['registration_code']
+        if printer_available and results_list:
+            label_data_list = []
+            for code_result in results_list:
+                serial = code_result['serial_number']
+                reg_code = code_result['registration_code']
 
-            # Find cable record for SKU
-            cable_record = next((c for c in batch if c['serial_number'] == serial), {})
-            sku = cable_record.get('sku', '')
-            reg_url = generate_registration_url(reg_code)
+                # Find cable record for SKU
+                cable_record = batch.get(serial, {})
+                label_data_list.append({
+                    'registration_code': reg_code,
+                    'registration_url': generate_registration_url(reg_code),
+                    'serial_number': serial,
+                    'sku': cable_record.get('sku', ''),
+                })
 
-            # Update progress
             self.ui.layout["body"].update(Panel(
-                f"Processing {i + 1}/{len(results_list)}...\n\n"
-                f"Serial: {serial}\n"
-                f"Code: {reg_code}",
-                title="Generating + Printing" if printer_available else "Generating Codes", style="blue"
+                f"Printing {len(label_data_list)} registration labels...",
+                title="Generating + Printing", style="blue"
             ))
             self.ui.render()
 
-            if printer_available:
-                label_data = {
-                    'registration_code': reg_code,
-                    'registration_url': reg_url,
-                    'serial_number': serial,
-                    'sku': sku,
-                }
-                print_job = PrintJob(
-                    template="registration_label",
-                    data=label_data,
-                    quantity=1
-                )
-                if label_printer.print_labels(print_job):
-                    printed_count += 1
-                time.sleep(0.3)  # Brief pause between prints
+            # All labels go to the printer as one job; it queues them itself,
+            # so there's no per-label connection or pause between prints.
+            print_job = PrintJob(template="registration_label", data=label_data_list)
+            if label_printer.print_labels(print_job):
+                printed_count = len(label_data_list)
 
         # Now that these cables are allocated to wholesale (registration_code set),
         # push Shopify inventory down so they aren't also sold via the retail store.
         # Dedupe by variant SKU — one absolute set per SKU is enough (idempotent).
-        from greenlight.shopify_client import sync_inventory_for_cable
         synced_skus = set()
         coded_serials = {r['serial_number'] for r in results_list}
-        for cable in batch:
-            if cable['serial_number'] not in coded_serials:
+        for serial, cable in batch.items():
+            if serial not in coded_serials:
                 continue
             variant_sku = cable.get('variant_sku') or cable.get('sku_group')
             if not variant_sku or variant_sku in synced_skus:
@@ -264,8 +318,6 @@ class WholesaleBatchScreen(Screen):
                 logger.warning("Shopify inventory sync failed for %s: %s", variant_sku, err)
 
         # Show summary
-        self.ui.console.clear()
-        self.ui.header(operator)
 
         summary_table = Table(show_header=True, header_style="bold magenta")
         summary_table.add_column("Serial", style="cyan", width=12)
@@ -275,7 +327,7 @@ class WholesaleBatchScreen(Screen):
         for code_result in results_list:
             serial = code_result['serial_number']
             reg_code = code_result['registration_code']
-            cable_record = next((c for c in batch if c['serial_number'] == serial), {})
+            cable_record = batch.get(serial, {})
             sku = cable_record.get('sku', '')
             summary_table.add_row(serial, reg_code, sku)
 
@@ -298,10 +350,7 @@ class WholesaleBatchScreen(Screen):
             subtitle=f"{print_status}{error_text}",
             style="green"
         ))
-        self.ui.layout["footer"].update(Panel(
-            "[green]q.[/green] Back",
-            title=""
-        ))
+        self.ui.back_footer()
         self.ui.render()
 
         try:
@@ -9,20 +9,45 @@ import logging
 from rich.panel import Panel
 
 from greenlight.screen_manager import Screen, ScreenResult, NavigationAction
+from greenlight.shopify_client import get_product_by_sku, ShopifyConnectionError
+from greenlight.hardware.interfaces import hardware_manager, PrintJob
 
 logger = logging.getLogger(__name__)
 
 
+# SKU -> product from get_product_by_sku, for the life of the process
+_product_cache = {}
+
+
+def _lookup_sku_cached(sku):
+    """get_product_by_sku, memoized for the life of the process.
+
+    Operators re-enter the same SKU for reprints and follow-up batches, so
+    repeats skip the Shopify round-trip. Only found products are cached:
+    get_product_by_sku also returns None for throttling and other transient
+    errors, so a miss is always asked again. 'r' at the SKU prompt clears
+    the cache after a product is edited.
+    """
+    product = _product_cache.get(sku)
+    if product is None:
+        product = get_product_by_sku(sku)
+        if product is None:
+            return None
+        _product_cache[sku] = product
+    return dict(product)
+
+
 class WireLabelScreen(Screen):
     """Screen for printing Sundial Wire product labels"""
 
     def run(self) -> ScreenResult:
         operator = self.context.get("operator", "")
 
+        # The header doesn't change while this screen is up
+        self.ui.header(operator)
+
         while True:
             # Show prompt for SKU entry
-            self.ui.console.clear()
-            self.ui.header(operator)
             self.ui.layout["body"].update(Panel(
                 "[bold cyan]Wire Label Printer[/bold cyan]\n\n"
                 "Enter a Sundial Wire SKU to look up the product\n"
@@ -31,7 +56,7 @@ class WireLabelScreen(Screen):
                 title="Sundial Wire Labels"
             ))
             self.ui.layout["footer"].update(Panel(
-                "Enter SKU or [cyan]'q'[/cyan] to go back",
+                "Enter SKU | [cyan]'r'[/cyan] = refresh product cache | [cyan]'q'[/cyan] to go back",
                 title="Wire Label", border_style="green"
             ))
             self.ui.render()
@@ -43,13 +68,15 @@ class WireLabelScreen(Screen):
 
             if not sku_input or sku_input.lower() == 'q':
                 return ScreenResult(NavigationAction.POP)
+            if sku_input.lower() == 'r':
+                _product_cache.clear()
+                logger.info("Wire product lookup cache cleared")
+                continue
 
             # Normalize SKU to uppercase
             sku = sku_input.upper()
 
             # Look up SKU in Shopify
-            self.ui.console.clear()
-            self.ui.header(operator)
             self.ui.layout["body"].update(Panel(
                 f"Looking up SKU: [bold]{sku}[/bold]...",
                 title="Searching Shopify"
@@ -57,14 +84,11 @@ class WireLabelScreen(Screen):
             self.ui.layout["footer"].update(Panel("Please wait...", title=""))
             self.ui.render()
 
-            from greenlight.shopify_client import get_product_by_sku, ShopifyConnectionError
             try:
-                product = get_product_by_sku(sku)
+                product = _lookup_sku_cached(sku)
             except ShopifyConnectionError as e:
                 # Auth/connection failure — NOT a missing SKU. Surface it
                 # distinctly so the operator checks credentials, not the SKU.
-                self.ui.console.clear()
-                self.ui.header(operator)
                 self.ui.layout["body"].update(Panel(
                     "[bold red]Can't reach Shopify[/bold red]\n\n"
                     "The Sundial Wire store could not be reached or authenticated, "
@@ -86,8 +110,6 @@ class WireLabelScreen(Screen):
 
             if not product:
                 # SKU not found
-                self.ui.console.clear()
-                self.ui.header(operator)
                 self.ui.layout["body"].update(Panel(
                     f"[bold red]SKU not found:[/bold red] {sku}\n\n"
                     "This SKU was not found in Shopify.\n"
@@ -118,8 +140,6 @@ class WireLabelScreen(Screen):
             if variant_title and variant_title != "Default Title":
                 display_title = f"{product_title} - {variant_title}"
 
-            self.ui.console.clear()
-            self.ui.header(operator)
             self.ui.layout["body"].update(Panel(
                 f"[bold green]Product Found[/bold green]\n\n"
                 f"[bold]Title:[/bold] {display_title}\n"
@@ -176,12 +196,8 @@ class WireLabelScreen(Screen):
                     quantity = 1
 
             # Print labels
-            from greenlight.hardware.interfaces import hardware_manager, PrintJob
-
             label_printer = hardware_manager.get_label_printer()
             if not label_printer:
-                self.ui.console.clear()
-                self.ui.header(operator)
                 self.ui.layout["body"].update(Panel(
                     "[bold red]No label printer available[/bold red]\n\n"
                     "Check printer connection and try again.",
@@ -217,8 +233,6 @@ class WireLabelScreen(Screen):
                     'product_url': product_url,
                 }
 
-            self.ui.console.clear()
-            self.ui.header(operator)
             self.ui.layout["body"].update(Panel(
                 f"Printing {quantity} label(s)...\n\n"
                 f"{label_title}\n"
@@ -228,22 +242,16 @@ class WireLabelScreen(Screen):
             self.ui.layout["footer"].update(Panel("Please wait...", title=""))
             self.ui.render()
 
-            all_success = True
-            for i in range(quantity):
-                print_job = PrintJob(
-                    template=template,
-                    data=label_data,
-                    quantity=1
-                )
-                success = label_printer.print_labels(print_job)
-                if not success:
-                    all_success = False
-                    break
+            # One job; the printer repeats the label itself
+            print_job = PrintJob(
+                template=template,
+                data=label_data,
+                quantity=quantity
+            )
+            success = label_printer.print_labels(print_job)
 
             # Show result
-            self.ui.console.clear()
-            self.ui.header(operator)
-            if all_success:
+            if success:
                 self.ui.layout["body"].update(Panel(
                     f"[bold green]Printed {quantity} label(s)[/bold green]\n\n"
                     f"{label_title}\n"
@@ -5,6 +5,7 @@ Shopify API integration for customer lookup, order information, and inventory ma
 import os
 import json
 import logging
+import time
 import shopify
 import requests
 import yaml
@@ -54,6 +55,16 @@ SHOPIFY_WIRE_CLIENT_SECRET = os.getenv("SHOPIFY_WIRE_CLIENT_SECRET")
 _cached_location_id: Optional[str] = None
 _cached_publication_ids: Optional[list] = None
 _inventory_item_cache: Dict[str, str] = {}
+_customer_name_cache: Dict[str, str] = {}
+
+# Customer search results are reused for this long; an operator re-running
+# the same lookup (new search, back, wrong pick) shouldn't cost a query.
+CUSTOMER_SEARCH_TTL = 300.0
+_customer_search_cache: Dict[Tuple[str, int], Tuple[float, list]] = {}
+
+# Token exchanges run on the UI thread; an unresponsive endpoint must fail
+# fast instead of freezing the screen with no way out.
+TOKEN_REQUEST_TIMEOUT = 10.0
 
 
 def get_access_token_from_client_credentials() -> Optional[str]:
@@ -79,7 +90,7 @@ def get_access_token_from_client_credentials() -> Optional[str]:
     }
 
     try:
-        response = requests.post(token_url, json=payload)
+        response = requests.post(token_url, json=payload, timeout=TOKEN_REQUEST_TIMEOUT)
         response.raise_for_status()
 
         data = response.json()
@@ -200,7 +211,7 @@ def _get_wire_access_token() -> Optional[str]:
         "grant_type": "client_credentials"
     }
     try:
-        response = requests.post(token_url, json=payload)
+        response = requests.post(token_url, json=payload, timeout=TOKEN_REQUEST_TIMEOUT)
         response.raise_for_status()
         data = response.json()
         access_token = data.get("access_token")
@@ -366,6 +377,8 @@ def get_customer_by_id(customer_id: str) -> Optional[Dict[str, Any]]:
             return None
 
         customer = data.get("data", {}).get("customer")
+        if customer:
+            _remember_customer_names([customer])
         return customer
 
     except Exception as e:
@@ -379,6 +392,12 @@ def search_customers_by_name(name: str, limit: int = 100) -> list[Dict[str, Any]
     """
     Search for customers by name (first name, last name, or display name)
 
+    Only the fields shown by the customer search results and detail screens
+    are selected; use get_customer_by_id() for the full record. Searches
+    that find someone are cached for CUSTOMER_SEARCH_TTL seconds, keyed on
+    the case-folded name; a miss is never cached, so a customer created in
+    Shopify right after shows up on the next search.
+
     Args:
         name: Customer name to search for (partial match supported)
         limit: Maximum number of results to return (default 100)
@@ -386,6 +405,11 @@ def search_customers_by_name(name: str, limit: int = 100) -> list[Dict[str, Any]
     Returns:
         List of customer dictionaries matching the search
     """
+    cache_key = (name.strip().casefold(), limit)
+    cached = _customer_search_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return list(cached[1])
+
     try:
         session = get_shopify_session()
 
@@ -396,23 +420,13 @@ def search_customers_by_name(name: str, limit: int = 100) -> list[Dict[str, Any]
                 edges {
                     node {
                         id
-                        firstName
-                        lastName
                         email
                         phone
                         displayName
-                        createdAt
-                        updatedAt
                         numberOfOrders
-                        tags
-                        note
                         defaultAddress {
-                            address1
-                            address2
                             city
                             province
-                            country
-                            zip
                             phone
                         }
                         amountSpent {
@@ -441,7 +455,11 @@ def search_customers_by_name(name: str, limit: int = 100) -> list[Dict[str, Any]
             return []
 
         edges = data.get("data", {}).get("customers", {}).get("edges", [])
-        return [edge["node"] for edge in edges]
+        customers = [edge["node"] for edge in edges]
+        _remember_customer_names(customers)
+        if customers:
+            _customer_search_cache[cache_key] = (time.monotonic() + CUSTOMER_SEARCH_TTL, customers)
+        return list(customers)
 
     except Exception as e:
         logger.error("Error searching customers by name: %s", e)
@@ -514,6 +532,7 @@ def get_customer_by_email(email: str) -> Optional[Dict[str, Any]]:
 
         edges = data.get("data", {}).get("customers", {}).get("edges", [])
         if edges:
+            _remember_customer_names([edges[0]["node"]])
             return edges[0]["node"]
 
         return None
@@ -525,17 +544,73 @@ def get_customer_by_email(email: str) -> Optional[Dict[str, Any]]:
         close_shopify_session()
 
 
-def get_customer_orders(customer_id: str, limit: int = 10) -> list[Dict[str, Any]]:
+def _remember_customer_names(customers: list[Dict[str, Any]]) -> None:
+    """Record the display names of customers we have already fetched."""
+    for customer in customers:
+        if customer.get("id") and customer.get("displayName"):
+            _customer_name_cache[customer["id"]] = customer["displayName"]
+
+
+def get_customer_display_name(customer_id: str) -> Optional[str]:
+    """
+    Get a customer's display name, preferring names already seen this session
+
+    Every customer returned by the lookup functions above is remembered, so
+    naming the current owner of a scanned cable usually needs no extra
+    GraphQL request.
+
+    Args:
+        customer_id: Either numeric ID or GID
+
+    Returns:
+        The customer's displayName, or None if the customer can't be found
+    """
+    if not customer_id.startswith("gid://"):
+        customer_id = f"gid://shopify/Customer/{customer_id}"
+
+    if customer_id in _customer_name_cache:
+        return _customer_name_cache[customer_id]
+
+    customer = get_customer_by_id(customer_id)
+    if customer:
+        return customer.get("displayName")
+    return None
+
+
+def get_customer_orders(customer_id: str, limit: int = 10, include_line_items: bool = True) -> list[Dict[str, Any]]:
     """
     Get recent orders for a customer
 
     Args:
         customer_id: Customer's Shopify ID (numeric or GID)
         limit: Maximum number of orders to retrieve (default 10)
+        include_line_items: Also fetch each order's line items. Listings that
+            only need the item count can read subtotalLineItemsQuantity and
+            skip them.
 
     Returns:
         List of order dictionaries
     """
+    return get_customer_orders_page(customer_id, limit, include_line_items=include_line_items)["orders"]
+
+
+def get_customer_orders_page(customer_id: str, limit: int = 10, after: Optional[str] = None,
+                             include_line_items: bool = True) -> Dict[str, Any]:
+    """
+    Get one page of a customer's orders, newest first
+
+    Args:
+        customer_id: Customer's Shopify ID (numeric or GID)
+        limit: Orders per page (default 10)
+        after: endCursor of the previous page, or None for the first page
+        include_line_items: Also fetch each order's line items
+
+    Returns:
+        Dictionary with 'orders' (list of order dictionaries), 'endCursor'
+        and 'hasNextPage'. On error the page is empty and also carries an
+        'error' message, so callers can tell it apart from "no more orders".
+    """
+    empty = {"orders": [], "endCursor": None, "hasNextPage": False}
     try:
         session = get_shopify_session()
 
@@ -546,9 +621,13 @@ def get_customer_orders(customer_id: str, limit: int = 10) -> list[Dict[str, Any
             customer_gid = customer_id
 
         query = """
-        query getCustomerOrders($id: ID!, $limit: Int!) {
+        query getCustomerOrders($id: ID!, $limit: Int!, $after: String, $includeLineItems: Boolean!) {
             customer(id: $id) {
-                orders(first: $limit, reverse: true) {
+                orders(first: $limit, after: $after, reverse: true) {
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
                     edges {
                         node {
                             id
@@ -562,7 +641,8 @@ def get_customer_orders(customer_id: str, limit: int = 10) -> list[Dict[str, Any
                                     currencyCode
                                 }
                             }
-                            lineItems(first: 50) {
+                            subtotalLineItemsQuantity
+                            lineItems(first: 50) @include(if: $includeLineItems) {
                                 edges {
                                     node {
                                         title
@@ -582,7 +662,8 @@ def get_customer_orders(customer_id: str, limit: int = 10) -> list[Dict[str, Any
         }
         """
 
-        variables = {"id": customer_gid, "limit": limit}
+        variables = {"id": customer_gid, "limit": limit, "after": after,
+                     "includeLineItems": include_line_items}
         result = shopify.GraphQL().execute(query, variables=variables)
 
         import json
@@ -590,14 +671,92 @@ def get_customer_orders(customer_id: str, limit: int = 10) -> list[Dict[str, Any
 
         if "errors" in data:
             logger.error("GraphQL errors: %s", data['errors'])
-            return []
+            return {**empty, "error": str(data['errors'])}
 
-        orders = data.get("data", {}).get("customer", {}).get("orders", {}).get("edges", [])
-        return [edge["node"] for edge in orders]
+        orders = (data.get("data", {}).get("customer") or {}).get("orders") or {}
+        page_info = orders.get("pageInfo") or {}
+        return {
+            "orders": [edge["node"] for edge in orders.get("edges", [])],
+            "endCursor": page_info.get("endCursor"),
+            "hasNextPage": bool(page_info.get("hasNextPage")),
+        }
 
     except Exception as e:
         logger.error("Error fetching customer orders: %s", e)
-        return []
+        return {**empty, "error": str(e)}
+    finally:
+        close_shopify_session()
+
+
+def get_customer_last_order_preview(customer_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a compact preview of a customer's most recent order
+
+    Selects only what the customer detail screen shows: name, date, statuses,
+    total, and the first 3 line items (plus whether there are more), so the
+    payload stays small compared to get_customer_orders().
+
+    Args:
+        customer_id: Customer's Shopify ID (numeric or GID)
+
+    Returns:
+        Order dictionary (lineItems as {nodes, pageInfo}) or None if the
+        customer has no accessible orders
+    """
+    try:
+        session = get_shopify_session()
+
+        if not customer_id.startswith("gid://"):
+            customer_gid = f"gid://shopify/Customer/{customer_id}"
+        else:
+            customer_gid = customer_id
+
+        query = """
+        query getCustomerLastOrder($id: ID!) {
+            customer(id: $id) {
+                orders(first: 1, reverse: true) {
+                    nodes {
+                        name
+                        createdAt
+                        displayFinancialStatus
+                        displayFulfillmentStatus
+                        totalPriceSet {
+                            shopMoney {
+                                amount
+                            }
+                        }
+                        lineItems(first: 3) {
+                            nodes {
+                                title
+                                quantity
+                            }
+                            pageInfo {
+                                hasNextPage
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        """
+
+        variables = {"id": customer_gid}
+        result = shopify.GraphQL().execute(query, variables=variables)
+
+        import json
+        data = json.loads(result)
+
+        if "errors" in data:
+            logger.error("GraphQL errors: %s", data['errors'])
+            return None
+
+        customer = (data.get("data") or {}).get("customer") or {}
+        orders = (customer.get("orders") or {}).get("nodes") or []
+        return orders[0] if orders else None
+
+    except Exception as e:
+        logger.error("Error fetching customer's last order: %s", e)
+        return None
     finally:
         close_shopify_session()
 
@@ -1,15 +1,36 @@
 from rich.console import Console
 from rich.panel import Panel
+from rich.text import Text
 from rich.layout import Layout
 
-import os
 import sys
 import select
 import time
+import functools
 
 from greenlight import config
 from greenlight.config import APP_NAME
 
+
+@functools.lru_cache(maxsize=16)
+def _header_panel(op_name):
+    """Header banner for an operator name (None when nobody is logged in).
+
+    Every screen sets the header on each visit, but there are only a handful
+    of operators, so each banner is built once per process.
+    """
+    if op_name:
+        return Panel(
+            f"🌿 {APP_NAME} v0.1 - Welcome {op_name}    [yellow]⚠  Shopify scanner paused[/yellow]",
+            style="bold green"
+        )
+    return Panel(f"🌿 {APP_NAME} v0.1", style="bold green")
+
+
+# The plain "q. Back" footer every result/error view ends on; it never changes
+BACK_FOOTER = Panel(Text.from_markup("[green]q.[/green] Back"), title="")
+
+
 class UIBase:
     def __init__(self):
         self.console = Console()
@@ -24,18 +45,24 @@ class UIBase:
 
 
     def header(self, op=""):
-        if config.get_op_name(op):
-            self.layout["header"].update(Panel(
-                f"🌿 {APP_NAME} v0.1 - Welcome {config.get_op_name(op)}    [yellow]⚠  Shopify scanner paused[/yellow]",
-                style="bold green"
-            ))
-        else:
-            self.layout["header"].update(Panel(f"🌿 {APP_NAME} v0.1", style="bold green"))
-        return
+        self.layout["header"].update(_header_panel(config.get_op_name(op)))
+
+    def back_footer(self):
+        self.layout["footer"].update(BACK_FOOTER)
 
     def render(self):
-        self.console.clear()
-        self.console.print(self.layout, end="")
+        """Repaint the full layout.
+
+        This already clears the terminal, so screens should not precede it
+        with their own console.clear() — that costs a second full-screen
+        erase per frame (noticeable over SSH to the Pi).
+
+        The clear and the new frame are buffered and flushed as one write,
+        so the terminal never shows the blank screen between them.
+        """
+        with self.console:
+            self.console.clear()
+            self.console.print(self.layout, end="")
 
     def read_key(self):
         """Read a single keypress and return a normalized token.
@@ -84,6 +111,18 @@ class UIBase:
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old)
 
+    def safe_input(self, prompt="", lower=False):
+        """Read a line of input, stripped (and lowercased if `lower`).
+
+        Returns None when the user cancels with Ctrl-C, so screens can check
+        for that instead of wrapping every prompt in try/except.
+        """
+        try:
+            line = self.console.input(prompt).strip()
+        except KeyboardInterrupt:
+            return None
+        return line.lower() if lower else line
+
     def wait_back(self):
         """Block until the user presses 'q' to go back, no Enter required.
 
@@ -191,7 +230,7 @@ class UIBase:
                     return num
                 elif menu_items[num]["action"] == "quit":
                     return
-            except:
+            except (ValueError, IndexError):
                 self.render()
                 continue
 
@@ -210,13 +249,13 @@ class UIBase:
 
         try:
             # Wait for either a scan or keyboard input
-            start_time = time.time()
-            timeout = 30.0  # 30 second timeout
+            deadline = time.monotonic() + 30.0  # 30 second timeout
+            watched = [sys.stdin, scanner] if scanner_available else [sys.stdin]
 
-            while time.time() - start_time < timeout:
+            while True:
                 # Check for scanned barcode
                 if scanner_available:
-                    barcode = scanner.get_scan(timeout=0.1)
+                    barcode = scanner.get_scan(timeout=0)
                     if barcode:
                         serial_number = barcode.strip().upper()
                         # Show what was scanned by updating the footer
@@ -229,16 +268,21 @@ class UIBase:
                         time.sleep(0.8)  # Brief pause to show what was scanned
                         return serial_number
 
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                # Block until a scan is queued, a line is typed, or we time out
+                ready = select.select(watched, [], [], remaining)[0]
+
                 # Check for manual keyboard input
-                if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
+                if sys.stdin in ready:
                     line = sys.stdin.readline().strip().upper()
                     if line:
                         if line == 'Q':
                             return None
                         return line
 
-                time.sleep(0.05)  # Small sleep to prevent busy-waiting
-
             # Timeout - ask for manual entry
             # Update footer to show timeout message instead of printing
             self.layout["footer"].update(Panel(
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Test wholesale registration code batching.
+
+batch_assign_registration_codes writes every code with one UPDATE and then
+sorts the serials it didn't touch into "already has a code" and "not found"
+with a second lookup. A whole-batch retry covers code collisions. Getting
+any of this wrong either double-codes a cable or prints labels for codes
+that were never saved.
+
+Cases covered:
+  - Mixed batch (new, already coded, missing, duplicate scan) → results /
+    errors split, one code per new cable, existing code left alone
+  - Every attempt collides → all serials reported failed, nothing written
+"""
+
+import sys
+sys.path.insert(0, '/home/welch/projects/sundial_greenlight')
+
+from greenlight import registration
+from greenlight.cable import resolve_catalog_variant
+from greenlight.db import (
+    register_scanned_cable, batch_assign_registration_codes,
+    format_serial_number, pg_pool,
+)
+
+
+TEST_SERIES = "Studio Classic"
+TEST_PATTERN_NAME = "Pearl White"
+TEST_LENGTH_STR = "10"
+TEST_CONNECTOR_DISPLAY = "TS–TS"  # straight
+TEST_OPERATOR = "ADW"
+TEST_SERIALS = ["TESTREG1", "TESTREG2", "TESTREG3"]
+MISSING_SERIAL = "TESTREG9"  # never registered
+
+
+def setup_test_cables():
+    """Register fresh uncoded catalog cables; returns their formatted serials."""
+    resolved = resolve_catalog_variant(
+        TEST_SERIES, TEST_PATTERN_NAME, TEST_LENGTH_STR, TEST_CONNECTOR_DISPLAY,
+    )
+    if not resolved:
+        raise RuntimeError("resolve_catalog_variant returned None")
+    serials = []
+    for serial in TEST_SERIALS:
+        result = register_scanned_cable(
+            serial_number=serial,
+            sku_group=resolved['sku_group'],
+            prefix=resolved['prefix'],
+            length=resolved['length'],
+            connector_code=resolved['connector_code'],
+            operator=TEST_OPERATOR,
+            update_if_exists=True,
+        )
+        if not result.get('success'):
+            raise RuntimeError(f"setup register failed: {result}")
+        serials.append(result['serial_number'])
+
+    # A re-run finds the cables already coded; start them clean
+    conn = pg_pool.getconn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "UPDATE audio_cables SET registration_code = NULL WHERE serial_number = ANY(%s)",
+                (serials,)
+            )
+            conn.commit()
+    finally:
+        pg_pool.putconn(conn)
+    return serials
+
+
+def get_codes(serials):
+    """Current registration_code per serial, straight from the table."""
+    conn = pg_pool.getconn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT serial_number, registration_code FROM audio_cables WHERE serial_number = ANY(%s)",
+                (serials,)
+            )
+            return dict(cur.fetchall())
+    finally:
+        pg_pool.putconn(conn)
+
+
+def test_registration_batch():
+    print("=" * 70)
+    print("Testing Wholesale Registration Code Batching")
+    print("=" * 70)
+
+    new_serial, spare_serial, coded_serial = setup_test_cables()
+    missing_serial = format_serial_number(MISSING_SERIAL)
+    print(f"\nSetup: registered {new_serial}, {spare_serial}, {coded_serial}")
+
+    # Case 1: give one cable a code so the next batch sees it as already coded
+    print("\n1. Code a single cable")
+    print("-" * 70)
+    result = batch_assign_registration_codes([coded_serial])
+    if not result.get('success') or len(result['results']) != 1:
+        print(f"   ❌ Expected one code, got: {result}")
+        return False
+    existing_code = result['results'][0]['registration_code']
+    print(f"   ✅ {coded_serial} coded as {existing_code}")
+
+    # Case 2: new + already coded + missing + duplicate scan of the new one
+    print("\n2. Mixed batch: new, already coded, missing, duplicate")
+    print("-" * 70)
+    result = batch_assign_registration_codes(
+        [new_serial, coded_serial, missing_serial, new_serial]
+    )
+    if result.get('success'):
+        print(f"   ❌ Expected success=False with errors, got: {result}")
+        return False
+    results = result.get('results', [])
+    if [r['serial_number'] for r in results] != [new_serial]:
+        print(f"   ❌ Expected exactly one result for {new_serial}, got: {results}")
+        return False
+    errors = {e['serial_number']: e['error'] for e in result.get('errors', [])}
+    if set(errors) != {coded_serial, missing_serial}:
+        print(f"   ❌ Expected errors for {coded_serial} and {missing_serial}, got: {errors}")
+        return False
+    if errors[coded_serial] != f"Already has code: {existing_code}":
+        print(f"   ❌ Wrong error for {coded_serial}: {errors[coded_serial]}")
+        return False
+    if errors[missing_serial] != "Cable not found":
+        print(f"   ❌ Wrong error for {missing_serial}: {errors[missing_serial]}")
+        return False
+    codes = get_codes([new_serial, coded_serial])
+    if codes.get(new_serial) != results[0]['registration_code']:
+        print(f"   ❌ Stored code {codes.get(new_serial)} != returned {results[0]['registration_code']}")
+        return False
+    if codes.get(coded_serial) != existing_code:
+        print(f"   ❌ {coded_serial} code changed to {codes.get(coded_serial)}")
+        return False
+    print("   ✅ 1 result, already-coded and not-found errors, existing code untouched")
+
+    # Case 3: every generated code collides, so all retries fail
+    print("\n3. Retries exhausted by colliding codes")
+    print("-" * 70)
+    original_generate = registration.generate_registration_code
+    registration.generate_registration_code = lambda: existing_code
+    try:
+        result = batch_assign_registration_codes([spare_serial])
+    finally:
+        registration.generate_registration_code = original_generate
+    if result.get('success') or result.get('results'):
+        print(f"   ❌ Expected failure with no results, got: {result}")
+        return False
+    errors = result.get('errors', [])
+    if [e['serial_number'] for e in errors] != [spare_serial]:
+        print(f"   ❌ Expected one error for {spare_serial}, got: {errors}")
+        return False
+    if get_codes([spare_serial]).get(spare_serial) is not None:
+        print(f"   ❌ {spare_serial} was written despite the failure")
+        return False
+    print(f"   ✅ Reported '{errors[0]['error']}', nothing written")
+
+    print("\n" + "=" * 70)
+    print("✅ ALL REGISTRATION BATCH TESTS PASSED")
+    print("=" * 70)
+    return True
+
+
+def cleanup_test_data():
+    """Remove the test cables. Their registration codes go with them."""
+    conn = pg_pool.getconn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM audio_cables WHERE serial_number LIKE 'TESTREG%'")
+            conn.commit()
+            print("\n🧹 Cleaned up test cables")
+    except Exception as e:
+        print(f"❌ Cleanup error: {e}")
+        conn.rollback()
+    finally:
+        pg_pool.putconn(conn)
+
+
+if __name__ == "__main__":
+    try:
+        success = test_registration_batch()
+        response = input("\nKeep test data in database? (y/n): ").strip().lower()
+        if response != 'y':
+            cleanup_test_data()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n❌ Test failed with exception: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
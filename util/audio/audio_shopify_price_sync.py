@@ -14,6 +14,7 @@ Usage:
 import sys
 import json
 import argparse
+import itertools
 from pathlib import Path
 
 # Add util/ and project root to path
@@ -52,18 +53,19 @@ def build_yaml_sku_map(product_lines_dir=None):
     for prefix, line in lines.items():
         pricing = line.get('pricing', {})
         weight_data = line.get('weight', {})  # may not be present in all lines
-        for length in line['lengths']:
+        for length, pattern, connector in itertools.product(
+            line['lengths'], line['patterns'], line['connectors']
+        ):
             price = pricing.get(length)
             weight = weight_data.get(length)
-            for pattern in line['patterns']:
-                for connector in line['connectors']:
-                    sku = build_sku(prefix, length, pattern['code'], connector.get('code', ''))
-                    cost = get_cost(line, length, connector.get('code', ''))
-                    sku_map[sku] = {
-                        'price': float(price) if price is not None else None,
-                        'cost': float(cost) if cost is not None else None,
-                        'weight': float(weight) if weight is not None else None,
-                    }
+            conn_code = connector.get('code', '')
+            sku = build_sku(prefix, length, pattern['code'], conn_code)
+            cost = get_cost(line, length, conn_code)
+            sku_map[sku] = {
+                'price': float(price) if price is not None else None,
+                'cost': float(cost) if cost is not None else None,
+                'weight': float(weight) if weight is not None else None,
+            }
 
     return sku_map
 